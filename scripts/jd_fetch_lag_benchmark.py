@@ -0,0 +1,151 @@
+"""JD 수집 이벤트 루프 지연(lag) 측정 스크립트
+
+응답이 느린 로컬 HTTP 서버(별도 프로세스)에 JD 페이지 N개를 동시에 요청하면서,
+10ms마다 깨어나는 probe 코루틴으로 이벤트 루프가 얼마나 늦게 깨어나는지(lag)를 측정합니다.
+- blocking: 기존 방식 (코루틴 안에서 trafilatura fetch_url/extract를 직접 호출)
+- async: jd_fetcher.fetch_markdown (httpx 비동기 다운로드 + 워커 스레드 풀에서 본문 추출)
+async 모드에서는 다운로드 중에도 lag가 거의 0에 머물러야 합니다.
+(본문 추출 스레드가 GIL을 점유하는 동안에는 수십 ms 이하의 lag가 생길 수 있으며, JD_EXTRACT_WORKERS로 조절합니다)
+저장소에 테스트 스위트가 없으므로 이 스크립트가 회귀 검사를 겸합니다:
+async 모드의 lag p99가 --max-lag-ms를 넘거나 실패한 수집이 있으면 종료 코드 1로 끝납니다. (blocking 모드는 비교용으로 검사하지 않음)
+
+사용 예시:
+```
+python scripts/jd_fetch_lag_benchmark.py --fetches 50 --server-delay 1.0
+python scripts/jd_fetch_lag_benchmark.py --modes async --fetches 200
+python scripts/jd_fetch_lag_benchmark.py --modes async   # 검사로 사용 (lag p99가 --max-lag-ms를 넘으면 종료 코드 1)
+```
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import socket
+import sys
+import time
+
+import uvicorn
+from fastapi import FastAPI
+from fastapi.responses import HTMLResponse
+from trafilatura import extract, fetch_url
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.agent.modules.jd_fetcher import jd_fetcher
+from src.core.stats import percentile
+
+
+JD_HTML = (
+    "<html><head><title>백엔드 개발자 채용</title></head><body><article><h1>백엔드 개발자</h1>"
+    + "<p>주요 업무: 주문/결제 API 설계 및 운영, 대규모 트래픽 처리. 자격 요건: Python, FastAPI 3년 이상.</p>" * 200
+    + "</article></body></html>"
+)
+
+
+def serve_slow(port: int, delay: float):
+    """delay초 후 JD 페이지를 반환하는 서버를 실행합니다. (자식 프로세스에서 실행)"""
+    app = FastAPI()
+
+    @app.get("/jd/{index}")
+    async def jd(index: str):
+        await asyncio.sleep(delay)
+        return HTMLResponse(JD_HTML.replace("백엔드 개발자", f"백엔드 개발자 {index}"))
+
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning", limit_concurrency=1000)
+
+
+def start_slow_server(port: int, delay: float) -> multiprocessing.Process:
+    """느린 서버를 별도 프로세스로 시작하고 연결을 받을 때까지 기다립니다.
+
+    측정 대상 루프와 분리해야 blocking 모드에서도 서버가 응답할 수 있고,
+    같은 프로세스의 스레드로 실행하면 서버의 응답 처리가 GIL을 점유하여 측정값에 섞입니다.
+    """
+    process = multiprocessing.Process(target=serve_slow, args=(port, delay), daemon=True)
+    process.start()
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            return process
+        except OSError:
+            time.sleep(0.05)
+
+
+async def blocking_fetch(url: str) -> str | None:
+    """기존 JDUrlToMarkdown.execute와 같은 동기 호출 (이벤트 루프를 막음)"""
+    downloaded = fetch_url(url)
+    return extract(downloaded, output_format="markdown", with_metadata=True)
+
+
+async def lag_probe(stop: asyncio.Event, lags: list[float], interval: float = 0.01):
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append((time.perf_counter() - started - interval) * 1000)
+
+
+async def run_mode(mode: str, base_url: str, fetches: int) -> dict:
+    fetch = blocking_fetch if mode == "blocking" else jd_fetcher.fetch_markdown
+    stop, lags = asyncio.Event(), []
+    probe = asyncio.create_task(lag_probe(stop, lags))
+    await asyncio.sleep(0.05)
+
+    started = time.perf_counter()
+    # 모드 별로 다른 URL을 사용하여 같은 URL 요청 병합(single-flight)이 일어나지 않도록 함
+    results = await asyncio.gather(*(fetch(f"{base_url}/jd/{mode}-{index}") for index in range(fetches)))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await probe
+    return {
+        "ok": sum(result is not None for result in results),
+        "wall_s": elapsed,
+        "lag_p50": percentile(lags, 0.5),
+        "lag_p99": percentile(lags, 0.99),
+        "lag_max": round(max(lags), 1) if lags else None,
+        "probes": len(lags),
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="JD fetch event-loop lag benchmark")
+    parser.add_argument("--fetches", type=int, default=50, help="동시에 요청할 JD 페이지 수")
+    parser.add_argument("--server-delay", type=float, default=1.0, help="서버 응답 지연(초)")
+    parser.add_argument("--modes", default="blocking,async", help="측정할 모드 목록 (쉼표 구분)")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--max-lag-ms", type=float, default=250.0, help="async 모드에서 허용할 lag p99(ms). 넘으면 종료 코드 1 (blocking 모드는 초 단위)")
+    args = parser.parse_args()
+
+    server = start_slow_server(args.port, args.server_delay)
+    # client 생성(SSL 컨텍스트 로드)과 trafilatura의 첫 추출(지연 import 등)은 프로세스 당 한 번만 일어나는 비용이므로 측정 전에 미리 실행
+    jd_fetcher.client
+    await jd_fetcher.extract_markdown(JD_HTML)
+    base_url = f"http://127.0.0.1:{args.port}"
+    failures = []
+    try:
+        print(f"{'mode':>8} {'ok':>4} {'wall_s':>7} {'lag_p50_ms':>10} {'lag_p99_ms':>10} {'lag_max_ms':>10} {'probes':>6}")
+        for mode in args.modes.split(","):
+            result = await run_mode(mode, base_url, args.fetches)
+            print(
+                f"{mode:>8} {result['ok']:>4} {result['wall_s']:>7.2f} {result['lag_p50']:>10} "
+                f"{result['lag_p99']:>10} {result['lag_max']:>10} {result['probes']:>6}"
+            )
+            if mode == "blocking":
+                continue
+            if result["ok"] < args.fetches:
+                failures.append(f"{mode}: {args.fetches - result['ok']} of {args.fetches} fetches failed")
+            if result["lag_p99"] is not None and result["lag_p99"] > args.max_lag_ms:
+                failures.append(f"{mode}: lag p99 {result['lag_p99']}ms exceeds {args.max_lag_ms}ms")
+    finally:
+        await jd_fetcher.aclose()
+        server.terminate()
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    if failures:
+        sys.exit(1)
+    if any(mode != "blocking" for mode in args.modes.split(",")):
+        print(f"PASS event loop lag p99 stayed within {args.max_lag_ms}ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,93 @@
+"""부하 테스트 스크립트
+
+실행 중인 서버의 Workflow 엔드포인트에 초당 요청 수(open-loop)를 단계적으로 늘려 보내고,
+단계 별로 클라이언트 타임아웃 안에 성공한 요청 수(goodput), 503 거절 수, 타임아웃 수, 성공 지연 시간을 출력합니다.
+요청 수락 제어가 켜져 있으면 처리 용량을 넘는 단계에서도 goodput이 유지되고 초과분은 503으로 빠르게 거절되어야 합니다.
+
+사용 예시:
+```
+python scripts/load_test.py --url http://localhost:8000 --path /analyze/resume \
+    --form thread_id=load-test --rates 5,10,20,40 --duration 30 --timeout 15
+```
+(--form으로 지정한 thread_id는 미리 /process/resume으로 이력서를 처리해 두어야 합니다.)
+"""
+import argparse
+import asyncio
+import time
+
+import httpx
+
+
+def percentile(values: list[float], q: float) -> float | None:
+    if not values:
+        return None
+    values = sorted(values)
+    return round(values[min(len(values) - 1, int(len(values) * q))], 1)
+
+
+async def run_stage(client: httpx.AsyncClient, path: str, form: dict, rate: float, duration: float, timeout: float) -> dict:
+    """rate(req/s)로 duration초 동안 요청을 보내고 결과를 집계합니다."""
+    results: list[tuple[str, float]] = []
+
+    async def request():
+        started = time.perf_counter()
+        try:
+            response = await client.post(path, data=form, timeout=timeout)
+            await response.aread()
+            outcome = str(response.status_code)
+        except httpx.TimeoutException:
+            outcome = "timeout"
+        except httpx.HTTPError:
+            outcome = "error"
+        results.append((outcome, (time.perf_counter() - started) * 1000))
+
+    tasks = []
+    started = time.perf_counter()
+    for i in range(int(rate * duration)):
+        # 정해진 간격으로 요청을 보내며, 이전 요청의 완료를 기다리지 않음 (open-loop)
+        await asyncio.sleep(max(0.0, started + i / rate - time.perf_counter()))
+        tasks.append(asyncio.create_task(request()))
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - started
+
+    succeeded = [ms for outcome, ms in results if outcome == "200"]
+    rejected = [ms for outcome, ms in results if outcome == "503"]
+    return {
+        "offered_rps": rate,
+        "goodput_rps": round(len(succeeded) / elapsed, 2),
+        "ok": len(succeeded),
+        "rejected": len(rejected),
+        "timeout": sum(1 for outcome, _ in results if outcome == "timeout"),
+        "other": sum(1 for outcome, _ in results if outcome not in ("200", "503", "timeout")),
+        "ok_ms_p50": percentile(succeeded, 0.5),
+        "ok_ms_p95": percentile(succeeded, 0.95),
+        "reject_ms_p95": percentile(rejected, 0.95),
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Workflow 엔드포인트 부하 테스트")
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--path", default="/analyze/resume")
+    parser.add_argument("--form", action="append", default=[], help="key=value 형식의 form 필드 (반복 가능)")
+    parser.add_argument("--rates", default="5,10,20,40", help="단계 별 초당 요청 수 (쉼표 구분)")
+    parser.add_argument("--duration", type=float, default=30.0, help="단계 별 요청 시간(초)")
+    parser.add_argument("--timeout", type=float, default=15.0, help="클라이언트 타임아웃(초)")
+    parser.add_argument("--cooldown", type=float, default=5.0, help="단계 사이 대기 시간(초)")
+    args = parser.parse_args()
+
+    form = dict(item.split("=", 1) for item in args.form)
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=100)
+    async with httpx.AsyncClient(base_url=args.url, limits=limits) as client:
+        columns = None
+        for rate in (float(value) for value in args.rates.split(",")):
+            stage = await run_stage(client, args.path, form, rate, args.duration, args.timeout)
+            if columns is None:
+                columns = list(stage)
+                print("\t".join(columns))
+            print("\t".join(str(stage[column]) for column in columns), flush=True)
+            await asyncio.sleep(args.cooldown)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,131 @@
+"""Parse API 커넥션 재사용 벤치마크 스크립트
+
+로컬에 Parse API 대역 서버(stand-in)를 띄우고, 이력서 업로드를 반복하여
+업로드마다 httpx.AsyncClient를 새로 만드는 기존 방식(per-request)과
+공용 커넥션 풀을 사용하는 ParseClient(pooled)의 지연 시간과 서버가 받은 TCP 연결 수를 비교합니다.
+(Parse 결과 캐시는 끄고 실행하므로 모든 업로드가 Parse API를 호출합니다)
+
+사용 예시:
+```
+python scripts/parse_client_benchmark.py --requests 200 --concurrency 1,8 --server-latency-ms 20
+```
+"""
+import argparse
+import asyncio
+import io
+import os
+import statistics
+import sys
+import time
+
+import httpx
+import uvicorn
+from fastapi import FastAPI, File, Request, UploadFile
+from starlette.datastructures import Headers
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.stats import percentile
+from src.services.parse_client import ParseClient
+
+
+def build_stand_in(latency: float) -> tuple[FastAPI, set]:
+    """업로드를 읽고 latency초 후 고정된 이력서를 반환하는 대역 서버와, 요청을 보낸 클라이언트 (host, port) 집합을 반환합니다."""
+    app = FastAPI()
+    peers: set[tuple[str, int]] = set()
+
+    @app.post("/parse")
+    async def parse(request: Request, resume_file: UploadFile = File(...)):
+        data = await resume_file.read()
+        peers.add((request.client.host, request.client.port))
+        await asyncio.sleep(latency)
+        return {"resume": f"# 홍길동\n## 경력\nACME 백엔드\n(size={len(data)})"}
+
+    return app, peers
+
+
+def make_upload(payload: bytes) -> UploadFile:
+    return UploadFile(
+        io.BytesIO(payload),
+        size=len(payload),
+        filename="resume.pdf",
+        headers=Headers({"content-type": "application/pdf"}),
+    )
+
+
+async def per_request_upload(endpoint: str, payload: bytes):
+    """기존 방식: 업로드마다 새 클라이언트를 만들고 닫음"""
+    async with httpx.AsyncClient() as client:
+        response = await client.post(
+            endpoint,
+            files={"resume_file": ("resume.pdf", payload, "application/pdf")},
+            headers={"X-API-KEY": "benchmark"},
+            timeout=180.0,
+        )
+        response.raise_for_status()
+        return response.json()
+
+
+async def run_mode(mode: str, endpoint: str, payload: bytes, requests: int, concurrency: int, peers: set) -> dict:
+    peers.clear()
+    client = httpx.AsyncClient(limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency))
+    parse_client = ParseClient(client, endpoint, "benchmark")
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def one(index: int):
+        # 업로드마다 내용을 다르게 하여 같은 파일의 동시 업로드 병합(single-flight)이 일어나지 않도록 함
+        unique = index.to_bytes(8, "big") + payload
+        async with semaphore:
+            started = time.perf_counter()
+            if mode == "pooled":
+                await parse_client.parse(make_upload(unique), use_cache=False)
+            else:
+                await per_request_upload(endpoint, unique)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(index) for index in range(requests)))
+    elapsed = time.perf_counter() - started
+    await parse_client.aclose()
+    return {
+        "rps": requests / elapsed,
+        "p50": statistics.median(latencies),
+        "p95": percentile(latencies, 0.95),
+        "connections": len(peers),
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Parse API connection reuse benchmark")
+    parser.add_argument("--requests", type=int, default=200, help="모드 별 업로드 수")
+    parser.add_argument("--concurrency", default="1,8", help="동시 업로드 수 목록 (쉼표 구분)")
+    parser.add_argument("--payload-kib", type=int, default=256, help="업로드 파일 크기(KiB)")
+    parser.add_argument("--server-latency-ms", type=float, default=20.0, help="대역 서버의 응답 지연(ms)")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    app, peers = build_stand_in(args.server_latency_ms / 1000)
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=args.port, log_level="warning"))
+    serving = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.05)
+
+    endpoint = f"http://127.0.0.1:{args.port}/parse"
+    payload = os.urandom(args.payload_kib * 1024)
+    try:
+        print(f"{'mode':>11} {'conc':>4} {'req/s':>8} {'p50_ms':>8} {'p95_ms':>8} {'tcp_conns':>9}")
+        for concurrency in (int(value) for value in args.concurrency.split(",")):
+            for mode in ("per-request", "pooled"):
+                result = await run_mode(mode, endpoint, payload, args.requests, concurrency, peers)
+                print(
+                    f"{mode:>11} {concurrency:>4} {result['rps']:>8.1f} {result['p50']:>8.1f} "
+                    f"{result['p95']:>8.1f} {result['connections']:>9}"
+                )
+    finally:
+        server.should_exit = True
+        await serving
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,156 @@
+"""이력서 추출 단계 병렬화 벤치마크 스크립트
+
+호출마다 --latency-ms만큼 기다리는 가짜 채팅 모델(FakeChatModel)로 실제 LLM 없이 Workflow의 실행 시간과 LLM 호출 수를 측정합니다.
+- resume stage: 이력서 추출 노드 3개(키워드/경력/프로젝트)를 순서대로 실행하는 그래프(sequential)와
+  START에서 병렬로 실행한 뒤 합류하는 그래프(parallel, add_resume_stage)를 비교합니다.
+- workflows: PreprocessResume / OneclickResume / OneclickFit Workflow 전체의 실행 시간과 LLM 호출 수를 측정합니다.
+  (병렬화 이전 수치는 병렬화 이전 커밋에서 같은 스크립트를 --skip-stage로 실행하여 얻습니다)
+LLM 캐시, 스케줄러, blob 저장소, JD 캐시는 설정하지 않으므로 모든 노드가 가짜 모델을 그대로 호출합니다.
+
+사용 예시:
+```
+python scripts/resume_stage_benchmark.py --latency-ms 300 --runs 3
+```
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("GOOGLE_API_KEY", "benchmark")
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.graph import StateGraph
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import src.agent.modules.models as models
+import src.agent.modules.nodes as nd
+import src.agent.workflow as wk
+from src.agent.modules.states import AgentState
+
+
+RESUME = (
+    "# 홍길동\n## 기술\nPython, FastAPI, PostgreSQL\n"
+    "## 경력\n### ACME (2년)\n백엔드 개발, 주문/결제 API 설계 및 운영\n"
+    "## 프로젝트\n### 결제 시스템 리팩터링\n응답 시간 40% 단축\n"
+    "## 수상\n사내 해커톤 대상\n"
+)
+JD_HTML = (
+    "<html><head><title>백엔드 개발자 채용</title></head><body><article><h1>백엔드 개발자</h1>"
+    + "<p>주요 업무: 주문/결제 API 설계 및 운영. 자격 요건: Python, FastAPI 3년 이상.</p>" * 20
+    + "</article></body></html>"
+)
+
+
+def fake_answer(prompt: str) -> str:
+    """프롬프트 종류에 맞는 고정 응답을 반환합니다."""
+    if "프로젝트 내역을 추출" in prompt:
+        return json.dumps([{"title": "결제 시스템 리팩터링", "achievements": ["응답 시간 40% 단축"], "period": 6, "role": "백엔드", "team": True, "company": "ACME"}])
+    if "경력 사항을 추출" in prompt:
+        return json.dumps([{"company": "ACME", "period": 24, "role": "백엔드 개발"}])
+    if "직무 유형, 기술 스택" in prompt:
+        return json.dumps({"position": "Backend", "tech_stacks": "Python, FastAPI", "years": 2, "awards": "사내 해커톤 대상", "certifications": "", "publications": "", "etcetra": ""})
+    if "채용공고의 직무명" in prompt:
+        return json.dumps({"title": "백엔드 개발자", "company": "Corp", "skills": "API 설계", "tech_stacks": "Python, FastAPI", "qualification": "3년 이상"})
+    return "# 평가 보고서\n요구 역량과 경력이 대부분 일치합니다."
+
+
+class FakeChatModel(BaseChatModel):
+    """latency초 후 fake_answer를 반환하고 호출 수를 세는 가짜 채팅 모델"""
+
+    latency: float = 0.3
+    calls: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake"
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        raise NotImplementedError("FakeChatModel only supports async calls.")
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs):
+        self.calls += 1
+        prompt = messages[-1].content
+        await asyncio.sleep(self.latency)
+        answer = fake_answer(prompt)
+        usage = {"input_tokens": len(prompt) // 2, "output_tokens": len(answer) // 2, "total_tokens": (len(prompt) + len(answer)) // 2}
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=answer, usage_metadata=usage))])
+
+
+def install_fakes(model: FakeChatModel):
+    """모든 체인이 가짜 모델을 사용하고, JD 페이지 다운로드 없이 고정된 JD를 사용하도록 합니다."""
+    models.model_provider.get = lambda *args, **kwargs: model
+    if hasattr(nd, "jd_fetcher"):
+        from trafilatura import extract
+
+        async def fetch_markdown(url: str) -> str:
+            return extract(JD_HTML, output_format="markdown", with_metadata=True)
+
+        nd.jd_fetcher.fetch_markdown = fetch_markdown
+    else:
+        # 동기 trafilatura 호출을 사용하던 이전 버전의 JDUrlToMarkdown
+        nd.fetch_url = lambda url: JD_HTML
+
+
+def build_resume_stage(parallel: bool) -> StateGraph:
+    """이력서 추출 단계만으로 이루어진 그래프를 만듭니다."""
+    builder = StateGraph(AgentState)
+    if parallel:
+        for entry in wk.add_resume_stage(builder):
+            builder.add_edge("__start__", entry)
+    else:
+        chain = ["decompose_resume", "decompose_experiences", "decompose_projects", "extract_company_projects"]
+        builder.add_node("decompose_resume", nd.ResumeDecompositionNode())
+        builder.add_node("decompose_experiences", nd.ResumeExperiencesNode())
+        builder.add_node("decompose_projects", nd.ResumeProjectsNode())
+        builder.add_node("extract_company_projects", nd.ResumeCompanyProjectsNode())
+        builder.add_edge("__start__", chain[0])
+        for source, target in zip(chain, chain[1:]):
+            builder.add_edge(source, target)
+    builder.add_edge("extract_company_projects", "__end__")
+    return builder
+
+
+async def measure(name: str, builder: StateGraph, model: FakeChatModel, runs: int) -> dict:
+    graph = builder.compile(checkpointer=InMemorySaver())
+    walls, calls = [], []
+    for run in range(runs):
+        before = model.calls
+        started = time.perf_counter()
+        await graph.ainvoke({"resume": RESUME, "jd_url": "http://jd.example/1"}, {"configurable": {"thread_id": f"{name}-{run}"}})
+        walls.append(time.perf_counter() - started)
+        calls.append(model.calls - before)
+    return {"wall_s": statistics.median(walls), "llm_calls": max(calls)}
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Resume extraction stage benchmark with a fake chat model")
+    parser.add_argument("--latency-ms", type=float, default=300.0, help="가짜 모델의 호출 당 지연(ms)")
+    parser.add_argument("--runs", type=int, default=3, help="그래프 별 실행 횟수 (중앙값 보고)")
+    parser.add_argument("--skip-stage", action="store_true", help="resume stage 비교를 건너뛰고 Workflow만 측정")
+    args = parser.parse_args()
+
+    model = FakeChatModel(latency=args.latency_ms / 1000)
+    install_fakes(model)
+
+    cases = []
+    if not args.skip_stage:
+        cases += [("stage/sequential", build_resume_stage(False)), ("stage/parallel", build_resume_stage(True))]
+    for name in ("PreprocessResumeWorkflow", "OneclickResumeWorkflow", "OneclickFitWorkflow"):
+        cases.append((name, getattr(wk, name)(AgentState).build()))
+
+    print(f"{'graph':>26} {'wall_s':>7} {'llm_calls':>9}")
+    for name, builder in cases:
+        result = await measure(name, builder, model, args.runs)
+        print(f"{name:>26} {result['wall_s']:>7.2f} {result['llm_calls']:>9}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
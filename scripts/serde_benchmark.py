@@ -0,0 +1,133 @@
+"""Checkpoint 직렬화 마이크로 벤치마크 스크립트
+
+이력서 프로젝트 수와 평가 결과(applicant_recruitment) 길이를 바꿔 가며 checkpoint 형태의 상태를 만들고,
+codec 별로 직렬화(dumps_typed)/역직렬화(loads_typed) 시간과 저장 바이트 수를 비교합니다.
+- none: LangGraph 기본 serializer (JsonPlusSerializer, msgpack)
+- zlib / zstd: CompressedSerializer (min_bytes 이상인 payload만 압축)
+
+사용 예시:
+```
+python scripts/serde_benchmark.py --projects 5,20,50 --report-kib 1,4,16 --repeat 200
+python scripts/serde_benchmark.py --codecs none,zstd --level 1
+```
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.serde import CompressedSerializer
+
+
+WORDS = (
+    "지원자", "경험", "대규모", "트래픽", "API", "설계", "운영", "포지션", "요구사항", "부합", "강점", "보완점",
+    "Python", "FastAPI", "Kafka", "Redis", "PostgreSQL", "쿠버네티스", "모니터링", "장애", "대응", "성능", "개선",
+    "협업", "리딩", "코드", "리뷰", "테스트", "자동화", "배포", "비용", "절감", "데이터", "파이프라인", "정합성",
+    "결제", "주문", "검색", "추천", "지연", "시간", "단축", "%", "3년", "5년", "팀", "프로젝트", "성과", "평가",
+)
+
+
+def build_checkpoint(projects: int, report_kib: int) -> dict:
+    """프로젝트 수와 평가 결과 길이(KiB)에 맞춰 AgentState를 담은 checkpoint dict를 생성합니다."""
+    resume_details = {
+        "position": "Backend",
+        "tech_stacks": "Python, FastAPI, PostgreSQL, Redis, Kafka",
+        "years": 5,
+        "experiences": [
+            {"company": f"회사{index}", "period": 12 + index, "role": "백엔드 개발자"}
+            for index in range(max(1, projects // 5))
+        ],
+        "projects": [
+            {
+                "title": f"프로젝트 {index}",
+                "achievements": [
+                    f"주문 처리 API 응답 시간을 {index + 10}% 단축",
+                    "배치 작업을 이벤트 기반 파이프라인으로 전환하여 운영 비용 절감",
+                ],
+                "period": 6,
+                "role": "백엔드 리드",
+                "team": True,
+                "company": f"회사{index % max(1, projects // 5)}",
+            }
+            for index in range(projects)
+        ],
+    }
+    # 같은 문장이 반복되면 압축률이 비현실적으로 높아지므로 단어를 무작위로 조합
+    rng = random.Random(report_kib)
+    report, size = [], 0
+    while size < report_kib * 1024:
+        word = rng.choice(WORDS) + rng.choice(("", "", "는", "를", "의", "에서", ".\n"))
+        report.append(word)
+        size += len(word.encode("utf-8")) + 1
+    report = " ".join(report)
+    channels = {
+        "resume_details": resume_details,
+        "jd_details": {"title": "백엔드 개발자", "company": "Corp", "skills": "Python", "tech_stacks": ["FastAPI"]},
+        "applicant_recruitment": report,
+    }
+    return {
+        "v": 4,
+        "id": str(uuid.uuid4()),
+        "ts": "2025-01-01T00:00:00+00:00",
+        "channel_values": channels,
+        "channel_versions": {name: f"{index:032}.0.1" for index, name in enumerate(channels)},
+        "versions_seen": {"evaluate_fit": {name: f"{index:032}.0.1" for index, name in enumerate(channels)}},
+    }
+
+
+def measure(serde: CompressedSerializer, checkpoint: dict, repeat: int) -> dict:
+    dumps_us, loads_us = [], []
+    typed = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        typed = serde.dumps_typed(checkpoint)
+        dumps_us.append((time.perf_counter() - started) * 1e6)
+        started = time.perf_counter()
+        restored = serde.loads_typed(typed)
+        loads_us.append((time.perf_counter() - started) * 1e6)
+    assert restored == checkpoint
+    return {
+        "type": typed[0],
+        "bytes": len(typed[1]),
+        "dumps_us": statistics.median(dumps_us),
+        "loads_us": statistics.median(loads_us),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Checkpoint serializer micro-benchmark")
+    parser.add_argument("--projects", default="5,20,50", help="이력서 프로젝트 수 목록 (쉼표 구분)")
+    parser.add_argument("--report-kib", default="1,4,16", help="평가 결과 길이(KiB) 목록 (쉼표 구분)")
+    parser.add_argument("--codecs", default="none,zlib,zstd", help="비교할 codec 목록 (쉼표 구분)")
+    parser.add_argument("--level", type=int, default=3, help="압축 레벨")
+    parser.add_argument("--min-bytes", type=int, default=1024, help="압축할 최소 payload 크기(바이트)")
+    parser.add_argument("--repeat", type=int, default=200, help="조합 별 반복 횟수 (중앙값 보고)")
+    args = parser.parse_args()
+
+    codecs = args.codecs.split(",")
+    serdes = {}
+    for codec in codecs:
+        serdes[codec] = CompressedSerializer()
+        serdes[codec].configure(codec=codec, min_bytes=args.min_bytes, level=args.level)
+
+    print(f"{'projects':>8} {'report':>7} {'codec':>5} {'bytes':>8} {'ratio':>6} {'dumps_us':>9} {'loads_us':>9}")
+    for projects in (int(value) for value in args.projects.split(",")):
+        for report_kib in (int(value) for value in args.report_kib.split(",")):
+            checkpoint = build_checkpoint(projects, report_kib)
+            baseline = None
+            for codec in codecs:
+                result = measure(serdes[codec], checkpoint, args.repeat)
+                baseline = baseline or result["bytes"]
+                print(
+                    f"{projects:>8} {report_kib:>6}K {codec:>5} {result['bytes']:>8} "
+                    f"{result['bytes'] / baseline:>6.2f} {result['dumps_us']:>9.1f} {result['loads_us']:>9.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""이력서 업로드 메모리 벤치마크 스크립트
+
+로컬에 Parse API 대역 서버(stand-in, 별도 프로세스)를 띄우고 N개의 큰 이력서(기본 10MB)를 동시에 업로드하면서,
+업로드를 Parse API로 전달하는 동안의 메모리 사용량 최대치를 비교합니다.
+- read: 기존 방식 (await resume_file.read()로 파일 전체를 메모리에 올린 뒤 해싱/전송)
+- spool: ParseClient.parse (UploadFile의 spool 파일을 청크 단위로 해싱/스트리밍 전송)
+모드마다 새 프로세스에서 실행하여 tracemalloc 최대치(Python 할당)와 RSS 최대치(ru_maxrss)를 따로 측정합니다.
+업로드 파일은 Starlette와 같이 1MB를 넘으면 디스크로 넘어가는 SpooledTemporaryFile로 준비합니다.
+
+사용 예시:
+```
+python scripts/upload_memory_benchmark.py --uploads 8 --size-mib 10
+python scripts/upload_memory_benchmark.py --modes spool --uploads 32
+```
+"""
+import argparse
+import asyncio
+import hashlib
+import multiprocessing
+import os
+import resource
+import socket
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import httpx
+import uvicorn
+from fastapi import FastAPI, File, UploadFile
+from starlette.datastructures import Headers
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.services.parse_client import ParseClient
+
+
+# Starlette가 multipart 파일을 메모리에 두는 최대 크기 (넘으면 디스크 spool 파일로 옮김)
+SPOOL_MAX_SIZE = 1024 * 1024
+MIB = 1024 * 1024
+
+
+def serve_stand_in(port: int, latency: float):
+    """업로드를 청크 단위로 읽고 latency초 후 고정된 이력서를 반환하는 서버를 실행합니다. (자식 프로세스에서 실행)"""
+    app = FastAPI()
+
+    @app.post("/parse")
+    async def parse(resume_file: UploadFile = File(...)):
+        size = 0
+        while chunk := await resume_file.read(64 * 1024):
+            size += len(chunk)
+        await asyncio.sleep(latency)
+        return {"resume": f"# 홍길동\n## 경력\nACME 백엔드\n(size={size})"}
+
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+
+
+def start_stand_in(port: int, latency: float) -> multiprocessing.Process:
+    """대역 서버를 별도 프로세스로 시작하고 연결을 받을 때까지 기다립니다. (서버의 메모리가 측정값에 섞이지 않도록 분리)"""
+    process = multiprocessing.Process(target=serve_stand_in, args=(port, latency), daemon=True)
+    process.start()
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.1).close()
+            return process
+        except OSError:
+            time.sleep(0.05)
+
+
+def make_upload(index: int, size: int) -> UploadFile:
+    """Starlette가 만드는 것과 같은 spool 파일 기반 UploadFile을 만듭니다. (업로드마다 내용이 달라 single-flight가 일어나지 않음)"""
+    spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+    block = index.to_bytes(8, "big") * (MIB // 8)
+    for _ in range(size // MIB):
+        spool.write(block)
+    spool.write(block[:size % MIB])
+    spool.seek(0)
+    return UploadFile(spool, size=size, filename="resume.pdf", headers=Headers({"content-type": "application/pdf"}))
+
+
+async def read_upload(client: httpx.AsyncClient, endpoint: str, resume_file: UploadFile) -> dict:
+    """기존 방식: 파일 전체를 읽어 해싱하고 bytes로 전송"""
+    content = await resume_file.read()
+    hashlib.sha256(content).hexdigest()
+    response = await client.post(
+        endpoint,
+        files={"resume_file": (resume_file.filename, content, resume_file.content_type)},
+        headers={"X-API-KEY": "benchmark"},
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+async def run_mode(mode: str, endpoint: str, uploads: int, size: int) -> dict:
+    client = httpx.AsyncClient(limits=httpx.Limits(max_connections=uploads), timeout=180.0)
+    parse_client = ParseClient(client, endpoint, "benchmark")
+    files = [make_upload(index, size) for index in range(uploads)]
+
+    # 업로드 파일 준비(spool 파일 쓰기)와 클라이언트 생성 이후의 메모리만 측정
+    tracemalloc.start()
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    started = time.perf_counter()
+    if mode == "read":
+        results = await asyncio.gather(*(read_upload(client, endpoint, file) for file in files))
+    else:
+        results = await asyncio.gather(*(parse_client.parse(file, use_cache=False) for file in files))
+    elapsed = time.perf_counter() - started
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss_peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss   # Linux: KiB 단위
+
+    for file in files:
+        await file.close()
+    await parse_client.aclose()
+    return {
+        "ok": len(results),
+        "wall_s": elapsed,
+        "traced_peak_mib": traced_peak / MIB,
+        "traced_per_upload_mib": traced_peak / MIB / uploads,
+        "rss_growth_mib": max(0, rss_peak - rss_before) / 1024,
+        "rss_peak_mib": rss_peak / 1024,
+    }
+
+
+def measure(mode: str, endpoint: str, uploads: int, size: int, results: multiprocessing.Queue):
+    """새 프로세스에서 한 모드를 실행하여, 앞선 모드의 메모리 최대치가 측정값에 남지 않도록 합니다."""
+    results.put(asyncio.run(run_mode(mode, endpoint, uploads, size)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resume upload memory benchmark")
+    parser.add_argument("--uploads", type=int, default=8, help="동시에 업로드할 파일 수")
+    parser.add_argument("--size-mib", type=int, default=10, help="업로드 파일 크기(MiB)")
+    parser.add_argument("--modes", default="read,spool", help="측정할 모드 목록 (쉼표 구분)")
+    parser.add_argument("--server-latency-ms", type=float, default=200.0, help="대역 서버의 응답 지연(ms)")
+    parser.add_argument("--port", type=int, default=8767)
+    args = parser.parse_args()
+
+    server = start_stand_in(args.port, args.server_latency_ms / 1000)
+    endpoint = f"http://127.0.0.1:{args.port}/parse"
+    try:
+        print(f"{'mode':>6} {'ok':>4} {'wall_s':>7} {'traced_peak_mib':>15} {'per_upload_mib':>14} {'rss_growth_mib':>14} {'rss_peak_mib':>12}")
+        for mode in args.modes.split(","):
+            results = multiprocessing.Queue()
+            process = multiprocessing.Process(target=measure, args=(mode, endpoint, args.uploads, args.size_mib * MIB, results))
+            process.start()
+            result = results.get()
+            process.join()
+            print(
+                f"{mode:>6} {result['ok']:>4} {result['wall_s']:>7.2f} {result['traced_peak_mib']:>15.1f} "
+                f"{result['traced_per_upload_mib']:>14.2f} {result['rss_growth_mib']:>14.1f} {result['rss_peak_mib']:>12.1f}"
+            )
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,319 @@
+"""State Blob 저장소 모듈
+
+AgentState의 큰 문자열 필드(이력서 원문, JD markdown, 평가 결과)를 내용의 해시를 키로 한 번만 저장하고,
+상태(checkpoint)에는 짧은 참조 문자열만 기록합니다.
+- 매 super-step의 checkpoint가 같은 원문을 다시 직렬화하지 않으며, 같은 이력서를 여러 thread가 사용해도 한 번만 저장됩니다.
+- 참조는 노드가 실제로 필드를 읽을 때(resolve) 원문으로 바뀝니다.
+- 참조가 아닌 값(설정 전에 만든 checkpoint의 원문 등)은 resolve가 그대로 반환하므로 기존 thread도 그대로 동작합니다.
+- 저장소는 만료 없이 보관하며, Checkpoint 보관 정책(CheckpointRetention)이 정리 후 sweep을 호출하여
+  남은 checkpoint 어디에서도 참조하지 않고 grace 기간보다 오래된 blob을 삭제합니다.
+CheckpointMeter는 Checkpointer의 serializer를 감싸 Workflow 실행 당 checkpoint에 기록된 바이트 수와,
+참조 대신 원문을 기록했다면 추가로 기록되었을 바이트 수(절감량)를 집계합니다.
+"""
+import contextvars
+import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable
+
+from langgraph.checkpoint.serde.base import SerializerProtocol
+
+from src.core.cache import TwoTierCache
+from src.core.hashing import sha256_hex
+from src.core.serde import checkpoint_serde
+
+
+# 참조 문자열 형식: blob:sha256:<hex digest>:<원문 UTF-8 바이트 수>
+REF_PREFIX = "blob:sha256:"
+REF_PATTERN = re.compile(r"blob:sha256:([0-9a-f]{64}):(\d+)")
+# 직렬화된 checkpoint 바이트(msgpack/JSON 모두 문자열을 UTF-8 그대로 기록)에서 참조를 찾는 패턴
+REF_BYTES_PATTERN = re.compile(rb"blob:sha256:([0-9a-f]{64}):\d+")
+
+# 저장소로 옮기는 AgentState 필드
+BLOB_FIELDS = ("resume", "job_description", "applicant_skills", "applicant_recruitment")
+
+
+def is_ref(value) -> bool:
+    """값이 blob 참조 문자열인지 확인합니다."""
+    return isinstance(value, str) and REF_PATTERN.fullmatch(value) is not None
+
+
+def ref_size(value) -> int | None:
+    """참조가 가리키는 원문의 바이트 수를 반환합니다. (참조가 아니면 None)"""
+    match = REF_PATTERN.fullmatch(value) if isinstance(value, str) else None
+    return int(match.group(2)) if match else None
+
+
+def scan_refs(type_: str, data: bytes) -> set[str]:
+    """직렬화된 checkpoint payload에 포함된 blob 참조의 digest 집합을 반환합니다. (압축만 풀고 역직렬화하지 않음)"""
+    if not data:
+        return set()
+    _, data = checkpoint_serde.decompress((type_, bytes(data)))
+    return {digest.decode("ascii") for digest in REF_BYTES_PATTERN.findall(data)}
+
+
+class BlobStore:
+    """내용 주소(content-addressed) 기반 문자열 저장소
+
+    저장소가 설정되지 않았으면(configure 호출 전) put은 값을 그대로 반환하므로 상태에 원문이 기록됩니다.
+
+    예시:
+    ```python
+    blob_store.configure(TwoTierCache("blob", "blob.sqlite", ...), min_bytes=1024)
+    initial_state = await blob_store.externalize({"resume": resume_text})
+    resume_text = await blob_store.resolve(state["resume"])
+    await blob_store.sweep(lambda scan: retention.store.referenced_blobs(scan))   # 참조되지 않는 오래된 blob 삭제
+    ```
+    """
+
+    def __init__(self, known_size: int = 100_000):
+        self.store: TwoTierCache | None = None
+        self.min_bytes = 1024
+        self.gc_grace_seconds = 3600.0
+        self.known_size = known_size
+        # 이 프로세스가 최근에 저장한 digest와 저장 시각 (같은 내용을 다시 쓰지 않기 위함)
+        self._known: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+        self.counters = {
+            "puts": 0,              # 저장소로 옮긴 값 수
+            "dedup_hits": 0,        # 이미 저장된 내용이라 쓰기를 생략한 수
+            "inline": 0,            # min_bytes보다 작아 상태에 그대로 둔 값 수
+            "stored_bytes": 0,      # 새로 저장한 원문 바이트 수
+            "resolves": 0,          # 참조를 원문으로 바꾼 수
+            "missing": 0,           # 저장소에서 찾지 못한 참조 수
+            "sweeps": 0,            # 참조되지 않는 blob 정리 실행 수
+            "swept": 0,             # 정리로 삭제한 blob 수
+        }
+
+    def configure(self, store: TwoTierCache, min_bytes: int = 1024, gc_grace_seconds: float = 3600.0):
+        """
+        Args:
+            store (TwoTierCache): blob을 저장할 캐시 (만료 없이 사용)
+            min_bytes (int): 저장소로 옮길 최소 크기(UTF-8 바이트). 이보다 작은 값은 상태에 그대로 기록합니다.
+            gc_grace_seconds (float): 이 기간 안에 저장된 blob은 참조가 없어도 sweep에서 삭제하지 않음
+                (저장 직후 아직 checkpoint에 기록되지 않은 참조를 보호)
+        """
+        self.store = store
+        self.min_bytes = min_bytes
+        self.gc_grace_seconds = gc_grace_seconds
+
+    @property
+    def enabled(self) -> bool:
+        return self.store is not None
+
+    def _count(self, key: str, amount: int = 1):
+        with self._lock:
+            self.counters[key] += amount
+
+    async def put(self, value):
+        """큰 문자열을 저장소에 저장하고 참조를 반환합니다. (문자열이 아니거나 작으면 그대로 반환)"""
+        if self.store is None or not isinstance(value, str) or is_ref(value):
+            return value
+        size = len(value.encode("utf-8"))
+        if size < self.min_bytes:
+            self._count("inline")
+            return value
+
+        digest = sha256_hex(value)
+        now = time.time()
+        with self._lock:
+            # 저장 시각(written_at)이 sweep grace 기간 안에 있도록, 오래전에 저장한 digest는 다시 기록
+            known = self._known.get(digest, 0.0) > now - self.gc_grace_seconds / 2
+            if known:
+                self._known.move_to_end(digest)
+        if known:
+            self._count("dedup_hits")
+        else:
+            # 내용 주소이므로 같은 digest를 다시 써도 결과는 같음 (프로세스 재시작 후 중복 쓰기 허용)
+            await self.store.set(digest, value)
+            with self._lock:
+                self._known[digest] = now
+                self._known.move_to_end(digest)
+                while len(self._known) > self.known_size:
+                    self._known.popitem(last=False)
+            self._count("stored_bytes", size)
+        self._count("puts")
+        return f"{REF_PREFIX}{digest}:{size}"
+
+    async def resolve(self, value):
+        """참조이면 원문을, 참조가 아니면 값을 그대로 반환합니다.
+
+        Raises:
+            LookupError: 참조가 가리키는 blob이 저장소에 없는 경우
+        """
+        match = REF_PATTERN.fullmatch(value) if isinstance(value, str) else None
+        if match is None:
+            return value
+        if self.store is None:
+            raise LookupError(f"Blob store is not configured; cannot resolve {value!r}.")
+        text = await self.store.get(match.group(1))
+        if text is None:
+            self._count("missing")
+            raise LookupError(f"Blob not found: {value!r}")
+        self._count("resolves")
+        return text
+
+    async def externalize(self, state: dict, fields: tuple[str, ...] = BLOB_FIELDS) -> dict:
+        """상태의 큰 문자열 필드를 참조로 바꾼 사본을 반환합니다."""
+        state = dict(state)
+        for field in fields:
+            if field in state:
+                state[field] = await self.put(state[field])
+        return state
+
+    async def materialize(self, values: dict, fields: tuple[str, ...] = BLOB_FIELDS) -> dict:
+        """상태의 참조 필드를 원문으로 바꾼 사본을 반환합니다. (응답으로 내보낼 때 사용)"""
+        values = dict(values)
+        for field in fields:
+            if field in values:
+                values[field] = await self.resolve(values[field])
+        return values
+
+    async def sweep(self, collect_referenced: Callable[[Callable[[str, bytes], set[str]]], Awaitable[set[str]]]) -> dict:
+        """grace 기간보다 오래전에 저장되었고, 남은 checkpoint 어디에서도 참조하지 않는 blob을 삭제합니다.
+
+        삭제 후보를 먼저 고른 뒤 참조를 수집하므로, 수집 중에 새로 저장된 blob은 후보에 포함되지 않습니다.
+
+        Args:
+            collect_referenced: scan_refs를 받아, 남아 있는 checkpoint가 참조하는 digest 집합을 반환하는 함수
+
+        Returns:
+            dict: {"candidates": 후보 수, "referenced": 참조 중인 digest 수, "deleted": 삭제한 blob 수}
+        """
+        if self.store is None:
+            return {"candidates": 0, "referenced": 0, "deleted": 0}
+        cutoff = time.time() - self.gc_grace_seconds
+        candidates = await self.store.keys_written_before(cutoff)
+        referenced = await collect_referenced(scan_refs) if candidates else set()
+        unreferenced = [digest for digest in candidates if digest not in referenced]
+        # 참조 수집 중에 다시 저장된 blob(written_at 갱신)은 새 checkpoint가 참조할 수 있으므로 삭제하지 않음
+        deleted = await self.store.delete_many(unreferenced, written_before=cutoff) if unreferenced else 0
+        with self._lock:
+            for digest in unreferenced:
+                self._known.pop(digest, None)
+            self.counters["sweeps"] += 1
+            self.counters["swept"] += deleted
+        return {"candidates": len(candidates), "referenced": len(referenced), "deleted": deleted}
+
+    def close(self):
+        """저장소를 닫고 blob 저장을 비활성화합니다."""
+        if self.store is not None:
+            self.store.close()
+        self.store = None
+
+    def stats(self) -> dict:
+        """저장/중복 제거/참조 해석 카운터와 저장소 통계를 반환합니다."""
+        if self.store is None:
+            return {"enabled": False}
+        with self._lock:
+            counters = dict(self.counters)
+        return {"enabled": True, "min_bytes": self.min_bytes, **counters, "store": self.store.stats()}
+
+
+def _ref_savings(obj, depth: int = 0) -> int:
+    """직렬화할 객체 안의 참조들이 원문 대신 기록되어 줄어든 바이트 수를 계산합니다."""
+    if isinstance(obj, str):
+        size = ref_size(obj)
+        return size - len(obj) if size is not None else 0
+    if depth >= 4:
+        return 0
+    if isinstance(obj, dict):
+        return sum(_ref_savings(value, depth + 1) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return sum(_ref_savings(value, depth + 1) for value in obj)
+    return 0
+
+
+# 현재 실행 중인 Workflow의 checkpoint 바이트 집계 (Checkpointer의 쓰기 task에도 복사되어 전달됨)
+_current_run: contextvars.ContextVar[dict | None] = contextvars.ContextVar("checkpoint_run", default=None)
+
+
+class CheckpointMeter(SerializerProtocol):
+    """Checkpointer serializer(기본값 checkpoint_serde)를 감싸 checkpoint 쓰기 바이트 수와 blob 참조로 절감한 바이트 수를 집계합니다.
+
+    직렬화 결과는 바꾸지 않으므로 기존 checkpoint와 그대로 호환됩니다.
+
+    예시:
+    ```python
+    saver = AsyncSqliteSaver(conn, serde=checkpoint_meter)
+    async with checkpoint_meter.run("AnalyzeFitWorkflow"):
+        await work.ainvoke(initial_state, config=config)
+    ```
+    """
+
+    def __init__(self, serde: SerializerProtocol | None = None):
+        self.serde = serde or checkpoint_serde
+        self._lock = threading.Lock()
+        self.counters = {"serialized": 0, "bytes_written": 0, "bytes_avoided": 0}
+        self.workflows: dict[str, dict] = {}
+
+    def dumps(self, obj: Any) -> bytes:
+        return self.serde.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return self.serde.loads(data)
+
+    def dumps_typed(self, obj: Any) -> tuple[str, bytes]:
+        type_, data = self.serde.dumps_typed(obj)
+        written, avoided = len(data), _ref_savings(obj)
+        with self._lock:
+            self.counters["serialized"] += 1
+            self.counters["bytes_written"] += written
+            self.counters["bytes_avoided"] += avoided
+        run = _current_run.get()
+        if run is not None:
+            run["bytes_written"] += written
+            run["bytes_avoided"] += avoided
+        return type_, data
+
+    def loads_typed(self, data: tuple[str, bytes]) -> Any:
+        return self.serde.loads_typed(data)
+
+    @asynccontextmanager
+    async def run(self, name: str):
+        """블록 안에서 기록된 checkpoint 바이트를 Workflow 실행 1회로 집계합니다."""
+        run = {"bytes_written": 0, "bytes_avoided": 0}
+        token = _current_run.set(run)
+        try:
+            yield run
+        finally:
+            _current_run.reset(token)
+            with self._lock:
+                workflow = self.workflows.setdefault(name, {"runs": 0, "bytes_written": 0, "bytes_avoided": 0})
+                workflow["runs"] += 1
+                workflow["bytes_written"] += run["bytes_written"]
+                workflow["bytes_avoided"] += run["bytes_avoided"]
+
+    def stats(self) -> dict:
+        """전체 및 Workflow 별 실행 당 checkpoint 쓰기 바이트 수와 절감률을 반환합니다.
+
+        reduction은 참조 대신 원문을 기록했을 경우의 바이트 수 대비 줄어든 비율입니다.
+        (bytes_written은 압축 후 실제로 기록한 바이트 수, bytes_avoided는 압축 전 원문 기준입니다)
+        """
+        def _summary(item: dict) -> dict:
+            total = item["bytes_written"] + item["bytes_avoided"]
+            return {
+                **item,
+                "reduction": round(item["bytes_avoided"] / total, 4) if total else 0.0,
+            }
+
+        with self._lock:
+            workflows = {name: dict(item) for name, item in self.workflows.items()}
+            counters = dict(self.counters)
+        return {
+            **_summary(counters),
+            "workflows": {
+                name: {
+                    **_summary(item),
+                    "bytes_written_per_run": item["bytes_written"] // item["runs"],
+                    "bytes_avoided_per_run": item["bytes_avoided"] // item["runs"],
+                }
+                for name, item in workflows.items()
+            },
+        }
+
+
+blob_store = BlobStore()
+checkpoint_meter = CheckpointMeter()
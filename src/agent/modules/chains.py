@@ -1,51 +1,78 @@
 """Langchain 모듈
 각 Agent 노드에서 사용하는 프롬프트와 모델을 Langchain 문법으로 정의, 결합합니다.
+model을 지정하지 않으면 ModelProvider가 보관 중인 공용 Gemini 인스턴스를 사용합니다.
+cache_label을 지정하면 모델 호출 단계가 LLM 응답 캐시로 감싸지며, 적중률은 cache_label 단위로 집계됩니다.
+캐시에 없는 호출은 LLM 호출 스케줄러의 RPM/TPM 예산과 레인 대기열을 거쳐 실행됩니다.
 """
 from typing import List
 from langchain.schema.runnable import RunnablePassthrough, RunnableSerializable
+from langchain_core.language_models import BaseChatModel
 from langchain_core.output_parsers import StrOutputParser
 from src.agent.modules.models import get_gemini_llm
-from src.agent.modules.states import ProjectAndAchievementsDict, ExperiencesDict
+from src.agent.modules.llm_cache import llm_cache
+from src.agent.modules.llm_scheduler import llm_scheduler
+from src.agent.modules.states import ProjectAndAchievementsDict, ExperiencesDict, ResumeDict
 
 
 # Resume 분해
-def set_decomposition_chain(prompt: str, model: str = get_gemini_llm) -> RunnableSerializable:
+def set_decomposition_chain(prompt: str, model: BaseChatModel | None = None, cache_label: str | None = None) -> RunnableSerializable:
+    model = model or get_gemini_llm()
     return (
         RunnablePassthrough.assign(
             resume = lambda x: x["resume"]
         )
         | prompt
-        | model
-        | StrOutputParser()
+        | llm_cache.wrap(llm_scheduler.wrap(model | StrOutputParser()), model, prompt, cache_label)
+    )
+
+
+# Resume 단일 호출 구조화 추출
+def set_structured_resume_chain(prompt: str, model: BaseChatModel | None = None, cache_label: str | None = None) -> RunnableSerializable:
+    model = model or get_gemini_llm()
+    return (
+        RunnablePassthrough.assign(
+            resume = lambda x: x["resume"]
+        )
+        | prompt
+        | llm_cache.wrap(
+            llm_scheduler.wrap(model.with_structured_output(ResumeDict, include_raw=True)),
+            model,
+            prompt,
+            cache_label,
+            # 검증 가능한 파싱 결과만 저장하고, 적중 시 원본 메시지 없이 파싱 결과만 반환
+            encode=lambda output: output["parsed"] if output.get("parsing_error") is None else None,
+            decode=lambda value: {"raw": None, "parsed": value, "parsing_error": None},
+        )
     )
 
 
 # JD 분해
-def set_jd_chain(prompt: str, model: str = get_gemini_llm) -> RunnableSerializable:
+def set_jd_chain(prompt: str, model: BaseChatModel | None = None, cache_label: str | None = None) -> RunnableSerializable:
+    model = model or get_gemini_llm()
     return (
         RunnablePassthrough.assign(
             job_description = lambda x: x["job_description"]
         )
         | prompt
-        | model
-        | StrOutputParser()
+        | llm_cache.wrap(llm_scheduler.wrap(model | StrOutputParser()), model, prompt, cache_label)
     )
 
 
 # 이력서 평가
-def set_resume_evaluation_chain(prompt: str, model: str = get_gemini_llm) -> RunnableSerializable:
+def set_resume_evaluation_chain(prompt: str, model: BaseChatModel | None = None, cache_label: str | None = None) -> RunnableSerializable:
+    model = model or get_gemini_llm()
     return (
         RunnablePassthrough.assign(
             resume_details = lambda x: x["resume_details"]
         )
         | prompt
-        | model
-        | StrOutputParser()
+        | llm_cache.wrap(llm_scheduler.wrap(model | StrOutputParser()), model, prompt, cache_label)
     )
 
 
 # Resume/JD 비교 심사
-def set_recruit_evaluation_chain(prompt: str, model: str = get_gemini_llm) -> RunnableSerializable:
+def set_recruit_evaluation_chain(prompt: str, model: BaseChatModel | None = None, cache_label: str | None = None) -> RunnableSerializable:
+    model = model or get_gemini_llm()
     return (
         RunnablePassthrough.assign(
             company = lambda x: x["company"],
@@ -60,6 +87,5 @@ def set_recruit_evaluation_chain(prompt: str, model: str = get_gemini_llm) -> Ru
             resume_details = lambda x: x["resume_details"]
         )
         | prompt
-        | model
-        | StrOutputParser()
+        | llm_cache.wrap(llm_scheduler.wrap(model | StrOutputParser()), model, prompt, cache_label)
     )
\ No newline at end of file
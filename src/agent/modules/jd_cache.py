@@ -0,0 +1,139 @@
+"""채용공고(JD) 캐시 모듈
+
+정규화된 jd_url을 키로 원본 페이지, 검증자(ETag/Last-Modified), 추출된 markdown을 저장하고,
+(프롬프트 버전, 모델, markdown 해시)의 fingerprint를 키로 분해 결과(jd_details)를 저장합니다.
+같은 채용공고로 여러 지원자를 평가할 때 페이지 다운로드와 JD 분해 LLM 호출을 재사용합니다.
+"""
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from src.core.cache import TwoTierCache
+from src.core.hashing import sha256_hex
+
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_url(url: str) -> str:
+    """캐시 키로 사용할 수 있도록 URL을 정규화합니다.
+
+    scheme/host 소문자화, 기본 포트와 fragment 제거, utm_* 추적 파라미터 제거, 쿼리 파라미터 정렬을 수행합니다.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    path = parts.path or "/"
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_")
+    ))
+    return urlunsplit((scheme, host, path, query, ""))
+
+
+def markdown_hash(markdown: str | None) -> str | None:
+    """추출된 JD markdown의 해시를 반환합니다."""
+    return sha256_hex(markdown) if markdown else None
+
+
+class JDCache:
+    """JD 페이지 및 분해 결과 캐시
+
+    저장소가 설정되지 않았으면(configure 호출 전) 모든 조회는 None을 반환하고 저장은 무시됩니다.
+
+    예시:
+    ```python
+    jd_cache.configure(TwoTierCache("jd", "cache.sqlite", ...), fresh_seconds=3600)
+    page = await jd_cache.get_page(jd_url)
+    details = await jd_cache.get_details(fingerprint("jd_details", template_version(prompt), model_version(model), markdown_hash(job_description)))
+    ```
+    """
+
+    def __init__(self):
+        self.store: TwoTierCache | None = None
+        self.fresh_seconds = 0.0
+        self._lock = threading.Lock()
+        self.counters = {
+            "page_fresh_hits": 0,       # 재검증 없이 사용한 페이지 수
+            "page_revalidated": 0,      # 304 응답으로 재사용한 페이지 수
+            "page_changed": 0,          # 재검증 결과 내용이 바뀐 페이지 수
+            "page_misses": 0,           # 캐시에 없어 새로 다운로드한 페이지 수
+            "details_hits": 0,
+            "details_misses": 0,
+        }
+
+    def configure(self, store: TwoTierCache | None, fresh_seconds: float = 0.0):
+        """캐시 저장소와 재검증 없이 사용할 기간(초)을 설정합니다."""
+        self.store = store
+        self.fresh_seconds = fresh_seconds
+
+    def close(self):
+        """저장소를 닫고 캐시를 비활성화합니다."""
+        if self.store is not None:
+            self.store.close()
+        self.store = None
+
+    def count(self, field: str):
+        with self._lock:
+            self.counters[field] += 1
+
+    def is_fresh(self, page: dict) -> bool:
+        """마지막 검증 이후 fresh_seconds가 지나지 않았으면 True를 반환합니다."""
+        return time.time() - page["validated_at"] < self.fresh_seconds
+
+    async def get_page(self, url: str) -> dict | None:
+        """저장된 페이지 정보(etag, last_modified, markdown, markdown_hash, validated_at)를 반환합니다."""
+        if self.store is None:
+            return None
+        return await self.store.get(f"page:{normalize_url(url)}")
+
+    async def set_page(self, url: str, raw: str | None, markdown: str | None, etag: str | None, last_modified: str | None) -> dict:
+        """페이지 정보를 저장하고 저장된 값을 반환합니다. raw가 None이면 원본 페이지는 갱신하지 않습니다."""
+        key = normalize_url(url)
+        page = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "markdown": markdown,
+            "markdown_hash": markdown_hash(markdown),
+            "validated_at": time.time(),
+        }
+        if self.store is not None:
+            if raw is not None:
+                await self.store.set(f"raw:{key}", raw)
+            await self.store.set(f"page:{key}", page)
+        return page
+
+    async def get_raw(self, url: str) -> str | None:
+        """저장된 원본 HTML을 반환합니다."""
+        if self.store is None:
+            return None
+        return await self.store.get(f"raw:{normalize_url(url)}")
+
+    async def get_details(self, key: str | None) -> dict | None:
+        """분해 결과 키(프롬프트 버전, 모델, markdown 해시의 fingerprint)에 해당하는 jd_details를 반환합니다."""
+        if self.store is None or key is None:
+            return None
+        details = await self.store.get(f"details:{key}")
+        self.count("details_hits" if details is not None else "details_misses")
+        return details
+
+    async def set_details(self, key: str | None, details: dict):
+        """분해 결과 키를 키로 jd_details를 저장합니다."""
+        if self.store is None or key is None or not isinstance(details, dict):
+            return
+        await self.store.set(f"details:{key}", details)
+
+    def stats(self) -> dict:
+        """페이지/분해 결과 캐시 카운터와 저장소 통계를 반환합니다."""
+        with self._lock:
+            counters = dict(self.counters)
+        return {
+            "enabled": self.store is not None,
+            **counters,
+            "store": self.store.stats() if self.store is not None else None,
+        }
+
+
+jd_cache = JDCache()
@@ -0,0 +1,192 @@
+"""채용공고(JD) 페이지 수집 모듈
+
+이벤트 루프를 막지 않도록 JD 페이지는 공용 httpx.AsyncClient로 비동기 다운로드하고,
+CPU 연산인 trafilatura의 본문 추출은 크기가 제한된 워커 스레드 풀에서 실행합니다.
+JD 캐시에 저장된 페이지는 ETag/Last-Modified 조건부 요청으로 재검증하여, 변경되지 않았으면 다시 추출하지 않습니다.
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+from trafilatura import extract
+from trafilatura.utils import decode_file
+
+from src.agent.modules.jd_cache import jd_cache, normalize_url
+from src.core.singleflight import SingleFlight
+
+
+DEFAULT_HEADERS = {
+    "Accept-Encoding": "gzip,deflate",
+    "User-Agent": "trafilatura/2.0.0 (+https://github.com/adbar/trafilatura)",
+}
+
+
+class JDFetcher:
+    """JD 페이지 다운로드 및 markdown 추출기
+
+    client와 워커 풀은 처음 사용할 때 생성되며, lifespan에서 configure/aclose로 설정과 정리를 담당합니다.
+
+    예시:
+    ```python
+    markdown = await jd_fetcher.fetch_markdown(jd_url)
+    ```
+    """
+
+    def __init__(self):
+        self.configure()
+        self._client: httpx.AsyncClient | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self.counters = {"fetched": 0, "not_modified": 0, "failed": 0, "too_large": 0}
+        self.inflight = SingleFlight()
+
+    def configure(
+        self,
+        connect_timeout: float = 10.0,
+        read_timeout: float = 30.0,
+        max_bytes: int = 5 * 1024 * 1024,
+        max_redirects: int = 5,
+        max_connections: int = 50,
+        extract_workers: int = 4,
+    ):
+        """다운로드 타임아웃, 최대 크기, 리다이렉트 횟수, 커넥션 수, 추출 워커 수를 설정합니다.
+
+        이미 생성된 client와 워커 풀에는 적용되지 않으므로 첫 요청 전에 호출해야 합니다.
+        """
+        self.timeout = httpx.Timeout(connect=connect_timeout, read=read_timeout, write=read_timeout, pool=read_timeout)
+        self.max_bytes = max_bytes
+        self.max_redirects = max_redirects
+        self.max_connections = max_connections
+        self.extract_workers = extract_workers
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers=DEFAULT_HEADERS,
+                timeout=self.timeout,
+                follow_redirects=True,
+                max_redirects=self.max_redirects,
+                limits=httpx.Limits(max_connections=self.max_connections),
+            )
+        return self._client
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.extract_workers, thread_name_prefix="jd-extract")
+        return self._executor
+
+    async def fetch(self, url: str, headers: dict | None = None) -> tuple[httpx.Response, bytes] | None:
+        """JD 페이지를 스트리밍으로 다운로드합니다.
+
+        (Response, 본문)을 반환하며(304이면 본문은 빈 bytes), 실패하거나 최대 크기를 넘으면 None을 반환합니다.
+        """
+        try:
+            async with self.client.stream("GET", url, headers=headers) as response:
+                if response.status_code == 304:
+                    self.counters["not_modified"] += 1
+                    return response, b""
+                response.raise_for_status()
+                declared = response.headers.get("content-length")
+                if declared is not None and declared.isdigit() and int(declared) > self.max_bytes:
+                    self.counters["too_large"] += 1
+                    print(f"JD page too large: {url} ({declared} bytes)")
+                    return None
+
+                body = bytearray()
+                async for chunk in response.aiter_bytes():
+                    body.extend(chunk)
+                    if len(body) > self.max_bytes:
+                        self.counters["too_large"] += 1
+                        print(f"JD page too large: {url} (>{self.max_bytes} bytes)")
+                        return None
+
+        except httpx.HTTPError as exc:
+            self.counters["failed"] += 1
+            print(f"JD fetch failed: {url} ({exc!r})")
+            return None
+
+        self.counters["fetched"] += 1
+        return response, bytes(body)
+
+    async def extract_markdown(self, html: bytes | str | None) -> tuple[str | None, str | None]:
+        """HTML을 디코딩하고 본문을 markdown으로 추출합니다. (워커 스레드 풀에서 실행)
+
+        Returns:
+            tuple[str | None, str | None]: (디코딩된 원본 HTML, 추출된 markdown)
+        """
+        if not html:
+            return None, None
+
+        def _extract():
+            text = decode_file(html)
+            return text, extract(text, output_format="markdown", with_metadata=True)
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, _extract)
+
+    async def fetch_markdown(self, url: str) -> str | None:
+        """JD URL의 markdown 본문을 반환합니다.
+
+        캐시된 페이지가 fresh 기간 내이면 네트워크 요청 없이 반환하고, 지났으면 조건부 요청으로 재검증합니다.
+        같은 URL에 대한 동시 요청은 하나의 다운로드로 합쳐집니다.
+        """
+        return await self.inflight.do(normalize_url(url), lambda: self._fetch_markdown(url))
+
+    async def _fetch_markdown(self, url: str) -> str | None:
+        page = await jd_cache.get_page(url)
+        if page is not None and jd_cache.is_fresh(page):
+            jd_cache.count("page_fresh_hits")
+            return page["markdown"]
+
+        headers = {}
+        if page is not None:
+            if page["etag"]:
+                headers["If-None-Match"] = page["etag"]
+            if page["last_modified"]:
+                headers["If-Modified-Since"] = page["last_modified"]
+
+        fetched = await self.fetch(url, headers=headers)
+        if fetched is None:
+            # 원본 서버 오류 시 만료된 캐시라도 사용
+            return page["markdown"] if page is not None else None
+
+        response, body = fetched
+        if response.status_code == 304 and page is not None:
+            jd_cache.count("page_revalidated")
+            await jd_cache.set_page(url, None, page["markdown"], page["etag"], page["last_modified"])
+            return page["markdown"]
+
+        raw, markdown = await self.extract_markdown(body)
+        if markdown is None:
+            return None
+        updated = await jd_cache.set_page(
+            url,
+            raw,
+            markdown,
+            response.headers.get("etag"),
+            response.headers.get("last-modified"),
+        )
+        if page is None:
+            jd_cache.count("page_misses")
+        elif page["markdown_hash"] != updated["markdown_hash"]:
+            jd_cache.count("page_changed")
+        else:
+            jd_cache.count("page_revalidated")
+        return markdown
+
+    async def aclose(self):
+        """client와 워커 풀을 정리합니다."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def stats(self) -> dict:
+        """다운로드 성공/미변경(304)/실패/크기 초과 카운터와 중복 요청 병합 통계를 반환합니다."""
+        return {**self.counters, "inflight": self.inflight.stats()}
+
+
+jd_fetcher = JDFetcher()
@@ -0,0 +1,129 @@
+"""LLM 응답 캐시 모듈
+
+체인의 모델 호출 단계를 감싸, (모델명, 생성 파라미터, 렌더링된 프롬프트, 프롬프트 템플릿 버전)의
+해시를 키로 LLM 응답을 캐시합니다. 저장소는 TwoTierCache(메모리 LRU + SQLite)를 사용합니다.
+"""
+import json
+import threading
+from typing import Callable
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.prompts import BasePromptTemplate
+from langchain_core.runnables import Runnable, RunnableConfig, RunnableLambda
+
+from src.core.cache import TwoTierCache
+from src.core.hashing import fingerprint, sha256_hex
+
+
+def template_version(prompt: BasePromptTemplate) -> str:
+    """프롬프트 템플릿 문자열로부터 버전 해시를 계산합니다. 템플릿이 바뀌면 기존 캐시는 자동으로 무효화됩니다."""
+    return sha256_hex(getattr(prompt, "template", None) or repr(prompt))[:16]
+
+
+def model_version(model: BaseChatModel) -> str:
+    """모델명과 생성 파라미터를 문자열로 반환합니다. 모델이나 파라미터가 바뀌면 기존 캐시는 자동으로 무효화됩니다."""
+    return json.dumps(getattr(model, "_identifying_params", {}), sort_keys=True, ensure_ascii=False, default=str)
+
+
+class LLMResponseCache:
+    """노드 별 opt-out과 적중률 집계를 지원하는 LLM 응답 캐시
+
+    저장소가 설정되지 않았거나(configure 호출 전) 비활성화된 노드는 캐시 없이 모델을 그대로 호출합니다.
+
+    예시:
+    ```python
+    llm_cache.configure(TwoTierCache("llm", "cache.sqlite", ...), disabled_labels={"EvaluateFitNode"})
+    chain = prompt | llm_cache.wrap(model | StrOutputParser(), model, prompt, "ResumeDecompositionNode")
+    ```
+    """
+
+    def __init__(self):
+        self.store: TwoTierCache | None = None
+        self.disabled_labels: set[str] = set()
+        self._lock = threading.Lock()
+        self._counters: dict[str, dict] = {}
+
+    def configure(self, store: TwoTierCache | None, disabled_labels=()):
+        """캐시 저장소와 캐시를 사용하지 않을 노드(label) 목록을 설정합니다."""
+        self.store = store
+        self.disabled_labels = set(disabled_labels)
+
+    def close(self):
+        """저장소를 닫고 캐시를 비활성화합니다."""
+        if self.store is not None:
+            self.store.close()
+        self.store = None
+
+    def wrap(
+        self,
+        runnable: Runnable,
+        model: BaseChatModel,
+        prompt: BasePromptTemplate,
+        label: str | None,
+        encode: Callable | None = None,
+        decode: Callable | None = None,
+    ) -> Runnable:
+        """모델 호출 runnable을 캐시 조회/저장 단계로 감쌉니다.
+
+        Args:
+            runnable (Runnable): PromptValue를 받아 응답을 반환하는 runnable (예: model | StrOutputParser())
+            model (BaseChatModel): 캐시 키에 모델명/생성 파라미터를 반영할 모델
+            prompt (BasePromptTemplate): 캐시 키에 템플릿 버전을 반영할 프롬프트
+            label (str | None): 적중률 집계 및 opt-out 단위 (보통 노드 클래스 이름, None이면 캐시 미사용)
+            encode (Callable | None): 응답을 JSON 값으로 변환 (None을 반환하면 저장하지 않음)
+            decode (Callable | None): 저장된 JSON 값을 응답으로 복원
+
+        Returns:
+            Runnable: 캐시가 적용된 runnable
+        """
+        if label is None:
+            return runnable
+
+        encode = encode or (lambda output: output)
+        decode = decode or (lambda value: value)
+        model_params = model_version(model)
+        version = template_version(prompt)
+
+        async def _cached_call(prompt_value, config: RunnableConfig):
+            if self.store is None or label in self.disabled_labels:
+                return await runnable.ainvoke(prompt_value, config)
+
+            key = fingerprint(model_params, version, prompt_value.to_string())
+            cached = await self.store.get(key)
+            if cached is not None:
+                self._count(label, "hits")
+                return decode(cached)
+
+            self._count(label, "misses")
+            output = await runnable.ainvoke(prompt_value, config)
+            value = encode(output)
+            if value is not None:
+                await self.store.set(key, value)
+            return output
+
+        return RunnableLambda(_cached_call, name=f"LLMCache[{label}]")
+
+    def _count(self, label: str, field: str):
+        with self._lock:
+            counter = self._counters.setdefault(label, {"hits": 0, "misses": 0})
+            counter[field] += 1
+
+    def stats(self) -> dict:
+        """노드(label) 별 적중/실패 수와 적중률, 저장소 통계를 반환합니다."""
+        with self._lock:
+            nodes = {
+                label: {
+                    **counter,
+                    "hit_ratio": round(counter["hits"] / (counter["hits"] + counter["misses"]), 4),
+                }
+                for label, counter in self._counters.items()
+            }
+        return {
+            "enabled": self.store is not None,
+            "disabled_nodes": sorted(self.disabled_labels),
+            "nodes": nodes,
+            "store": self.store.stats() if self.store is not None else None,
+        }
+
+
+llm_cache = LLMResponseCache()
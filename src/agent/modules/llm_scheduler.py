@@ -0,0 +1,273 @@
+"""LLM 호출 스케줄러 모듈
+
+프로세스 전체의 LLM 호출을 분당 요청 수(RPM)와 분당 토큰 수(TPM) 예산 안에서 실행합니다.
+예산은 토큰 버킷으로 관리하며, 대기 중인 호출은 우선순위 레인(interactive / batch) 별 대기열에 보관되어
+레인 가중치에 비례하여 번갈아 실행됩니다. (weighted fair queueing)
+배치 작업이 몰려도 대화형 요청은 자신의 몫만큼 먼저 실행되므로 429 응답과 재시도 지연을 피할 수 있습니다.
+"""
+import asyncio
+import contextvars
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from langchain_core.callbacks import UsageMetadataCallbackHandler
+from langchain_core.runnables import Runnable, RunnableConfig, RunnableLambda
+from langchain_core.runnables.config import merge_configs
+
+from src.core.stats import percentile
+
+
+INTERACTIVE = "interactive"
+BATCH = "batch"
+
+# 프롬프트 글자 수로 입력 토큰 수를 추정할 때의 글자/토큰 비율 (한국어 기준으로 보수적으로 설정)
+CHARS_PER_TOKEN = 2
+
+# 현재 실행 흐름의 레인 (asyncio task 생성 시 복사되므로 Workflow 노드까지 전달됨)
+current_lane: contextvars.ContextVar[str] = contextvars.ContextVar("llm_lane", default=INTERACTIVE)
+
+
+@contextmanager
+def use_lane(lane: str):
+    """블록 안에서 실행되는 LLM 호출의 레인을 지정합니다."""
+    token = current_lane.set(lane)
+    try:
+        yield
+    finally:
+        current_lane.reset(token)
+
+
+class TokenBucket:
+    """분당 예산(capacity)만큼 채워지는 토큰 버킷. 사용량 보정으로 잔량이 음수(부채)가 될 수 있습니다."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.level = float(per_minute)
+        self.updated = time.monotonic()
+
+    def refill(self, now: float):
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_seconds(self, cost: float) -> float:
+        """cost만큼 사용할 수 있을 때까지 남은 시간(초)을 반환합니다."""
+        cost = min(cost, self.capacity)
+        return 0.0 if self.level >= cost else (cost - self.level) / self.rate
+
+    def consume(self, cost: float):
+        self.level -= min(cost, self.capacity)
+
+    def adjust(self, delta: float):
+        self.level = min(self.capacity, self.level + delta)
+
+
+class _Lane:
+    def __init__(self, weight: float, window: int):
+        self.weight = weight
+        self.queue: deque[tuple[asyncio.Future, int, float]] = deque()
+        self.virtual_time = 0.0
+        self.waits: deque[float] = deque(maxlen=window)
+        self.counters = {"dispatched": 0, "cancelled": 0, "max_depth": 0}
+
+
+class LLMScheduler:
+    """RPM/TPM 토큰 버킷과 가중치 레인 대기열을 가진 비동기 LLM 호출 스케줄러
+
+    - 호출 전에 프롬프트 길이와 예상 출력 토큰 수로 토큰 사용량을 추정하여 예산에서 차감하고,
+      호출 후 실제 사용량(usage_metadata)과의 차이를 보정합니다.
+    - 레인 별 가상 시간(처리 횟수 / 가중치)이 가장 작은 레인의 호출부터 실행합니다.
+    - configure 호출 전에는 제한 없이 바로 실행합니다.
+
+    예시:
+    ```python
+    llm_scheduler.configure(requests_per_minute=1000, tokens_per_minute=1_000_000, weights={"interactive": 4, "batch": 1})
+    chain = prompt | llm_cache.wrap(llm_scheduler.wrap(model | StrOutputParser()), model, prompt, label)
+    with use_lane("batch"):
+        await chain.ainvoke(inputs)
+    ```
+    """
+
+    def __init__(self, window: int = 1000):
+        self.enabled = False
+        self.window = window
+        self.output_token_estimate = 1024
+        self.requests: TokenBucket | None = None
+        self.tokens: TokenBucket | None = None
+        self.lanes: dict[str, _Lane] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._virtual_time = 0.0
+        self._lock = threading.Lock()
+        self.counters = {"calls": 0, "throttled": 0, "estimated_tokens": 0, "actual_tokens": 0}
+
+    def configure(
+        self,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        weights: dict[str, float] | None = None,
+        output_token_estimate: int = 1024,
+    ):
+        """예산과 레인 가중치를 설정하고 스케줄링을 활성화합니다.
+
+        Args:
+            requests_per_minute (int): 분당 최대 호출 수
+            tokens_per_minute (int): 분당 최대 토큰 수 (입력 + 출력)
+            weights (dict[str, float] | None): 레인 별 가중치 (없으면 interactive 4, batch 1)
+            output_token_estimate (int): 호출 전 예산 차감에 사용할 예상 출력 토큰 수
+
+        Raises:
+            ValueError: interactive/batch 레인의 가중치가 없거나, 0 이하인 가중치가 있는 경우
+        """
+        weights = weights or {INTERACTIVE: 4, BATCH: 1}
+        # 알 수 없는 레인은 interactive로 처리하고, 가중치의 역수로 가상 시간을 계산하므로 서버 시작 시 검증
+        missing = [lane for lane in (INTERACTIVE, BATCH) if lane not in weights]
+        if missing:
+            raise ValueError(f"LLM lane weights must include {missing}: {weights!r}")
+        invalid = {lane: weight for lane, weight in weights.items() if not weight > 0}
+        if invalid:
+            raise ValueError(f"LLM lane weights must be positive: {invalid!r}")
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.output_token_estimate = output_token_estimate
+        self.lanes = {name: _Lane(weight, self.window) for name, weight in weights.items()}
+        self.enabled = True
+
+    def estimate_tokens(self, text: str) -> int:
+        """프롬프트 글자 수와 예상 출력 토큰 수로 호출 1회의 토큰 사용량을 추정합니다."""
+        return len(text) // CHARS_PER_TOKEN + self.output_token_estimate
+
+    async def acquire(self, lane: str, tokens: int):
+        """lane 대기열에 등록하고, 예산이 확보되어 차례가 올 때까지 기다립니다."""
+        if not self.enabled:
+            return
+        queue = self.lanes.get(lane) or self.lanes[INTERACTIVE]
+        if not queue.queue:
+            # 쉬고 있던 레인이 밀린 몫을 한꺼번에 가져가지 않도록 현재 가상 시간부터 시작
+            queue.virtual_time = max(queue.virtual_time, self._virtual_time)
+
+        future = asyncio.get_running_loop().create_future()
+        entry = (future, tokens, time.monotonic())
+        queue.queue.append(entry)
+        queue.counters["max_depth"] = max(queue.counters["max_depth"], len(queue.queue))
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if entry in queue.queue:
+                queue.queue.remove(entry)
+                queue.counters["cancelled"] += 1
+            elif future.done() and not future.cancelled():
+                # 차례를 받은 직후 취소되면 차감한 예산을 돌려줌
+                self.tokens.adjust(tokens)
+                self.requests.adjust(1)
+            self._dispatch()
+            raise
+
+    def settle(self, estimated_tokens: int, actual_tokens: int):
+        """호출 후 추정 토큰 수와 실제 사용량의 차이를 토큰 예산에 반영합니다."""
+        if not self.enabled:
+            return
+        self.tokens.adjust(estimated_tokens - actual_tokens)
+        with self._lock:
+            self.counters["estimated_tokens"] += estimated_tokens
+            self.counters["actual_tokens"] += actual_tokens
+        self._dispatch()
+
+    def _dispatch(self):
+        """예산이 허락하는 만큼 가상 시간이 가장 작은 레인의 맨 앞 호출부터 실행 차례를 부여합니다."""
+        now = time.monotonic()
+        self.requests.refill(now)
+        self.tokens.refill(now)
+        while True:
+            for lane in self.lanes.values():
+                while lane.queue and lane.queue[0][0].done():
+                    lane.queue.popleft()
+            active = [lane for lane in self.lanes.values() if lane.queue]
+            if not active:
+                return
+            lane = min(active, key=lambda item: item.virtual_time)
+            future, tokens, enqueued = lane.queue[0]
+
+            wait = max(self.requests.wait_seconds(1), self.tokens.wait_seconds(tokens))
+            if wait > 0:
+                self._schedule(wait)
+                return
+
+            lane.queue.popleft()
+            self.requests.consume(1)
+            self.tokens.consume(tokens)
+            lane.virtual_time += 1 / lane.weight
+            self._virtual_time = lane.virtual_time
+            waited_ms = (now - enqueued) * 1000
+            lane.waits.append(waited_ms)
+            lane.counters["dispatched"] += 1
+            with self._lock:
+                self.counters["calls"] += 1
+                if waited_ms >= 1:
+                    self.counters["throttled"] += 1
+            future.set_result(None)
+
+    def _schedule(self, delay: float):
+        if self._timer is not None and not self._timer.cancelled():
+            if self._timer.when() <= asyncio.get_running_loop().time() + delay:
+                return
+            self._timer.cancel()
+        self._timer = asyncio.get_running_loop().call_later(delay, self._wake)
+
+    def _wake(self):
+        self._timer = None
+        self._dispatch()
+
+    def wrap(self, runnable: Runnable) -> Runnable:
+        """모델 호출 runnable을 스케줄러 대기 단계로 감쌉니다.
+
+        Args:
+            runnable (Runnable): PromptValue를 받아 응답을 반환하는 runnable (예: model | StrOutputParser())
+
+        Returns:
+            Runnable: 실행 차례를 기다린 뒤 호출하고, 실제 토큰 사용량으로 예산을 보정하는 runnable
+        """
+
+        async def _scheduled_call(prompt_value, config: RunnableConfig):
+            if not self.enabled:
+                return await runnable.ainvoke(prompt_value, config)
+
+            estimated = self.estimate_tokens(prompt_value.to_string())
+            await self.acquire(current_lane.get(), estimated)
+            usage = UsageMetadataCallbackHandler()
+            try:
+                return await runnable.ainvoke(prompt_value, merge_configs(config, {"callbacks": [usage]}))
+            finally:
+                actual = sum(item.get("total_tokens", 0) for item in usage.usage_metadata.values())
+                self.settle(estimated, actual or estimated)
+
+        return RunnableLambda(_scheduled_call, name="LLMScheduler")
+
+    def stats(self) -> dict:
+        """레인 별 대기열 길이, 처리 수, 대기 시간 p50/p95와 예산 잔량, 토큰 추정 오차를 반환합니다."""
+        if not self.enabled:
+            return {"enabled": False}
+        with self._lock:
+            counters = dict(self.counters)
+        return {
+            "enabled": True,
+            **counters,
+            "requests_available": round(self.requests.level, 1),
+            "tokens_available": round(self.tokens.level, 1),
+            "lanes": {
+                name: {
+                    "weight": lane.weight,
+                    "queued": len(lane.queue),
+                    **lane.counters,
+                    "wait_ms_p50": percentile(list(lane.waits), 0.5),
+                    "wait_ms_p95": percentile(list(lane.waits), 0.95),
+                    "wait_ms_max": round(max(lane.waits), 1) if lane.waits else None,
+                }
+                for name, lane in self.lanes.items()
+            },
+        }
+
+
+llm_scheduler = LLMScheduler()
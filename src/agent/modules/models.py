@@ -1,27 +1,115 @@
 """모델 설정 함수 모듈
 
 기본적으로 사용할 모델 인스턴스를 설정하고 생성하고 반환시킵니다.
+생성된 모델 인스턴스는 ModelProvider에 (모델명, temperature, 설정값) 단위로 보관되어
+모든 체인이 같은 클라이언트(및 내부 커넥션)를 공유합니다.
 """
 import os
+import threading
 from dotenv import load_dotenv
+from langchain_core.callbacks import BaseCallbackHandler
 from langchain_google_genai import ChatGoogleGenerativeAI
 
 load_dotenv()
 
 
-def get_gemini_llm(temperature=0.2):
+DEFAULT_GEMINI_MODEL = "gemini-2.5-flash"
+
+
+class _InvocationCounter(BaseCallbackHandler):
+    """풀링된 클라이언트가 처리한 호출 수를 세는 콜백"""
+
+    def __init__(self, model: str, provider: "ModelProvider"):
+        self.model = model
+        self.provider = provider
+
+    def on_chat_model_start(self, serialized, messages, **kwargs):
+        self.provider._record_invocation(self.model)
+
+
+class ModelProvider:
+    """장기 유지되는 LLM 클라이언트 풀
+
+    같은 키로 요청된 모델은 최초 1회만 생성하고 이후에는 같은 인스턴스를 반환합니다.
+    """
+
+    def __init__(self):
+        self._models: dict[tuple, ChatGoogleGenerativeAI] = {}
+        self._lock = threading.Lock()
+        self._constructions: dict[str, int] = {}
+        self._reuses: dict[str, int] = {}
+        self._invocations: dict[str, int] = {}
+
+    @staticmethod
+    def _key(model: str, temperature: float, settings: dict) -> tuple:
+        return (model, temperature, tuple(sorted(settings.items())))
+
+    def get(self, model: str, temperature: float, **settings) -> ChatGoogleGenerativeAI:
+        """키에 해당하는 모델 인스턴스를 반환하고, 없으면 생성합니다.
+
+        Args:
+            model (str): Gemini 모델명
+            temperature (float): 모델의 창의성 정도를 조절하는 파라미터
+            **settings: ChatGoogleGenerativeAI에 전달할 추가 설정값 (hashable 값만 허용)
+        """
+        key = self._key(model, temperature, settings)
+        with self._lock:
+            instance = self._models.get(key)
+            if instance is not None:
+                self._reuses[model] = self._reuses.get(model, 0) + 1
+                return instance
+
+            api_key = os.getenv("GOOGLE_API_KEY")
+            if not api_key:
+                raise ValueError("GOOGLE_API_KEY not found in environment variables. Please set it in .env file.")
+
+            instance = ChatGoogleGenerativeAI(
+                model=model,
+                temperature=temperature,
+                google_api_key=api_key,
+                callbacks=[_InvocationCounter(model, self)],
+                **settings
+            )
+            self._models[key] = instance
+            self._constructions[model] = self._constructions.get(model, 0) + 1
+            return instance
+
+    def _record_invocation(self, model: str):
+        with self._lock:
+            self._invocations[model] = self._invocations.get(model, 0) + 1
+
+    def clear(self):
+        """보관 중인 모델 인스턴스를 모두 비웁니다."""
+        with self._lock:
+            self._models.clear()
+
+    def stats(self) -> dict:
+        """모델 별 클라이언트 생성 횟수와 재사용 횟수를 반환합니다.
+
+        invocations는 풀링된 클라이언트(기존 커넥션)로 처리된 LLM 호출 수입니다.
+        요청이 늘어도 constructions가 증가하지 않으면 클라이언트가 재사용되고 있는 것입니다.
+        """
+        with self._lock:
+            return {
+                "pooled_clients": len(self._models),
+                "constructions": dict(self._constructions),
+                "reuses": dict(self._reuses),
+                "invocations": dict(self._invocations),
+            }
+
+
+model_provider = ModelProvider()
+
+
+def get_gemini_llm(temperature=0.2, model=DEFAULT_GEMINI_MODEL, **settings):
     """
-    LangChain에서 사용할 Gemini 모델을 초기화하여 번환합니다.
+    LangChain에서 사용할 Gemini 모델을 번환합니다.
     환경변수에서 GOOGLE_API_KEY를 가져와 사용하기 때문에, .env 파일에 유효한 API 키가 설정되어 있어야 합니다.
+    같은 설정으로 여러 번 호출해도 ModelProvider에 보관된 하나의 인스턴스를 공유합니다.
 
     Args:
-        temperature: 모델의 창의성 정도를 조절하는 파라미터 (기본값:0.5)
+        temperature: 모델의 창의성 정도를 조절하는 파라미터 (기본값:0.2)
+        model: 사용할 Gemini 모델명 (기본값: gemini-2.5-flash)
+        **settings: ChatGoogleGenerativeAI에 전달할 추가 설정값
     """
-    api_key = os.getenv("GOOGLE_API_KEY")
-    if not api_key:
-        raise ValueError("GOOGLE_API_KEY not found in environment variables. Please set it in .env file.")
-
-    return ChatGoogleGenerativeAI(
-        model="gemini-2.5-flash",
-        google_api_key=api_key
-    )
\ No newline at end of file
+    return model_provider.get(model, temperature, **settings)
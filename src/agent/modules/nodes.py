@@ -3,14 +3,38 @@
 
 해당 클래스 모듈은 각각 노드 클래스가 BaseNode를 상속받아 노드 클래스를 구현하는 모듈입니다.
 """
+import asyncio
+import time
+
 import json_repair
+from langchain_core.callbacks import get_usage_metadata_callback
 
 from src.agent.utils.base_node import BaseNode
+from src.agent.utils.llm_usage import resume_extraction_usage
 import src.agent.modules.chains as chains
-from src.agent.modules.states import AgentState
+from src.agent.modules.states import AgentState, merge_dict, validate_resume_details
 import src.agent.modules.prompts as prompts
+from src.agent.modules.jd_fetcher import jd_fetcher
+from src.agent.modules.jd_cache import jd_cache, markdown_hash
+from src.agent.modules.blob_store import blob_store
+from src.agent.modules.llm_cache import model_version, template_version
+from src.agent.modules.models import get_gemini_llm
+from src.agent.modules.resume_segments import resume_segmenter
+from src.core.hashing import fingerprint
+
+
+async def _ainvoke_with_usage(chain, inputs: dict, label: str):
+    """체인을 호출하고 토큰 사용량과 지연 시간을 이력서 추출 집계기에 기록합니다."""
+    started = time.perf_counter()
+    with get_usage_metadata_callback() as usage:
+        response = await chain.ainvoke(inputs)
+    resume_extraction_usage.record(label, usage.usage_metadata, (time.perf_counter() - started) * 1000)
+    return response
 
-from trafilatura import fetch_url, extract
+
+def _segment_hash(node, resume: str) -> dict:
+    """추출에 성공한 노드의 작업 이름과 입력 섹션 해시를 resume_segments 업데이트로 반환합니다."""
+    return {node.segment_task: resume_segmenter.task_hashes(resume)[node.segment_task]}
 
 
 """
@@ -26,9 +50,9 @@ class JDUrlToMarkdown(BaseNode):
         job_description (str): 채용공고 전문 markdown text
     """
     async def execute(self, state: AgentState) -> dict:
-        downloaded = fetch_url(state["jd_url"])
-        result = extract(downloaded, output_format="markdown", with_metadata=True)
-        return {"job_description": result}
+        result = await jd_fetcher.fetch_markdown(state["jd_url"])
+        # 채용공고 전문은 blob 저장소에 한 번만 저장하고 상태에는 참조만 기록
+        return {"job_description": await blob_store.put(result)}
     
 
 """
@@ -43,20 +67,29 @@ class ResumeDecompositionNode(BaseNode):
     Returns:
         resume_details (TypedDict): 이력서 분해 결과
     """
+    segment_task = "resume"
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.prompt = prompts.get_resume_prompt()
-        self.chain = chains.set_decomposition_chain(self.prompt)
+        self.chain = chains.set_decomposition_chain(self.prompt, cache_label=self.name)
 
     async def execute(self, state: AgentState) -> dict:
         prompt_chain = self.chain
-        response = await prompt_chain.ainvoke(
+        resume = await blob_store.resolve(state["resume"])
+        response = await _ainvoke_with_usage(
+            prompt_chain,
             {
-                "resume": state["resume"]
-            }
+                "resume": resume
+            },
+            "multi",
         )
         result = json_repair.loads(response)
-        return {"resume_details": result}
+        if not isinstance(result, dict):
+            return {"resume_details": result}
+        # experiences/projects는 병렬 실행되는 전용 노드가 기록하므로 덮어쓰지 않음
+        result = {k: v for k, v in result.items() if k not in ("experiences", "projects")}
+        return {"resume_details": result, "resume_segments": _segment_hash(self, resume)}
 
 
 class ResumeExperiencesNode(BaseNode):
@@ -68,20 +101,27 @@ class ResumeExperiencesNode(BaseNode):
     Returns:
         resume_details (TypedDict): 이력서 분해 결과
     """
+    segment_task = "experiences"
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.prompt = prompts.get_experiences_prompt()
-        self.chain = chains.set_decomposition_chain(self.prompt)
+        self.chain = chains.set_decomposition_chain(self.prompt, cache_label=self.name)
 
     async def execute(self, state: AgentState) -> dict:
         prompt_chain = self.chain
-        response = await prompt_chain.ainvoke(
+        resume = await blob_store.resolve(state["resume"])
+        response = await _ainvoke_with_usage(
+            prompt_chain,
             {
-                "resume": state["resume"]
-            }
+                "resume": resume
+            },
+            "multi",
         )
         result = json_repair.loads(response)
-        return {"resume_details": {"experiences": result}}
+        if not isinstance(result, list):
+            return {"resume_details": {"experiences": result}}
+        return {"resume_details": {"experiences": result}, "resume_segments": _segment_hash(self, resume)}
 
 
 class ResumeProjectsNode(BaseNode):
@@ -93,21 +133,79 @@ class ResumeProjectsNode(BaseNode):
     Returns:
         resume_details (TypedDict): 이력서 분해 결과
     """
+    segment_task = "projects"
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.prompt = prompts.get_projects_prompt()
-        self.chain = chains.set_decomposition_chain(self.prompt)
+        self.chain = chains.set_decomposition_chain(self.prompt, cache_label=self.name)
 
     async def execute(self, state: AgentState) -> dict:
         prompt_chain = self.chain
-        response = await prompt_chain.ainvoke(
+        resume = await blob_store.resolve(state["resume"])
+        response = await _ainvoke_with_usage(
+            prompt_chain,
             {
-                "resume": state["resume"]
-            }
+                "resume": resume
+            },
+            "multi",
         )
         result = json_repair.loads(response)
+        if not isinstance(result, list):
+            return {"resume_details": {"projects": result}}
+        return {"resume_details": {"projects": result}, "resume_segments": _segment_hash(self, resume)}
+
 
-        return{"resume_details": {"projects": result}}
+class ResumeStructuredExtractionNode(BaseNode):
+    """이력서 전체(ResumeDict)를 한 번의 구조화 출력 호출로 추출하는 노드
+
+    결과가 ResumeDict 스키마 검증에 실패한 경우에만 기존 3회 호출 경로
+    (ResumeDecompositionNode, ResumeExperiencesNode, ResumeProjectsNode)로 대체합니다.
+
+    Args:
+        resume (str): 이력서 전체 string
+
+    Returns:
+        resume_details (TypedDict): 이력서 분해 결과
+    """
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.prompt = prompts.get_full_resume_prompt()
+        self.chain = chains.set_structured_resume_chain(self.prompt, cache_label=self.name)
+        self.fallback_nodes = [
+            ResumeDecompositionNode(**kwargs),
+            ResumeExperiencesNode(**kwargs),
+            ResumeProjectsNode(**kwargs),
+        ]
+
+    async def execute(self, state: AgentState) -> dict:
+        started = time.perf_counter()
+        resume = await blob_store.resolve(state["resume"])
+        response = await self.chain.ainvoke(
+            {
+                "resume": resume
+            }
+        )
+        result = response.get("parsed")
+        valid = validate_resume_details(result)
+
+        # include_raw=True로 받은 원본 AIMessage에서 토큰 사용량을 기록
+        raw_usage = getattr(response.get("raw"), "usage_metadata", None) or {}
+        resume_extraction_usage.record(
+            "single" if valid else "single_rejected",
+            {"structured": raw_usage},
+            (time.perf_counter() - started) * 1000,
+        )
+        if valid:
+            return {"resume_details": result, "resume_segments": resume_segmenter.task_hashes(resume)}
+
+        self.logging("execute", fallback=True, parsing_error=response.get("parsing_error"))
+        updates = await asyncio.gather(*(node.execute(state) for node in self.fallback_nodes))
+        resume_details, resume_segments = None, {}
+        for update in updates:
+            resume_details = merge_dict(resume_details, update["resume_details"])
+            resume_segments = merge_dict(resume_segments, update.get("resume_segments"))
+        return {"resume_details": resume_details, "resume_segments": resume_segments}
 
 
 class ResumeCompanyProjectsNode(BaseNode):
@@ -184,16 +282,32 @@ class JDDecompositionNode(BaseNode):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.prompt = prompts.get_jd_prompt()
-        self.chain = chains.set_jd_chain(self.prompt)
+        self.model = get_gemini_llm()
+        self.chain = chains.set_jd_chain(self.prompt, self.model, cache_label=self.name)
+
+    def details_key(self, job_description: str) -> str | None:
+        """분해 결과 캐시 키. 프롬프트나 모델이 바뀌면 이전 분해 결과를 재사용하지 않습니다."""
+        digest = markdown_hash(job_description)
+        if digest is None:
+            return None
+        return fingerprint("jd_details", template_version(self.prompt), model_version(self.model), digest)
 
     async def execute(self, state: AgentState) -> dict:
+        # 같은 내용의 채용공고는 이전 분해 결과를 재사용 (프롬프트/모델이 같을 때만)
+        job_description = await blob_store.resolve(state["job_description"])
+        key = self.details_key(job_description)
+        cached = await jd_cache.get_details(key)
+        if cached is not None:
+            return {"jd_details": cached}
+
         prompt_chain = self.chain
         response = await prompt_chain.ainvoke(
             {
-                "job_description": state["job_description"]
+                "job_description": job_description
             }
         )
         result = json_repair.loads(response)
+        await jd_cache.set_details(key, result)
         return {"jd_details": result}
     
 
@@ -208,11 +322,18 @@ class EvaluateResumeNode(BaseNode):
 
     Returns:
         applicant_skills (str): 이력서 평가 결과
+        applicant_skills_fingerprint (str): 평가에 사용한 입력과 프롬프트 버전의 fingerprint
     """
+    output_key = "applicant_skills"
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.prompt = prompts.get_skills_analysis_prompt()
-        self.chain = chains.set_resume_evaluation_chain(self.prompt)
+        self.chain = chains.set_resume_evaluation_chain(self.prompt, cache_label=self.name)
+
+    def input_fingerprint(self, state: AgentState) -> str:
+        """평가 입력(resume_details)과 프롬프트 버전의 fingerprint. 같으면 저장된 평가 결과를 재사용할 수 있습니다."""
+        return fingerprint(self.name, template_version(self.prompt), state.get("resume_details"))
 
     async def execute(self, state: AgentState) -> dict:
         prompt_chain = self.chain
@@ -222,7 +343,10 @@ class EvaluateResumeNode(BaseNode):
             }
         )
 
-        return{"applicant_skills": response}
+        return {
+            "applicant_skills": await blob_store.put(response),
+            "applicant_skills_fingerprint": self.input_fingerprint(state),
+        }
     
 
 class EvaluateFitNode(BaseNode):
@@ -232,12 +356,19 @@ class EvaluateFitNode(BaseNode):
         resume_details (TypedDict): 이력서 분해 결과
 
     Returns:
-        applicant_skills (str): 이력서 평가 결과
+        applicant_recruitment (str): 핏 분석 결과
+        applicant_recruitment_fingerprint (str): 평가에 사용한 입력과 프롬프트 버전의 fingerprint
     """
+    output_key = "applicant_recruitment"
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.prompt = prompts.get_recruit_analysis_prompt()
-        self.chain = chains.set_recruit_evaluation_chain(self.prompt)
+        self.chain = chains.set_recruit_evaluation_chain(self.prompt, cache_label=self.name)
+
+    def input_fingerprint(self, state: AgentState) -> str:
+        """평가 입력(jd_details, resume_details)과 프롬프트 버전의 fingerprint"""
+        return fingerprint(self.name, template_version(self.prompt), state.get("jd_details"), state.get("resume_details"))
 
     async def execute(self, state: AgentState) -> dict:
         prompt_chain = self.chain
@@ -259,4 +390,7 @@ class EvaluateFitNode(BaseNode):
 
         response = await prompt_chain.ainvoke(context)
 
-        return{"applicant_recruitment": response}
\ No newline at end of file
+        return {
+            "applicant_recruitment": await blob_store.put(response),
+            "applicant_recruitment_fingerprint": self.input_fingerprint(state),
+        }
\ No newline at end of file
@@ -108,6 +108,51 @@ def get_experiences_prompt() -> str:
     )
 
 
+def get_full_resume_prompt() -> str:
+    """이력서의 키워드, 경력, 프로젝트를 한 번에 추출하는 프롬프트 (단일 호출 추출 모드)
+
+    Args:
+        resume (str): 이력서 전체 string
+
+    Returns:
+        이력서 통합 추출 프롬프트 (PromptTemplate)
+    """
+    template = """# Role
+    너는 이력서를 토대로 지원자의 직무 유형, 기술 스택, 경력, 프로젝트, 특이사항을 추출하는 채용 도우미다.
+    이력서는 <Resume>를 참고하고, 추출한 내용은 <Style>의 양식에 맞게 작성하라.
+    이 때, 사이드 프로젝트 뿐만 아니라 회사에서 진행한 프로젝트까지 모두 projects에 추출하라.
+
+    # Resume
+    {resume}
+
+    # Style
+    - position: 직무 유형(AI 엔지니어, ML 엔지니어, DevOps 엔지니어, ML 리서처, Backend 엔지니어 등)
+    - tech_stacks: 기술 스택(사용하는 언어와 프레임워크, 라이브러리 등; Python, Go, React, Node.js, Kubernetes, Docker, Langchain 등)
+    - years: 지원자의 경력 년차(인턴은 경력으로 분류하지 않는다. 무경력일 경우 0)
+    - awards: 수상 내역
+    - certifications: 자격증
+    - publications: 논문 및 출판물
+    - etcetra: 특이사항(병역특례, 보훈유공자 등)
+    - experiences: 경력 사항 목록
+        - company(str): 재직한 회사의 이름(회사 설명이 아닌 이름만 추출할 것. Markdown format을 고려하여 추정되는 고유명사를 추출할 것.)
+        - period(int): 해당 회사의 근속 년수. 단위는 year. 기재되지 않았을 시 'None'
+        - role(str): 해당 직장에서 담당한 직무명
+        - projects: 빈 리스트로 둘 것
+    - projects: 프로젝트 목록
+        - title(str): 진행한 프로젝트 이름
+        - achievements(List[str]): 해당 프로젝트에서 달성한 성과들
+        - period(int): 해당 프로젝트의 개발 기간. 단위는 month. 기재되지 않았을 시 'None'
+        - role(str): 해당 프로젝트에서 담당한 직무명
+        - team(bool): 협업 여부 (1인 개발한 프로젝트이면 False)
+        - company(Optional[str]): 프로젝트를 진행한 회사의 이름(이름만 추출할 것. 없을 경우 None)
+    """
+
+    return PromptTemplate(
+        template=template,
+        input_variables=["resume"]
+    )
+
+
 """
 Step 2. JD 관련 프롬프트
 """
@@ -0,0 +1,117 @@
+"""이력서 섹션 분할 모듈
+
+Parse API가 반환한 이력서 markdown을 제목(#) 기준으로 섹션으로 나누고, 섹션 종류 별로 묶어
+이력서 추출 작업(키워드 / 경력 / 프로젝트) 별 입력 해시를 계산합니다.
+수정된 이력서를 다시 업로드했을 때 해시가 바뀐 추출 작업만 다시 실행하는 데 사용합니다.
+
+- experiences: 경력/재직 섹션 → 경력 추출 작업
+- projects: 프로젝트/포트폴리오 섹션 → 프로젝트 추출 작업
+- profile: 그 외 섹션(인적사항, 기술, 수상, 자격증, 학력 등) → 키워드 추출 작업
+  (경력 년차와 직무를 함께 추출하므로 키워드 추출은 profile과 experiences 섹션 모두에 의존합니다)
+"""
+import re
+import threading
+
+from src.core.hashing import fingerprint
+
+
+# 추출 작업 이름 (각 추출 노드의 segment_task)
+RESUME_TASK = "resume"
+EXPERIENCES_TASK = "experiences"
+PROJECTS_TASK = "projects"
+TASKS = (RESUME_TASK, EXPERIENCES_TASK, PROJECTS_TASK)
+
+HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+
+# 제목 키워드로 섹션 종류를 판별 (프로젝트를 먼저 확인: "프로젝트 경험"은 projects)
+SECTION_KEYWORDS = (
+    ("projects", ("프로젝트", "포트폴리오", "project", "portfolio")),
+    ("experiences", ("경력", "재직", "경험", "career", "experience", "employment", "work history")),
+)
+
+
+def _classify(title: str) -> str | None:
+    title = title.lower()
+    for kind, keywords in SECTION_KEYWORDS:
+        if any(keyword in title for keyword in keywords):
+            return kind
+    return None
+
+
+def split_sections(markdown: str) -> dict[str, list[str]]:
+    """markdown을 섹션 종류(profile, experiences, projects) 별 정규화된 줄 목록으로 나눕니다.
+
+    하위 제목(### 회사명 등)은 키워드가 없으면 상위 섹션의 종류를 따릅니다.
+    공백만 다른 수정은 결과가 같도록 각 줄의 앞뒤 공백과 빈 줄을 제거합니다.
+    """
+    sections: dict[str, list[str]] = {"profile": [], "experiences": [], "projects": []}
+    stack: list[tuple[int, str]] = []   # (제목 레벨, 섹션 종류)
+    for line in markdown.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        match = HEADING_PATTERN.match(line)
+        if match:
+            level = len(match.group(1))
+            while stack and stack[-1][0] >= level:
+                stack.pop()
+            kind = _classify(match.group(2)) or (stack[-1][1] if stack else "profile")
+            stack.append((level, kind))
+        sections[stack[-1][1] if stack else "profile"].append(line)
+    return sections
+
+
+class ResumeSegmenter:
+    """추출 작업 별 입력 해시 계산 및 증분 추출 집계기
+
+    예시:
+    ```python
+    hashes = resume_segmenter.task_hashes(resume)
+    tasks = resume_segmenter.plan(hashes, state.get("resume_segments"), has_details=bool(state.get("resume_details")))
+    ```
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters = {"plans": 0, "unstructured": 0, "tasks_run": 0, "tasks_skipped": 0}
+
+    def task_hashes(self, markdown: str) -> dict[str, str]:
+        """추출 작업 별 입력 해시를 반환합니다.
+
+        경력 또는 프로젝트 섹션을 찾지 못하면(제목이 없는 이력서 등) 섹션 구분을 신뢰할 수 없으므로
+        모든 작업이 이력서 전체에 의존하는 것으로 봅니다.
+        """
+        sections = split_sections(markdown or "")
+        if not sections["experiences"] or not sections["projects"]:
+            whole = fingerprint("full", markdown or "")
+            return {task: whole for task in TASKS}
+        return {
+            RESUME_TASK: fingerprint(RESUME_TASK, sections["profile"], sections["experiences"]),
+            EXPERIENCES_TASK: fingerprint(EXPERIENCES_TASK, sections["experiences"]),
+            PROJECTS_TASK: fingerprint(PROJECTS_TASK, sections["projects"]),
+        }
+
+    def plan(self, hashes: dict[str, str], previous: dict[str, str] | None, has_details: bool) -> list[str]:
+        """다시 실행할 추출 작업 목록을 반환합니다. (이전 추출 결과가 없으면 모든 작업)
+
+        ResumeCompanyProjectsNode가 경력과 프로젝트를 함께 재구성하므로, 둘 중 하나라도 바뀌면 둘 다 다시 추출합니다.
+        """
+        previous = previous or {}
+        changed = {task for task in TASKS if not has_details or previous.get(task) != hashes[task]}
+        if changed & {EXPERIENCES_TASK, PROJECTS_TASK}:
+            changed |= {EXPERIENCES_TASK, PROJECTS_TASK}
+        tasks = [task for task in TASKS if task in changed]
+        with self._lock:
+            self.counters["plans"] += 1
+            self.counters["unstructured"] += int(len(set(hashes.values())) == 1)
+            self.counters["tasks_run"] += len(tasks)
+            self.counters["tasks_skipped"] += len(TASKS) - len(tasks)
+        return tasks
+
+    def stats(self) -> dict:
+        """증분 추출 계획 수와 다시 실행/건너뛴 추출 작업 수를 반환합니다."""
+        with self._lock:
+            return dict(self.counters)
+
+
+resume_segmenter = ResumeSegmenter()
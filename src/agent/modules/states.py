@@ -7,9 +7,16 @@ from typing import Annotated, TypedDict, List, NotRequired
 
 
 def merge_dict(existing: dict, new: dict) -> dict:
-    """states.py의 기존값 유지를 위한 리듀서"""
+    """states.py의 기존값 유지를 위한 리듀서
+
+    병렬 노드들의 부분 업데이트가 같은 super-step에 합쳐지므로,
+    입력을 변경하지 않고 항상 새 dict를 반환하며 dict가 아닌 업데이트(LLM 파싱 실패 등)는 무시합니다.
+    각 노드는 서로 다른 키만 기록하므로 병합 순서와 무관하게 결과가 같습니다.
+    """
+    if not isinstance(new, dict):
+        return existing if existing is not None else {}
     if existing is None:
-        return new
+        return dict(new)
     return {**existing, **new}
 
 
@@ -36,6 +43,7 @@ class ExperiencesDict(TypedDict):
 Resume && JD schema
 """
 class ResumeDict(TypedDict):
+    """이력서 분해 결과"""
     position: str                   # 직무 유형
     tech_stacks: str                # 기술 스택
     years: int                      # 경력 년차
@@ -47,6 +55,25 @@ class ResumeDict(TypedDict):
     projects: List[ProjectAndAchievementsDict]   # 프로젝트
 
 
+def validate_resume_details(data) -> bool:
+    """ResumeDict 스키마에 맞는 구조인지 검사합니다.
+
+    필수 키 존재 여부와 experiences/projects 항목의 구조를 확인합니다.
+    experiences의 projects는 ResumeCompanyProjectsNode가 채우므로 검사하지 않습니다.
+    """
+    if not isinstance(data, dict) or not ResumeDict.__required_keys__ <= data.keys():
+        return False
+
+    for key, item_schema in (("experiences", ExperiencesDict), ("projects", ProjectAndAchievementsDict)):
+        items = data[key]
+        if not isinstance(items, list):
+            return False
+        required = item_schema.__required_keys__ - {"projects"}
+        if not all(isinstance(item, dict) and required <= item.keys() for item in items):
+            return False
+    return True
+
+
 class JobDescriptionDict(TypedDict):
     title: str                  # 직무명
     company: str                # 회사명
@@ -78,6 +105,13 @@ class AgentState(TypedDict):
     resume_details: Annotated[ResumeDict, merge_dict]
     jd_details: JobDescriptionDict
 
+    # 이력서 추출 작업 별 입력 섹션 해시 (수정된 이력서에서 바뀐 섹션의 추출 작업만 다시 실행)
+    resume_segments: Annotated[dict, merge_dict]
+
     # 지원자 평가 관련 항목
     applicant_skills: str
-    applicant_recruitment: str
\ No newline at end of file
+    applicant_recruitment: str
+
+    # 평가 결과를 만든 입력(+ 프롬프트 버전)의 fingerprint (같으면 평가를 다시 실행하지 않음)
+    applicant_skills_fingerprint: str
+    applicant_recruitment_fingerprint: str
\ No newline at end of file
@@ -0,0 +1,121 @@
+"""Workflow Registry 모듈
+서버 시작 시 모든 Workflow를 한 번만 빌드/컴파일하여 보관합니다.
+요청마다 StateGraph, 노드, 프롬프트, 체인을 다시 생성하지 않도록 컴파일된 그래프를 재사용합니다.
+"""
+import time
+
+from langgraph.graph.state import CompiledStateGraph
+
+import src.agent.workflow as wk
+from src.agent.modules.states import AgentState
+
+
+# 레지스트리에 등록할 Workflow 클래스 목록
+WORKFLOWS = (
+    wk.OneclickResumeWorkflow,
+    wk.OneclickFitWorkflow,
+    wk.PreprocessResumeWorkflow,
+    wk.PreprocessJDWorkflow,
+    wk.AnalyzeResumeWorkflow,
+    wk.AnalyzeFitWorkflow,
+)
+
+# 이력서 추출 단계를 포함하여 extraction_mode를 받는 Workflow 목록
+RESUME_WORKFLOWS = (
+    wk.OneclickResumeWorkflow,
+    wk.OneclickFitWorkflow,
+    wk.PreprocessResumeWorkflow,
+)
+
+
+class WorkflowRegistry:
+    """컴파일된 Workflow 그래프 저장소
+
+    예시:
+    ```python
+    registry = WorkflowRegistry.build(checkpointer)
+    work = registry.get("PreprocessResumeWorkflow")
+    await work.ainvoke(initial_state, config=config)
+    ```
+    """
+
+    def __init__(self):
+        self._graphs: dict[str, CompiledStateGraph] = {}
+        self._build_ms: dict[str, float] = {}
+        self._hits: dict[str, int] = {}
+
+    @classmethod
+    def build(
+        cls,
+        checkpointer: any,
+        workflows=WORKFLOWS,
+        extraction_mode: str = "multi",
+        extraction_mode_overrides: dict[str, str] | None = None,
+    ) -> "WorkflowRegistry":
+        """모든 Workflow를 빌드 및 컴파일하여 레지스트리를 생성합니다.
+
+        Args:
+            checkpointer: 모든 그래프가 공유할 Checkpointer
+            workflows: 등록할 Workflow 클래스 목록
+            extraction_mode (str): 이력서 추출 모드 기본값 ("multi" 또는 "single")
+            extraction_mode_overrides (dict[str, str] | None): Workflow 이름 별 이력서 추출 모드
+
+        Returns:
+            WorkflowRegistry: 컴파일된 그래프가 등록된 레지스트리
+        """
+        overrides = extraction_mode_overrides or {}
+        registry = cls()
+        for workflow_cls in workflows:
+            options = {}
+            if workflow_cls in RESUME_WORKFLOWS:
+                options["extraction_mode"] = overrides.get(workflow_cls.__name__, extraction_mode)
+
+            started = time.perf_counter()
+            graph = workflow_cls(AgentState, **options).build()
+            registry.register(
+                workflow_cls.__name__,
+                graph.compile(checkpointer=checkpointer),
+                (time.perf_counter() - started) * 1000,
+            )
+        return registry
+
+    def register(self, name: str, work: CompiledStateGraph, build_ms: float = 0.0):
+        """컴파일된 그래프를 이름으로 등록합니다."""
+        self._graphs[name] = work
+        self._build_ms[name] = build_ms
+        self._hits[name] = 0
+
+    def get(self, name: str) -> CompiledStateGraph:
+        """등록된 컴파일 그래프를 반환합니다.
+
+        Args:
+            name (str): Workflow 클래스 이름
+
+        Raises:
+            KeyError: 등록되지 않은 Workflow 이름
+        """
+        work = self._graphs[name]
+        self._hits[name] += 1
+        return work
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._graphs
+
+    def stats(self) -> dict:
+        """Workflow 별 빌드 비용과 재사용 횟수를 반환합니다.
+
+        saved_ms는 레지스트리가 없었다면 요청마다 추가로 소모했을 그래프 구축 시간의 누적값입니다.
+        """
+        workflows = {
+            name: {
+                "build_ms": round(self._build_ms[name], 3),
+                "requests": self._hits[name],
+                "saved_ms": round(self._build_ms[name] * self._hits[name], 3),
+            }
+            for name in self._graphs
+        }
+        return {
+            "graphs": workflows,
+            "total_build_ms": round(sum(self._build_ms.values()), 3),
+            "total_saved_ms": round(sum(w["saved_ms"] for w in workflows.values()), 3),
+        }
@@ -1,5 +1,11 @@
+import time
 from abc import ABC, abstractmethod
 
+from langchain_core.runnables import RunnableConfig
+
+from src.core.admission import node_latency
+from src.core.progress import progress_broker
+
 
 class BaseNode(ABC):
     """
@@ -62,16 +68,25 @@ class BaseNode(ABC):
             for key, value in kwargs.items():
                 print(f"{key}: {value}")  # 추가 정보 출력
 
-    async def __call__(self, state):
+    async def __call__(self, state, config: RunnableConfig):
         """
         노드를 함수처럼 호출 가능하게 만드는 메서드
 
         LangGraph에서 노드를 직접 호출할 때 사용됩니다.
+        실행 전후로 thread_id 단위의 진행 상황 이벤트(노드 이름, 소요 시간, 기록한 상태 키)를 발행하고,
+        성공한 실행의 소요 시간을 요청 수락 제어의 혼잡 신호(노드 지연 시간 EWMA)에 반영합니다.
 
         Args:
             state: 현재 그래프 상태 객체
+            config (RunnableConfig): LangGraph가 전달하는 실행 설정 (thread_id 포함)
 
         Returns:
             dict: execute 메서드의 결과
         """
-        return await self.execute(state)
+        thread_id = (config or {}).get("configurable", {}).get("thread_id")
+        started = time.perf_counter()
+        async with progress_broker.track(thread_id, self.name) as step:
+            result = await self.execute(state)
+            step["keys"] = list(result or {})
+        node_latency.record(self.name, (time.perf_counter() - started) * 1000)
+        return result
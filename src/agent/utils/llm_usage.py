@@ -0,0 +1,58 @@
+"""LLM 사용량 집계 모듈
+전략(label) 별 LLM 호출 수, 입력/출력 토큰, 지연 시간을 집계합니다.
+"""
+import threading
+
+
+class LLMUsageTracker:
+    """label 별 토큰 사용량과 지연 시간 집계기
+
+    예시:
+    ```python
+    with get_usage_metadata_callback() as cb:
+        await chain.ainvoke(inputs)
+    usage_tracker.record("multi", cb.usage_metadata, latency_ms)
+    ```
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: dict[str, dict] = {}
+
+    def record(self, label: str, usage_metadata: dict, latency_ms: float):
+        """한 번의 실행 결과를 집계합니다.
+
+        Args:
+            label (str): 집계 단위 (예: "single", "multi")
+            usage_metadata (dict): {모델명: UsageMetadata} 형태의 사용량
+            latency_ms (float): 실행 시간(ms)
+        """
+        input_tokens = sum(u.get("input_tokens", 0) for u in usage_metadata.values())
+        output_tokens = sum(u.get("output_tokens", 0) for u in usage_metadata.values())
+        with self._lock:
+            stat = self._stats.setdefault(
+                label,
+                {"runs": 0, "input_tokens": 0, "output_tokens": 0, "latency_ms": 0.0},
+            )
+            stat["runs"] += 1
+            stat["input_tokens"] += input_tokens
+            stat["output_tokens"] += output_tokens
+            stat["latency_ms"] += latency_ms
+
+    def stats(self) -> dict:
+        """label 별 누적값과 실행 1회당 평균값을 반환합니다."""
+        with self._lock:
+            return {
+                label: {
+                    **stat,
+                    "latency_ms": round(stat["latency_ms"], 3),
+                    "avg_input_tokens": round(stat["input_tokens"] / stat["runs"], 1),
+                    "avg_output_tokens": round(stat["output_tokens"] / stat["runs"], 1),
+                    "avg_latency_ms": round(stat["latency_ms"] / stat["runs"], 3),
+                }
+                for label, stat in self._stats.items()
+            }
+
+
+# 이력서 추출 전략(single / multi) 비교용 집계기
+resume_extraction_usage = LLMUsageTracker()
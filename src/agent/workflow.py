@@ -1,25 +1,131 @@
 """LLM Agent Workflow 모듈
 Task 별 Multi-Agent Workflow를 정의합니다.
 """
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph
 
 from src.agent.utils.base_workflow import BaseWorkflow
 from src.agent.modules.states import AgentState
+from src.agent.modules.blob_store import blob_store
+from src.agent.modules.resume_segments import resume_segmenter
 import src.agent.modules.nodes as nd
 
 
+# 이력서 추출 모드
+EXTRACTION_MODES = ("multi", "single")
+
+
+def add_resume_stage(builder: StateGraph, extraction_mode: str = "multi") -> list[str]:
+    """이력서 추출 노드들과 ResumeCompanyProjectsNode를 그래프에 추가합니다.
+
+    - multi: 키워드/경력/프로젝트를 3개의 노드가 병렬로 추출한 뒤 합류
+    - single: 한 번의 구조화 출력 호출로 ResumeDict 전체를 추출 (검증 실패 시 multi 경로로 대체)
+
+    Args:
+        builder (StateGraph): 노드를 추가할 그래프 빌더
+        extraction_mode (str): 이력서 추출 모드 ("multi" 또는 "single")
+
+    Returns:
+        list[str]: 이력서 단계의 진입 노드 이름 목록 (종료 노드는 항상 "extract_company_projects")
+    """
+    if extraction_mode not in EXTRACTION_MODES:
+        raise ValueError(f"Unknown resume extraction mode: {extraction_mode!r}. Expected one of {EXTRACTION_MODES}.")
+
+    builder.add_node("extract_company_projects", nd.ResumeCompanyProjectsNode())
+
+    if extraction_mode == "single":
+        builder.add_node("decompose_resume_structured", nd.ResumeStructuredExtractionNode())
+        builder.add_edge("decompose_resume_structured", "extract_company_projects")
+        return ["decompose_resume_structured"]
+
+    # 이력서 추출 노드는 모두 state["resume"]만 읽으므로 병렬 실행 후 합류
+    entries = ["decompose_resume", "decompose_experiences", "decompose_projects"]
+    builder.add_node("decompose_resume", nd.ResumeDecompositionNode())
+    builder.add_node("decompose_experiences", nd.ResumeExperiencesNode())
+    builder.add_node("decompose_projects", nd.ResumeProjectsNode())
+    builder.add_edge(entries, "extract_company_projects")
+    return entries
+
+
+def add_incremental_resume_stage(builder: StateGraph):
+    """multi 모드 이력서 추출 노드들을 추가하고, START에서 다시 실행할 추출 노드를 고르는 조건부 엣지로 연결합니다.
+
+    thread에 저장된 추출 작업 별 섹션 해시(resume_segments)와 새 이력서의 섹션 해시를 비교하여
+    입력 섹션이 바뀐 추출 노드만 실행하고, 결과는 merge_dict 리듀서로 기존 resume_details에 합칩니다.
+    - 경력/프로젝트 추출은 함께 다시 실행한 뒤 ResumeCompanyProjectsNode로 합류합니다.
+      (이전 결과의 경력에는 회사 프로젝트가 이미 옮겨져 있으므로 한쪽만 다시 추출하면 프로젝트가 중복됩니다)
+    - 키워드 추출만 다시 실행한 경우 experiences/projects는 바뀌지 않으므로 바로 종료합니다.
+    - 바뀐 섹션이 없으면 LLM을 호출하지 않고 바로 종료합니다.
+    config["configurable"]["force"]가 True이면 항상 모든 추출 노드를 다시 실행합니다.
+
+    Args:
+        builder (StateGraph): 노드를 추가할 그래프 빌더
+    """
+    nodes = {
+        "decompose_resume": nd.ResumeDecompositionNode(),
+        "decompose_experiences": nd.ResumeExperiencesNode(),
+        "decompose_projects": nd.ResumeProjectsNode(),
+    }
+    for name, node in nodes.items():
+        builder.add_node(name, node)
+    builder.add_node("extract_company_projects", nd.ResumeCompanyProjectsNode())
+
+    async def route_extraction(state, config: RunnableConfig) -> list[str] | str:
+        hashes = resume_segmenter.task_hashes(await blob_store.resolve(state["resume"]))
+        force = config.get("configurable", {}).get("force")
+        tasks = resume_segmenter.plan(
+            hashes,
+            None if force else state.get("resume_segments"),
+            has_details=bool(state.get("resume_details")) and not force,
+        )
+        return [name for name, node in nodes.items() if node.segment_task in tasks] or "__end__"
+
+    builder.add_conditional_edges("__start__", route_extraction, [*nodes, "__end__"])
+    builder.add_edge(["decompose_experiences", "decompose_projects"], "extract_company_projects")
+    builder.add_edge("extract_company_projects", "__end__")
+    builder.add_edge("decompose_resume", "__end__")
+
+
+def add_memoized_evaluation(builder: StateGraph, name: str, node: nd.EvaluateResumeNode | nd.EvaluateFitNode):
+    """평가 노드를 추가하고, START에서 평가를 건너뛸지 결정하는 조건부 엣지로 연결합니다.
+
+    thread에 저장된 평가 결과의 fingerprint가 현재 입력(+ 프롬프트 버전)의 fingerprint와 같으면
+    LLM을 호출하지 않고 바로 종료하여 저장된 결과를 그대로 사용합니다.
+    config["configurable"]["force"]가 True이면 항상 평가를 다시 실행합니다.
+
+    Args:
+        builder (StateGraph): 노드를 추가할 그래프 빌더
+        name (str): 평가 노드 이름 (예: "evaluate_resume")
+        node: input_fingerprint(state)와 output_key를 가진 평가 노드
+    """
+    builder.add_node(name, node)
+
+    def route_evaluation(state, config: RunnableConfig) -> str:
+        if config.get("configurable", {}).get("force"):
+            return name
+        stored = state.get(f"{node.output_key}_fingerprint")
+        if state.get(node.output_key) is not None and stored == node.input_fingerprint(state):
+            return "__end__"
+        return name
+
+    builder.add_conditional_edges("__start__", route_evaluation, [name, "__end__"])
+    builder.add_edge(name, "__end__")
+
+
 class OneclickResumeWorkflow(BaseWorkflow):
     """
     원클릭 이력서 분석 워크플로우
     """
 
-    def __init__(self, state):
+    def __init__(self, state, extraction_mode: str = "multi"):
         """
         Args:
             state (StateGraph): Workflow에서 사용할 상태 클래스
+            extraction_mode (str): 이력서 추출 모드 ("multi" 또는 "single")
         """
         super().__init__()
         self.state = state
+        self.extraction_mode = extraction_mode
 
     def build(self):
         """
@@ -31,19 +137,14 @@ class OneclickResumeWorkflow(BaseWorkflow):
         builder = StateGraph(self.state)
 
         # 이력서 전처리 노드
-        builder.add_node("decompose_resume", nd.ResumeDecompositionNode())
-        builder.add_node("decompose_experiences", nd.ResumeExperiencesNode())
-        builder.add_node("decompose_projects", nd.ResumeProjectsNode())
-        builder.add_node("extract_company_projects", nd.ResumeCompanyProjectsNode())
+        resume_entries = add_resume_stage(builder, self.extraction_mode)
 
         # 평가 노드
         builder.add_node("evaluate_resume", nd.EvaluateResumeNode())
 
         # 그래프 연결
-        builder.add_edge("__start__", "decompose_resume")
-        builder.add_edge("decompose_resume", "decompose_experiences")
-        builder.add_edge("decompose_experiences", "decompose_projects")
-        builder.add_edge("decompose_projects", "extract_company_projects")
+        for node in resume_entries:
+            builder.add_edge("__start__", node)
         builder.add_edge("extract_company_projects", "evaluate_resume")
         builder.add_edge("evaluate_resume", "__end__")
 
@@ -57,13 +158,15 @@ class OneclickFitWorkflow(BaseWorkflow):
     원클릭 Fit 워크플로우
     """
 
-    def __init__(self, state):
+    def __init__(self, state, extraction_mode: str = "multi"):
         """
         Args:
             state (StateGraph): Workflow에서 사용할 상태 클래스
+            extraction_mode (str): 이력서 추출 모드 ("multi" 또는 "single")
         """
         super().__init__()
         self.state = state
+        self.extraction_mode = extraction_mode
 
     def build(self):
         """
@@ -78,10 +181,7 @@ class OneclickFitWorkflow(BaseWorkflow):
         builder.add_node("extract_jd", nd.JDUrlToMarkdown())
 
         # 이력서 전처리 노드
-        builder.add_node("decompose_resume", nd.ResumeDecompositionNode())
-        builder.add_node("decompose_experiences", nd.ResumeExperiencesNode())
-        builder.add_node("decompose_projects", nd.ResumeProjectsNode())
-        builder.add_node("extract_company_projects", nd.ResumeCompanyProjectsNode())
+        resume_entries = add_resume_stage(builder, self.extraction_mode)
 
         # JD 전처리 노드
         builder.add_node("decompose_jd", nd.JDDecompositionNode())
@@ -91,18 +191,15 @@ class OneclickFitWorkflow(BaseWorkflow):
         builder.add_node("evaluate_fit", nd.EvaluateFitNode())
 
         # 그래프 연결
-        builder.add_edge("__start__", "decompose_resume")
+        for node in resume_entries:
+            builder.add_edge("__start__", node)
         builder.add_edge("__start__", "extract_jd")
 
-        # 이력서 파이프라인
-        builder.add_edge("decompose_resume", "decompose_experiences")
-        builder.add_edge("decompose_experiences", "decompose_projects")
-        builder.add_edge("decompose_projects", "extract_company_projects")
-        builder.add_edge("extract_company_projects", "evaluate_fit")
-
         # JD 파이프라인
         builder.add_edge("extract_jd", "decompose_jd")
-        builder.add_edge("decompose_jd", "evaluate_fit")
+
+        # 이력서와 JD 파이프라인이 모두 끝난 뒤 한 번만 평가
+        builder.add_edge(["extract_company_projects", "decompose_jd"], "evaluate_fit")
 
         builder.add_edge("evaluate_fit", "__end__")
 
@@ -115,24 +212,26 @@ class PreprocessResumeWorkflow(BaseWorkflow):
     """
     이력서 전처리 Workflow
     """
-    def __init__(self, state):
+    def __init__(self, state, extraction_mode: str = "multi"):
         super().__init__()
         self.state = state
+        self.extraction_mode = extraction_mode
 
     def build(self):
         builder = StateGraph(self.state)
 
+        if self.extraction_mode == "multi":
+            # 이력서 전처리 노드 (수정된 이력서는 섹션이 바뀐 추출 노드만 다시 실행)
+            add_incremental_resume_stage(builder)
+            builder.name = self.name  # Workflow 이름 설정
+            return builder
+
         # 이력서 전처리 노드
-        builder.add_node("decompose_resume", nd.ResumeDecompositionNode())
-        builder.add_node("decompose_experiences", nd.ResumeExperiencesNode())
-        builder.add_node("decompose_projects", nd.ResumeProjectsNode())
-        builder.add_node("extract_company_projects", nd.ResumeCompanyProjectsNode())
+        resume_entries = add_resume_stage(builder, self.extraction_mode)
 
         # 그래프 연결
-        builder.add_edge("__start__", "decompose_resume")
-        builder.add_edge("decompose_resume", "decompose_experiences")
-        builder.add_edge("decompose_experiences", "decompose_projects")
-        builder.add_edge("decompose_projects", "extract_company_projects")
+        for node in resume_entries:
+            builder.add_edge("__start__", node)
 
         builder.add_edge("extract_company_projects", "__end__")
 
@@ -179,12 +278,8 @@ class AnalyzeResumeWorkflow(BaseWorkflow):
     def build(self):
         builder = StateGraph(self.state)
 
-        # 평가 노드
-        builder.add_node("evaluate_resume", nd.EvaluateResumeNode())
-
-        # 그래프 연결
-        builder.add_edge("__start__", "evaluate_resume")
-        builder.add_edge("evaluate_resume", "__end__")
+        # 평가 노드 (입력이 바뀌지 않았으면 저장된 평가 결과를 재사용)
+        add_memoized_evaluation(builder, "evaluate_resume", nd.EvaluateResumeNode())
 
         # workflow = builder.compile()  # 그래프 컴파일
         builder.name = self.name  # Workflow 이름 설정
@@ -203,12 +298,8 @@ class AnalyzeFitWorkflow(BaseWorkflow):
     def build(self):
         builder = StateGraph(self.state)
 
-        # 평가 노드
-        builder.add_node("evaluate_fit", nd.EvaluateFitNode())
-
-        # 그래프 연결
-        builder.add_edge("__start__", "evaluate_fit")
-        builder.add_edge("evaluate_fit", "__end__")
+        # 평가 노드 (이력서와 JD가 바뀌지 않았으면 저장된 평가 결과를 재사용)
+        add_memoized_evaluation(builder, "evaluate_fit", nd.EvaluateFitNode())
 
         # workflow = builder.compile()  # 그래프 컴파일
         builder.name = self.name  # Workflow 이름 설정
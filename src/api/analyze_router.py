@@ -1,6 +1,10 @@
-from fastapi import APIRouter, Depends, Form
-from src.services import analyze_services
-from src.api.dependencies import get_checkpointer
+from fastapi import APIRouter, Depends, Form, HTTPException
+from src.services import analyze_services, batch_services
+from src.core.config import settings
+from src.agent.registry import WorkflowRegistry
+from src.core.jobs import JobManager
+from src.api.dependencies import get_workflows, get_job_manager
+from src.api.streaming import sse_response
 
 router = APIRouter()
 
@@ -8,34 +12,90 @@ router = APIRouter()
 # 이력서 분석
 @router.post("/resume")
 async def analyze_resume_endpoint(
-    checkpointer: any = Depends(get_checkpointer),
+    jobs: JobManager = Depends(get_job_manager),
     thread_id: str = Form(...),
+    force: bool = Form(False),
 ):    
-    current_state = await analyze_services.analyze_resume(
-        checkpointer=checkpointer,
-        thread_id=thread_id,
-    )
-    return {
-        "applicant_skills": current_state.values.get(
-            "applicant_skills", "분석 결과 없음"
-        )
-    }
+    return await jobs.run("analyze_resume", {"thread_id": thread_id, "force": force})
 
 
 # 핏 분석
 @router.post("/fit")
 async def analyze_fit_endpoint(
-    checkpointer: any = Depends(get_checkpointer),
+    jobs: JobManager = Depends(get_job_manager),
     thread_id: str = Form(...),
+    force: bool = Form(False),
 ):    
+    return await jobs.run("analyze_fit", {"thread_id": thread_id, "force": force})
+
+
+# 이력서 분석 (SSE 스트리밍)
+@router.post("/resume/stream")
+async def analyze_resume_stream_endpoint(
+    workflows: WorkflowRegistry = Depends(get_workflows),
+    thread_id: str = Form(...),
+    force: bool = Form(False),
+):
+    return sse_response(
+        analyze_services.analyze_resume_stream(
+            workflows=workflows,
+            thread_id=thread_id,
+            force=force,
+        )
+    )
+
 
-    current_state = await analyze_services.analyze_fit(
-        checkpointer=checkpointer,
-        thread_id=thread_id,
+# 핏 분석 (SSE 스트리밍)
+@router.post("/fit/stream")
+async def analyze_fit_stream_endpoint(
+    workflows: WorkflowRegistry = Depends(get_workflows),
+    thread_id: str = Form(...),
+    force: bool = Form(False),
+):
+    return sse_response(
+        analyze_services.analyze_fit_stream(
+            workflows=workflows,
+            thread_id=thread_id,
+            force=force,
+        )
     )
 
-    return {
-        "applicant_recruitment": current_state.values.get(
-            "applicant_recruitment", "분석 결과 없음"
+
+# 하나의 JD로 여러 지원자 핏 분석 (SSE 스트리밍)
+@router.post("/fit/batch")
+async def analyze_fit_batch_endpoint(
+    workflows: WorkflowRegistry = Depends(get_workflows),
+    jd_url: str = Form(...),
+    thread_ids: list[str] = Form(...),
+    top_k: int | None = Form(None),
+):
+    if len(thread_ids) > settings.BATCH_FIT_MAX_CANDIDATES:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Too many candidates: {len(thread_ids)} (max {settings.BATCH_FIT_MAX_CANDIDATES}).",
+        )
+
+    # JD 수집/분해는 한 번만 수행하고, 실패 시 스트리밍 시작 전에 오류를 반환
+    jd_state, jd_ms = await batch_services.prepare_jd(jd_url)
+    return sse_response(
+        batch_services.batch_fit(
+            workflows=workflows,
+            jd_state=jd_state,
+            jd_ms=jd_ms,
+            thread_ids=thread_ids,
+            concurrency=settings.BATCH_FIT_CONCURRENCY,
+            top_k=top_k if top_k is not None else settings.BATCH_FIT_TOP_K,
         )
-    }
\ No newline at end of file
+    )
+
+
+# 하나의 JD에 대한 지원자 키워드 사전 순위 (LLM 평가 없음)
+@router.post("/fit/rank")
+async def analyze_fit_rank_endpoint(
+    workflows: WorkflowRegistry = Depends(get_workflows),
+    jd_url: str = Form(...),
+    thread_ids: list[str] = Form(...),
+    top_k: int | None = Form(None),
+):
+    jd_state, _ = await batch_services.prepare_jd(jd_url)
+    return await batch_services.rank_candidates(workflows, jd_state, thread_ids, top_k=top_k)
@@ -1,4 +1,20 @@
-from fastapi import Request
+from fastapi import Header, Request
 
 def get_checkpointer(request: Request):
     return request.app.state.checkpointer
+
+def get_checkpoint_retention(request: Request):
+    return request.app.state.checkpoint_retention
+
+def get_workflows(request: Request):
+    return request.app.state.workflows
+
+def get_parse_client(request: Request):
+    return request.app.state.parse_client
+
+def get_job_manager(request: Request):
+    return request.app.state.jobs
+
+def get_use_parse_cache(x_parse_cache: str | None = Header(None)) -> bool:
+    """X-Parse-Cache: bypass 헤더가 있으면 Parse 결과 캐시 조회를 건너뜁니다."""
+    return (x_parse_cache or "").lower() != "bypass"
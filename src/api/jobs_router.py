@@ -0,0 +1,111 @@
+from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException
+from fastapi.responses import JSONResponse
+from src.core.jobs import JobManager
+from src.agent.modules.llm_scheduler import BATCH
+from src.api.dependencies import get_job_manager, get_use_parse_cache
+
+router = APIRouter()
+
+
+def _accepted(job_id: str) -> JSONResponse:
+    return JSONResponse(
+        status_code=202,
+        content={"job_id": job_id, "status": "queued"},
+        headers={"Location": f"/jobs/{job_id}"},
+    )
+
+
+# 이력서 추출 작업 등록
+@router.post("/process/resume")
+async def submit_process_resume(
+    jobs: JobManager = Depends(get_job_manager),
+    use_cache: bool = Depends(get_use_parse_cache),
+    thread_id: str = Form(...),
+    resume_file: UploadFile = File(...),
+    force: bool = Form(False),
+):
+    upload = await jobs.spool_upload(resume_file)
+    return _accepted(await jobs.submit("process_resume", {"thread_id": thread_id, "use_cache": use_cache, "force": force, "upload": upload, "lane": BATCH}))
+
+
+# 채용 공고 추출 작업 등록
+@router.post("/process/jd")
+async def submit_process_jd(
+    jobs: JobManager = Depends(get_job_manager),
+    thread_id: str = Form(...),
+    jd_url: str = Form(...)
+):
+    return _accepted(await jobs.submit("process_jd", {"thread_id": thread_id, "jd_url": jd_url, "lane": BATCH}))
+
+
+# 이력서 분석 작업 등록
+@router.post("/analyze/resume")
+async def submit_analyze_resume(
+    jobs: JobManager = Depends(get_job_manager),
+    thread_id: str = Form(...),
+    force: bool = Form(False),
+):
+    return _accepted(await jobs.submit("analyze_resume", {"thread_id": thread_id, "force": force, "lane": BATCH}))
+
+
+# 핏 분석 작업 등록
+@router.post("/analyze/fit")
+async def submit_analyze_fit(
+    jobs: JobManager = Depends(get_job_manager),
+    thread_id: str = Form(...),
+    force: bool = Form(False),
+):
+    return _accepted(await jobs.submit("analyze_fit", {"thread_id": thread_id, "force": force, "lane": BATCH}))
+
+
+# 원클릭 이력서 분석 작업 등록
+@router.post("/oneclick/resume")
+async def submit_oneclick_resume(
+    jobs: JobManager = Depends(get_job_manager),
+    use_cache: bool = Depends(get_use_parse_cache),
+    thread_id: str = Form(...),
+    resume_file: UploadFile = File(...)
+):
+    upload = await jobs.spool_upload(resume_file)
+    return _accepted(await jobs.submit("oneclick_resume", {"thread_id": thread_id, "use_cache": use_cache, "upload": upload, "lane": BATCH}))
+
+
+# 원클릭 핏 분석 작업 등록
+@router.post("/oneclick/fit")
+async def submit_oneclick_fit(
+    jobs: JobManager = Depends(get_job_manager),
+    use_cache: bool = Depends(get_use_parse_cache),
+    thread_id: str = Form(...),
+    resume_file: UploadFile = File(...),
+    jd_url: str = Form(...)
+):
+    upload = await jobs.spool_upload(resume_file)
+    return _accepted(await jobs.submit("oneclick_fit", {"thread_id": thread_id, "use_cache": use_cache, "jd_url": jd_url, "upload": upload, "lane": BATCH}))
+
+
+# 작업 상태 조회
+@router.get("/{job_id}")
+async def job_status_endpoint(
+    job_id: str,
+    jobs: JobManager = Depends(get_job_manager),
+):
+    job = await jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found.")
+    return job
+
+
+# 작업 결과 조회 (완료 전이면 202, 실패 시 작업의 오류 상태 코드)
+@router.get("/{job_id}/result")
+async def job_result_endpoint(
+    job_id: str,
+    jobs: JobManager = Depends(get_job_manager),
+):
+    job = await jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found.")
+    if job["status"] == "failed":
+        raise HTTPException(status_code=job["status_code"], detail=job["error"])
+    if job["status"] != "succeeded":
+        return JSONResponse(status_code=202, content={"job_id": job_id, "status": job["status"]})
+    return job["result"]
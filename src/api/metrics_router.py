@@ -0,0 +1,58 @@
+from fastapi import APIRouter, Depends
+from src.agent.registry import WorkflowRegistry
+from src.agent.modules.models import model_provider
+from src.agent.modules.llm_cache import llm_cache
+from src.agent.modules.llm_scheduler import llm_scheduler
+from src.agent.modules.jd_fetcher import jd_fetcher
+from src.agent.modules.jd_cache import jd_cache
+from src.agent.modules.blob_store import blob_store, checkpoint_meter
+from src.agent.modules.resume_segments import resume_segmenter
+from src.agent.utils.llm_usage import resume_extraction_usage
+from src.services.parse_client import ParseClient
+from src.services.streaming import stream_latency
+from src.services.ranking import candidate_ranker
+from src.services.snapshots import snapshot_cache
+from src.core.progress import progress_broker
+from src.core.jobs import JobManager
+from src.core.checkpointer import checkpointer_stats
+from src.core.serde import checkpoint_serde
+from src.core.retention import CheckpointRetention
+from src.core.admission import admission_controller, node_latency
+from src.api.dependencies import get_checkpointer, get_checkpoint_retention, get_workflows, get_parse_client, get_job_manager
+
+router = APIRouter()
+
+
+# 서버 내부 지표 조회
+@router.get("")
+async def metrics_endpoint(
+    workflows: WorkflowRegistry = Depends(get_workflows),
+    parse_client: ParseClient = Depends(get_parse_client),
+    jobs: JobManager = Depends(get_job_manager),
+    checkpointer = Depends(get_checkpointer),
+    retention: CheckpointRetention | None = Depends(get_checkpoint_retention),
+):
+    return {
+        "checkpointer": checkpointer_stats(checkpointer),
+        "checkpoint_retention": retention.stats() if retention else None,
+        "checkpoint_serde": checkpoint_serde.stats(),
+        "checkpoint_bytes": checkpoint_meter.stats(),
+        "blob_store": blob_store.stats(),
+        "workflows": workflows.stats(),
+        "models": model_provider.stats(),
+        "resume_extraction": resume_extraction_usage.stats(),
+        "resume_segments": resume_segmenter.stats(),
+        "llm_cache": llm_cache.stats(),
+        "llm_scheduler": llm_scheduler.stats(),
+        "jd_fetch": jd_fetcher.stats(),
+        "jd_cache": jd_cache.stats(),
+        "streaming": stream_latency.stats(),
+        "progress": progress_broker.stats(),
+        "snapshot_cache": snapshot_cache.stats(),
+        "ranking": candidate_ranker.stats(),
+        "parse_cache": parse_client.cache.stats() if parse_client.cache else None,
+        "parse_inflight": parse_client.inflight.stats(),
+        "jobs": jobs.stats(),
+        "admission": admission_controller.stats(),
+        "node_latency": node_latency.stats(),
+    }
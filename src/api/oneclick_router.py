@@ -1,6 +1,10 @@
 from fastapi import APIRouter, Depends, UploadFile, File, Form
 from src.services import oneclick_services
-from src.api.dependencies import get_checkpointer
+from src.agent.registry import WorkflowRegistry
+from src.core.jobs import JobManager
+from src.services.parse_client import ParseClient
+from src.api.dependencies import get_workflows, get_parse_client, get_use_parse_cache, get_job_manager
+from src.api.streaming import sse_response
 
 router = APIRouter()
 
@@ -8,40 +12,77 @@ router = APIRouter()
 # 이력서 분석
 @router.post("/resume")
 async def oneclick_resume_endpoint(
-    checkpointer: any = Depends(get_checkpointer),
+    jobs: JobManager = Depends(get_job_manager),
+    use_cache: bool = Depends(get_use_parse_cache),
     thread_id: str = Form(...),
     resume_file: UploadFile = File(...)
 ):    
-    current_state = await oneclick_services.oneclick_resume(
-        checkpointer=checkpointer,
-        thread_id=thread_id,
-        resume_file=resume_file
+    return await jobs.run(
+        "oneclick_resume",
+        {
+            "thread_id": thread_id,
+            "use_cache": use_cache,
+            "upload": await jobs.spool_upload(resume_file),
+        },
     )
-    return {
-        "applicant_skills": current_state.values.get(
-            "applicant_skills", "분석 결과 없음"
-        )
-    }
 
 
 # 핏 분석
 @router.post("/fit")
 async def oneclick_fit_endpoint(
-    checkpointer: any = Depends(get_checkpointer),
+    jobs: JobManager = Depends(get_job_manager),
+    use_cache: bool = Depends(get_use_parse_cache),
     thread_id: str = Form(...),
     resume_file: UploadFile = File(...),
     jd_url: str = Form(...)
 ):    
+    return await jobs.run(
+        "oneclick_fit",
+        {
+            "thread_id": thread_id,
+            "use_cache": use_cache,
+            "jd_url": jd_url,
+            "upload": await jobs.spool_upload(resume_file),
+        },
+    )
+
 
-    current_state = await oneclick_services.oneclick_fit(
-        checkpointer=checkpointer,
-        thread_id=thread_id,
-        resume_file=resume_file,
-        jd_url=jd_url
+# 이력서 분석 (SSE 스트리밍)
+@router.post("/resume/stream")
+async def oneclick_resume_stream_endpoint(
+    workflows: WorkflowRegistry = Depends(get_workflows),
+    parse_client: ParseClient = Depends(get_parse_client),
+    use_cache: bool = Depends(get_use_parse_cache),
+    thread_id: str = Form(...),
+    resume_file: UploadFile = File(...)
+):
+    # Parse 오류는 스트리밍 시작 전에 HTTP 상태 코드로 반환
+    parsed_resume = await oneclick_services.parse_resume(parse_client, thread_id, resume_file, use_cache=use_cache)
+    return sse_response(
+        oneclick_services.oneclick_resume_stream(
+            workflows=workflows,
+            parsed_resume=parsed_resume,
+            thread_id=thread_id,
+        )
     )
 
-    return {
-        "applicant_recruitment": current_state.values.get(
-            "applicant_recruitment", "분석 결과 없음"
+
+# 핏 분석 (SSE 스트리밍)
+@router.post("/fit/stream")
+async def oneclick_fit_stream_endpoint(
+    workflows: WorkflowRegistry = Depends(get_workflows),
+    parse_client: ParseClient = Depends(get_parse_client),
+    use_cache: bool = Depends(get_use_parse_cache),
+    thread_id: str = Form(...),
+    resume_file: UploadFile = File(...),
+    jd_url: str = Form(...)
+):
+    parsed_resume = await oneclick_services.parse_resume(parse_client, thread_id, resume_file, use_cache=use_cache)
+    return sse_response(
+        oneclick_services.oneclick_fit_stream(
+            workflows=workflows,
+            parsed_resume=parsed_resume,
+            thread_id=thread_id,
+            jd_url=jd_url,
         )
-    }
\ No newline at end of file
+    )
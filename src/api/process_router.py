@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, UploadFile, File, Form
-from src.services import process_services
-from src.api.dependencies import get_checkpointer
+from src.core.jobs import JobManager
+from src.api.dependencies import get_job_manager, get_use_parse_cache
 
 router = APIRouter()
 
@@ -8,37 +8,28 @@ router = APIRouter()
 # 이력서 추출
 @router.post("/resume")
 async def process_resume_endpoint(
-    checkpointer: any = Depends(get_checkpointer),
+    jobs: JobManager = Depends(get_job_manager),
+    use_cache: bool = Depends(get_use_parse_cache),
     thread_id: str = Form(...),
-    resume_file: UploadFile = File(...)
+    resume_file: UploadFile = File(...),
+    force: bool = Form(False),
 ):    
-    current_state = await process_services.process_resume(
-        checkpointer=checkpointer,
-        thread_id=thread_id,
-        resume_file=resume_file
+    return await jobs.run(
+        "process_resume",
+        {
+            "thread_id": thread_id,
+            "use_cache": use_cache,
+            "force": force,
+            "upload": await jobs.spool_upload(resume_file),
+        },
     )
-    return {
-        "resume_details": current_state.values.get(
-            "resume_details", {}
-        )
-    }
 
 
 # 채용 공고 추출
 @router.post("/jd")
 async def process_jd_endpoint(
-    checkpointer: any = Depends(get_checkpointer),
+    jobs: JobManager = Depends(get_job_manager),
     thread_id: str = Form(...),
     jd_url: str = Form(...)
 ):
-    current_state = await process_services.process_jd(
-        checkpointer=checkpointer,
-        thread_id=thread_id,
-        jd_url=jd_url
-    )
-
-    return {
-        "jd_details": current_state.values.get(
-            "jd_details", {}
-        )
-    }
\ No newline at end of file
+    return await jobs.run("process_jd", {"thread_id": thread_id, "jd_url": jd_url})
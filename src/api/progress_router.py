@@ -0,0 +1,17 @@
+from fastapi import APIRouter
+from src.core.progress import progress_broker
+from src.api.streaming import sse_response
+
+router = APIRouter()
+
+
+async def _progress_events(thread_id: str):
+    async for event in progress_broker.subscribe(thread_id):
+        yield event["type"], event
+
+
+# thread_id 별 진행 상황 구독 (SSE)
+@router.get("/{thread_id}")
+async def progress_endpoint(thread_id: str):
+    """노드/단계의 start, end, error 이벤트를 SSE로 전달합니다. 연결 직후에는 최근 이벤트를 먼저 재생합니다."""
+    return sse_response(_progress_events(thread_id))
@@ -0,0 +1,25 @@
+import json
+from typing import AsyncIterator
+
+from fastapi.responses import StreamingResponse
+
+
+SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",  # 프록시(nginx) 버퍼링 비활성화
+}
+
+
+def format_sse(event: str, data: dict) -> str:
+    """Server-Sent Events 형식의 메시지 문자열을 생성합니다."""
+    payload = json.dumps(data, ensure_ascii=False)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+def sse_response(events: AsyncIterator[tuple[str, dict]]) -> StreamingResponse:
+    """(event, data) 튜플을 생성하는 async iterator를 text/event-stream 응답으로 변환합니다."""
+    async def body():
+        async for event, data in events:
+            yield format_sse(event, data)
+
+    return StreamingResponse(body(), media_type="text/event-stream", headers=SSE_HEADERS)
@@ -0,0 +1,55 @@
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import JSONResponse, Response
+from src.agent.registry import WorkflowRegistry
+from src.services.snapshots import snapshot_cache
+from src.api.dependencies import get_workflows
+
+router = APIRouter()
+
+ResultField = Literal["resume_details", "jd_details", "applicant_skills", "applicant_recruitment"]
+
+
+async def _snapshot_response(workflows: WorkflowRegistry, thread_id: str, if_none_match: str | None, field: str | None = None) -> Response:
+    """thread의 최신 스냅샷(전체 결과 또는 필드 하나)을 ETag와 함께 반환하고, ETag가 일치하면 304로 응답합니다."""
+    snapshot = await snapshot_cache.get(workflows, thread_id)
+    if snapshot is None:
+        raise HTTPException(status_code=404, detail=f"No state found for thread {thread_id!r}.")
+
+    # 클라이언트가 캐시된 응답을 사용하기 전에 항상 ETag로 재검증하도록 no-cache 지정
+    headers = {"ETag": snapshot["etag"], "Cache-Control": "no-cache"}
+    if snapshot_cache.is_not_modified(snapshot, if_none_match):
+        return Response(status_code=304, headers=headers)
+
+    if field is None:
+        body = {"thread_id": thread_id, "checkpoint_id": snapshot["checkpoint_id"], **snapshot["values"]}
+    else:
+        value = snapshot["values"].get(field)
+        if value is None:
+            raise HTTPException(status_code=404, detail=f"{field} has not been produced for thread {thread_id!r}.")
+        body = {field: value}
+    return JSONResponse(body, headers=headers)
+
+
+# thread의 최신 결과 전체 조회
+@router.get("/{thread_id}")
+async def thread_state_endpoint(
+    thread_id: str,
+    workflows: WorkflowRegistry = Depends(get_workflows),
+    if_none_match: str | None = Header(None),
+):
+    """resume_details, jd_details, applicant_skills, applicant_recruitment를 Workflow 실행 없이 반환합니다."""
+    return await _snapshot_response(workflows, thread_id, if_none_match)
+
+
+# thread의 최신 결과 필드 조회
+@router.get("/{thread_id}/{field}")
+async def thread_field_endpoint(
+    thread_id: str,
+    field: ResultField,
+    workflows: WorkflowRegistry = Depends(get_workflows),
+    if_none_match: str | None = Header(None),
+):
+    """결과 필드 하나를 반환합니다. 아직 생성되지 않은 필드는 404로 응답합니다."""
+    return await _snapshot_response(workflows, thread_id, if_none_match, field=field)
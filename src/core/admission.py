@@ -0,0 +1,200 @@
+"""요청 수락(Admission) 제어 모듈
+
+라우터(prefix) 별 처리 중인 Workflow 요청 수를 집계하고, 노드 지연 시간을 신호로 AIMD 방식으로 동시 실행 한도를 조정합니다.
+- 노드 지연 시간이 평소(장기 EWMA)보다 tolerance배 이상 늘어나거나 5xx가 발생하면 한도를 backoff 비율만큼 줄입니다.
+- 그렇지 않으면 요청이 끝날 때마다 한도를 1/limit씩 늘려, 한도만큼 요청이 끝날 때 1만큼 늘어나도록 합니다.
+한도를 넘는 요청은 AdmissionControlMiddleware가 즉시 503으로 거절하여, 끝낼 수 없는 요청이 쌓이지 않도록 합니다.
+"""
+import math
+import threading
+import time
+
+
+class NodeLatencyTracker:
+    """노드 별 단기/장기 지연 시간 EWMA 집계기
+
+    단기 EWMA와 장기 EWMA의 비율을 혼잡 신호로 사용합니다. (1이면 평소와 같고, 2이면 평소의 두 배)
+    장기 EWMA는 빨라질 때는 빠르게, 느려질 때는 천천히 따라가므로 과부하가 이어져도 기준값이 함께 올라가지 않고,
+    모델 자체가 느려진 경우에만 수백 번의 실행에 걸쳐 새 기준값으로 옮겨갑니다.
+    """
+
+    def __init__(
+        self,
+        fast_alpha: float = 0.2,
+        slow_rise_alpha: float = 0.005,
+        slow_fall_alpha: float = 0.2,
+        min_samples: int = 10,
+        stale_seconds: float = 30.0,
+    ):
+        self.fast_alpha = fast_alpha
+        self.slow_rise_alpha = slow_rise_alpha
+        self.slow_fall_alpha = slow_fall_alpha
+        self.min_samples = min_samples
+        self.stale_seconds = stale_seconds
+        self._lock = threading.Lock()
+        self._nodes: dict[str, dict] = {}
+
+    def record(self, name: str, elapsed_ms: float):
+        """노드 한 번의 실행 시간(ms)을 반영합니다."""
+        with self._lock:
+            node = self._nodes.get(name)
+            if node is None:
+                self._nodes[name] = {"samples": 1, "fast_ms": elapsed_ms, "slow_ms": elapsed_ms, "updated": time.monotonic()}
+                return
+            node["samples"] += 1
+            node["fast_ms"] += self.fast_alpha * (elapsed_ms - node["fast_ms"])
+            alpha = self.slow_rise_alpha if elapsed_ms > node["slow_ms"] else self.slow_fall_alpha
+            node["slow_ms"] += alpha * (elapsed_ms - node["slow_ms"])
+            node["updated"] = time.monotonic()
+
+    def congestion(self) -> float:
+        """최근 실행된 노드 중 단기/장기 지연 시간 비율의 최댓값을 반환합니다. (표본이 부족하면 1.0)"""
+        now = time.monotonic()
+        with self._lock:
+            ratios = [
+                node["fast_ms"] / node["slow_ms"]
+                for node in self._nodes.values()
+                if node["samples"] >= self.min_samples and node["slow_ms"] > 0 and now - node["updated"] <= self.stale_seconds
+            ]
+        return max(ratios, default=1.0)
+
+    def stats(self) -> dict:
+        """노드 별 실행 수, 단기/장기 지연 시간 EWMA와 비율을 반환합니다."""
+        with self._lock:
+            return {
+                name: {
+                    "samples": node["samples"],
+                    "fast_ms": round(node["fast_ms"], 1),
+                    "slow_ms": round(node["slow_ms"], 1),
+                    "ratio": round(node["fast_ms"] / node["slow_ms"], 3) if node["slow_ms"] > 0 else None,
+                }
+                for name, node in self._nodes.items()
+            }
+
+
+class RouteLimit:
+    """라우터 하나의 동시 실행 한도와 처리 중인 요청 수"""
+
+    def __init__(self, prefix: str, limit: float):
+        self.prefix = prefix
+        self.limit = limit
+        self.inflight = 0
+        self.latency_ms: float | None = None
+        self.last_decrease = 0.0
+        self.counters = {"admitted": 0, "rejected": 0, "completed": 0, "increases": 0, "decreases": 0}
+
+
+class AdmissionController:
+    """라우터 별 AIMD 동시 실행 한도 관리자
+
+    configure 호출 전에는 모든 요청을 수락합니다.
+
+    예시:
+    ```python
+    admission_controller.configure(["/analyze", "/oneclick"], initial_limit=32)
+    route = admission_controller.route("/analyze/fit")
+    if admission_controller.try_acquire(route):
+        ...
+        admission_controller.release(route, elapsed_ms, status)
+    ```
+    """
+
+    def __init__(self, node_latency: NodeLatencyTracker):
+        self.node_latency = node_latency
+        self.enabled = False
+        self.routes: dict[str, RouteLimit] = {}
+        self.min_limit = 1
+        self.max_limit = 256
+        self.latency_tolerance = 2.0
+        self.backoff_ratio = 0.7
+        self._lock = threading.Lock()
+
+    def configure(
+        self,
+        prefixes: list[str],
+        initial_limit: int = 32,
+        min_limit: int = 2,
+        max_limit: int = 256,
+        latency_tolerance: float = 2.0,
+        backoff_ratio: float = 0.7,
+    ):
+        """
+        Args:
+            prefixes (list[str]): 한도를 적용할 라우터 prefix 목록 (예: "/analyze")
+            initial_limit (int): 라우터 별 초기 동시 실행 한도
+            min_limit (int): 한도의 하한
+            max_limit (int): 한도의 상한
+            latency_tolerance (float): 혼잡으로 판단할 노드 단기/장기 지연 시간 비율
+            backoff_ratio (float): 혼잡 시 한도에 곱하는 비율
+        """
+        self.routes = {prefix.rstrip("/"): RouteLimit(prefix.rstrip("/"), float(initial_limit)) for prefix in prefixes}
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_tolerance = latency_tolerance
+        self.backoff_ratio = backoff_ratio
+        self.enabled = True
+
+    def route(self, path: str) -> RouteLimit | None:
+        """요청 경로에 해당하는 라우터를 반환합니다. (한도 적용 대상이 아니면 None)"""
+        for prefix, route in self.routes.items():
+            if path == prefix or path.startswith(prefix + "/"):
+                return route
+        return None
+
+    def try_acquire(self, route: RouteLimit) -> bool:
+        """한도 안이면 처리 중인 요청 수를 늘리고 True를, 한도를 넘으면 False를 반환합니다."""
+        with self._lock:
+            if route.inflight >= math.floor(route.limit):
+                route.counters["rejected"] += 1
+                return False
+            route.inflight += 1
+            route.counters["admitted"] += 1
+            return True
+
+    def release(self, route: RouteLimit, elapsed_ms: float, status: int):
+        """요청 종료를 반영하고, 노드 지연 시간과 응답 상태로 한도를 조정합니다."""
+        congested = status >= 500 or self.node_latency.congestion() > self.latency_tolerance
+        now = time.monotonic()
+        with self._lock:
+            route.inflight -= 1
+            route.counters["completed"] += 1
+            route.latency_ms = elapsed_ms if route.latency_ms is None else route.latency_ms + 0.1 * (elapsed_ms - route.latency_ms)
+
+            if congested:
+                # 같은 혼잡으로 끝나는 요청들에 의해 연속으로 줄어들지 않도록, 평균 요청 시간에 한 번만 감소
+                if now - route.last_decrease >= max(1.0, route.latency_ms / 1000):
+                    route.limit = max(self.min_limit, route.limit * self.backoff_ratio)
+                    route.last_decrease = now
+                    route.counters["decreases"] += 1
+            elif route.inflight + 1 >= route.limit / 2:
+                # 한도를 절반 이상 사용 중일 때만 증가 (유휴 상태에서 한도가 무한히 커지지 않도록)
+                route.limit = min(self.max_limit, route.limit + 1 / route.limit)
+                route.counters["increases"] += 1
+
+    def retry_after(self, route: RouteLimit) -> int:
+        """거절 응답의 Retry-After(초). 처리 중인 요청이 끝날 것으로 예상되는 평균 요청 시간을 사용합니다."""
+        seconds = (route.latency_ms or 1000) / 1000
+        return min(60, max(1, math.ceil(seconds)))
+
+    def stats(self) -> dict:
+        """라우터 별 한도, 처리 중인 요청 수, 수락/거절 수와 현재 혼잡 신호를 반환합니다."""
+        with self._lock:
+            routes = {
+                prefix: {
+                    "limit": round(route.limit, 2),
+                    "inflight": route.inflight,
+                    "latency_ms": round(route.latency_ms, 1) if route.latency_ms is not None else None,
+                    **route.counters,
+                }
+                for prefix, route in self.routes.items()
+            }
+        return {
+            "enabled": self.enabled,
+            "congestion": round(self.node_latency.congestion(), 3),
+            "latency_tolerance": self.latency_tolerance,
+            "routes": routes,
+        }
+
+
+node_latency = NodeLatencyTracker()
+admission_controller = AdmissionController(node_latency)
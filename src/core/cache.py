@@ -0,0 +1,253 @@
+"""2계층 캐시 모듈
+
+프로세스 메모리의 LRU 캐시(크기 기반 제거)와 SQLite 디스크 캐시(TTL)를 결합한 캐시를 정의합니다.
+값은 JSON으로 직렬화 가능한 객체만 저장합니다.
+"""
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+class TwoTierCache:
+    """메모리 LRU + SQLite 2계층 캐시
+
+    조회 시 메모리 → 디스크 순으로 확인하며, 디스크에서 찾은 값은 메모리로 승격합니다.
+
+    예시:
+    ```python
+    cache = TwoTierCache("parse", "cache.sqlite", max_memory_bytes=64 * 1024 * 1024, ttl_seconds=86400)
+    await cache.set(digest, result)
+    result = await cache.get(digest)
+    ```
+    """
+
+    def __init__(
+        self,
+        name: str,
+        path: str,
+        max_memory_bytes: int,
+        ttl_seconds: float,
+        max_disk_bytes: int | None = None,
+    ):
+        """
+        Args:
+            name (str): 캐시 이름 (SQLite 테이블 이름으로도 사용)
+            path (str): SQLite 파일 경로
+            max_memory_bytes (int): 메모리 계층의 최대 크기(직렬화된 JSON 바이트 기준)
+            ttl_seconds (float): 디스크 계층 항목의 유효 기간(초)
+            max_disk_bytes (int | None): 디스크 계층의 최대 크기 (None이면 TTL로만 정리)
+        """
+        self.name = name
+        self.max_memory_bytes = max_memory_bytes
+        self.ttl_seconds = ttl_seconds
+        self.max_disk_bytes = max_disk_bytes
+
+        self._memory: OrderedDict[str, tuple[str, float, int]] = OrderedDict()   # key → (raw, expires_at, UTF-8 바이트 수)
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {self.name}_cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, size INTEGER NOT NULL, expires_at REAL NOT NULL, "
+            "written_at REAL NOT NULL DEFAULT 0)"
+        )
+        # written_at이 없던 기존 테이블은 컬럼을 추가 (기존 항목의 저장 시각은 0으로 간주)
+        columns = {row[1] for row in self._conn.execute(f"PRAGMA table_info({self.name}_cache)")}
+        if "written_at" not in columns:
+            self._conn.execute(f"ALTER TABLE {self.name}_cache ADD COLUMN written_at REAL NOT NULL DEFAULT 0")
+        # size를 문자 수로 기록하던 이전 항목은 UTF-8 바이트 수로 보정
+        self._conn.execute(
+            f"UPDATE {self.name}_cache SET size = length(CAST(value AS BLOB)) WHERE size != length(CAST(value AS BLOB))"
+        )
+        self._conn.commit()
+        self._disk_bytes = self._conn.execute(f"SELECT COALESCE(SUM(size), 0) FROM {self.name}_cache").fetchone()[0]
+        self._purge_expired()
+
+        self.counters = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "disk_evictions": 0,
+            "expired": 0,
+            "writes": 0,
+        }
+
+    async def get(self, key: str):
+        """키에 해당하는 값을 반환합니다. 없거나 만료된 경우 None을 반환합니다."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                raw, expires_at, _ = entry
+                if expires_at > time.time():
+                    self._memory.move_to_end(key)
+                    self.counters["memory_hits"] += 1
+                    return json.loads(raw)
+                self._pop_memory(key)
+                self.counters["expired"] += 1
+
+        row = await asyncio.to_thread(self._disk_get, key)
+        if row is None:
+            self.counters["misses"] += 1
+            return None
+
+        raw, expires_at, size = row
+        if expires_at <= time.time():
+            await asyncio.to_thread(self._disk_delete, key)
+            self.counters["expired"] += 1
+            self.counters["misses"] += 1
+            return None
+
+        self.counters["disk_hits"] += 1
+        self._put_memory(key, raw, size, expires_at)
+        return json.loads(raw)
+
+    async def set(self, key: str, value):
+        """값을 메모리와 디스크 양쪽에 저장합니다."""
+        raw = json.dumps(value, ensure_ascii=False)
+        # 메모리/디스크 계층 모두 UTF-8 바이트 수로 크기를 집계 (한글은 문자 당 3바이트)
+        size = len(raw.encode("utf-8"))
+        expires_at = time.time() + self.ttl_seconds
+        self._put_memory(key, raw, size, expires_at)
+        await asyncio.to_thread(self._disk_set, key, raw, size, expires_at)
+        self.counters["writes"] += 1
+
+    async def delete(self, key: str):
+        """값을 메모리와 디스크 양쪽에서 삭제합니다."""
+        with self._lock:
+            self._pop_memory(key)
+        await asyncio.to_thread(self._disk_delete, key)
+
+    async def keys_written_before(self, cutoff: float) -> list[str]:
+        """디스크 계층에서 cutoff(Unix time) 이전에 마지막으로 저장된 키 목록을 반환합니다."""
+        def _select():
+            with self._db_lock:
+                rows = self._conn.execute(
+                    f"SELECT key FROM {self.name}_cache WHERE written_at < ?", (cutoff,)
+                ).fetchall()
+            return [key for (key,) in rows]
+
+        return await asyncio.to_thread(_select)
+
+    async def delete_many(self, keys: list[str], written_before: float = float("inf")) -> int:
+        """여러 키를 메모리와 디스크 양쪽에서 삭제하고, 디스크에서 삭제한 항목 수를 반환합니다.
+
+        written_before를 지정하면 그 이후에 다시 저장된 항목은 디스크에서 삭제하지 않습니다.
+        """
+        with self._lock:
+            for key in keys:
+                self._pop_memory(key)
+        return await asyncio.to_thread(self._disk_delete_many, keys, written_before)
+
+    def _put_memory(self, key: str, raw: str, size: int, expires_at: float):
+        if size > self.max_memory_bytes:
+            return
+        with self._lock:
+            self._pop_memory(key)
+            self._memory[key] = (raw, expires_at, size)
+            self._memory_bytes += size
+            while self._memory_bytes > self.max_memory_bytes:
+                evicted_key = next(iter(self._memory))
+                self._pop_memory(evicted_key)
+                self.counters["evictions"] += 1
+
+    def _pop_memory(self, key: str):
+        entry = self._memory.pop(key, None)
+        if entry is not None:
+            self._memory_bytes -= entry[2]
+
+    def _disk_get(self, key: str):
+        with self._db_lock:
+            return self._conn.execute(
+                f"SELECT value, expires_at, size FROM {self.name}_cache WHERE key = ?", (key,)
+            ).fetchone()
+
+    def _row_size(self, key: str) -> int:
+        row = self._conn.execute(f"SELECT size FROM {self.name}_cache WHERE key = ?", (key,)).fetchone()
+        return row[0] if row is not None else 0
+
+    def _disk_set(self, key: str, raw: str, size: int, expires_at: float):
+        with self._db_lock:
+            # 같은 키를 덮어쓰면 기존 항목의 크기를 빼고 새 크기를 더함
+            replaced = self._row_size(key)
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self.name}_cache (key, value, size, expires_at, written_at) VALUES (?, ?, ?, ?, ?)",
+                (key, raw, size, expires_at, time.time()),
+            )
+            self._conn.commit()
+            self._disk_bytes += size - replaced
+            if self.max_disk_bytes is not None and self._disk_bytes > self.max_disk_bytes:
+                self._trim_disk()
+
+    def _trim_disk(self):
+        """만료가 가까운 항목부터 삭제하여 디스크 계층을 최대 크기의 90% 이하로 줄입니다. (_db_lock 보유 상태에서 호출)"""
+        self._purge_expired_locked()
+        target = int(self.max_disk_bytes * 0.9)
+        total = self._conn.execute(f"SELECT COALESCE(SUM(size), 0) FROM {self.name}_cache").fetchone()[0]
+        rows = self._conn.execute(f"SELECT key, size FROM {self.name}_cache ORDER BY expires_at").fetchall()
+        evicted = []
+        for key, size in rows:
+            if total <= target:
+                break
+            evicted.append((key,))
+            total -= size
+        self._conn.executemany(f"DELETE FROM {self.name}_cache WHERE key = ?", evicted)
+        self._conn.commit()
+        self._disk_bytes = total
+        self.counters["disk_evictions"] += len(evicted)
+
+    def _disk_delete(self, key: str):
+        with self._db_lock:
+            removed = self._row_size(key)
+            self._conn.execute(f"DELETE FROM {self.name}_cache WHERE key = ?", (key,))
+            self._conn.commit()
+            self._disk_bytes -= removed
+
+    def _disk_delete_many(self, keys: list[str], written_before: float) -> int:
+        deleted = 0
+        with self._db_lock:
+            for key in keys:
+                removed = self._row_size(key)
+                if self._conn.execute(
+                    f"DELETE FROM {self.name}_cache WHERE key = ? AND written_at < ?", (key, written_before)
+                ).rowcount:
+                    deleted += 1
+                    self._disk_bytes -= removed
+            self._conn.commit()
+        return deleted
+
+    def _purge_expired(self):
+        with self._db_lock:
+            self._purge_expired_locked()
+
+    def _purge_expired_locked(self):
+        now = time.time()
+        expired = self._conn.execute(
+            f"SELECT COALESCE(SUM(size), 0) FROM {self.name}_cache WHERE expires_at <= ?", (now,)
+        ).fetchone()[0]
+        self._conn.execute(f"DELETE FROM {self.name}_cache WHERE expires_at <= ?", (now,))
+        self._conn.commit()
+        self._disk_bytes -= expired
+
+    def close(self):
+        """SQLite 연결을 닫습니다."""
+        with self._db_lock:
+            self._conn.close()
+
+    def stats(self) -> dict:
+        """캐시 적중/실패/제거 카운터와 현재 메모리 사용량을 반환합니다."""
+        hits = self.counters["memory_hits"] + self.counters["disk_hits"]
+        lookups = hits + self.counters["misses"]
+        return {
+            **self.counters,
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_bytes,
+            "disk_bytes": self._disk_bytes,
+        }
@@ -7,6 +7,107 @@ class Settings(BaseSettings):
     PDF_PARSE_API_ENDPOINT: str
     PARSE_API_KEY: str
 
+    # Checkpointer 설정
+    CHECKPOINT_BACKEND: str = "sqlite"              # "sqlite" 또는 "postgres"
+    CHECKPOINT_SQLITE_PATH: str = "checkpoint.sqlite"   # SQLite 파일 경로
+    CHECKPOINT_SQLITE_SYNCHRONOUS: str = "NORMAL"   # PRAGMA synchronous (WAL에서는 NORMAL로도 DB 손상 없음)
+    CHECKPOINT_SQLITE_BUSY_TIMEOUT_MS: int = 5000   # 잠금 대기 시간(ms)
+    CHECKPOINT_SQLITE_CACHE_KIB: int = 64 * 1024    # 페이지 캐시 크기(KiB)
+    CHECKPOINT_SQLITE_MMAP_BYTES: int = 256 * 1024 * 1024   # 메모리 맵 I/O 크기(바이트)
+    CHECKPOINT_COMPRESSION: str = "zstd"            # checkpoint payload 압축 codec ("zstd", "zlib", "none")
+    CHECKPOINT_COMPRESSION_MIN_BYTES: int = 1024    # 이 크기(바이트) 이상인 payload만 압축
+    CHECKPOINT_COMPRESSION_LEVEL: int = 3           # 압축 레벨 (zstd 1~22, zlib 1~9)
+    CHECKPOINT_POSTGRES_URL: str | None = None      # PostgreSQL 접속 문자열
+    CHECKPOINT_POSTGRES_POOL_MIN: int = 4           # 커넥션 풀 최소 크기
+    CHECKPOINT_POSTGRES_POOL_MAX: int = 20          # 커넥션 풀 최대 크기
+    CHECKPOINT_POSTGRES_POOL_TIMEOUT: float = 30.0  # 커넥션 풀 대기 타임아웃(초)
+    CHECKPOINT_RETENTION_ENABLED: bool = True       # 오래된 checkpoint 정리 작업 사용 여부
+    CHECKPOINT_KEEP_LATEST: int = 20                # thread 별로 항상 남길 최신 checkpoint 수
+    CHECKPOINT_TTL_SECONDS: float | None = 24 * 3600    # 이보다 새로운 checkpoint는 개수와 관계없이 남김 (None이면 개수만 적용)
+    CHECKPOINT_COMPACTION_INTERVAL_SECONDS: float = 3600    # 정리 주기(초)
+    CHECKPOINT_CONVERT_AUTO_VACUUM: bool = True     # 기존 SQLite DB를 서버 시작 시 VACUUM으로 incremental auto_vacuum 전환 (DB 크기만큼 시작이 지연됨)
+
+    # 상태 Blob 저장소 설정 (이력서 원문, JD markdown, 평가 결과를 checkpoint 밖에 한 번만 저장)
+    BLOB_STORE_ENABLED: bool = True                 # 큰 상태 필드를 blob 참조로 기록할지 여부
+    BLOB_DB_PATH: str = "blob.sqlite"               # blob 저장소 SQLite 파일 경로 (만료 없이 보관, checkpoint 정리 시 참조되지 않는 blob 삭제)
+    BLOB_MIN_BYTES: int = 1024                      # 이 크기(UTF-8 바이트) 이상인 문자열만 blob으로 저장
+    BLOB_MEMORY_BYTES: int = 64 * 1024 * 1024       # 메모리 LRU 최대 크기(바이트)
+    BLOB_GC_GRACE_SECONDS: float = 3600             # 저장 후 이 기간이 지난 blob만 참조가 없을 때 삭제 (실행 중인 Workflow 보호)
+    SNAPSHOT_CACHE_MAX_THREADS: int = 1000          # 결과 조회(GET /threads) 스냅샷을 메모리에 보관할 최대 thread 수
+
+    # PDF Parse API 공용 HTTP 클라이언트 설정
+    PARSE_API_MAX_CONNECTIONS: int = 20             # 최대 동시 커넥션 수
+    PARSE_API_MAX_KEEPALIVE_CONNECTIONS: int = 10   # keep-alive로 유지할 유휴 커넥션 수
+    PARSE_API_KEEPALIVE_EXPIRY: float = 30.0        # 유휴 커넥션 유지 시간(초)
+    PARSE_API_HTTP2: bool = False                   # HTTP/2 사용 여부 (h2 패키지 필요)
+    PARSE_API_CONNECT_TIMEOUT: float = 10.0         # 연결 수립 타임아웃(초)
+    PARSE_API_READ_TIMEOUT: float = 180.0           # 응답 대기 타임아웃(초)
+    PARSE_API_WRITE_TIMEOUT: float = 60.0           # 업로드 타임아웃(초)
+    PARSE_API_POOL_TIMEOUT: float = 30.0            # 커넥션 풀 대기 타임아웃(초)
+    MAX_UPLOAD_BYTES: int = 20 * 1024 * 1024        # 이력서 업로드 최대 크기(바이트)
+
+    # 채용공고(JD) 페이지 수집 설정
+    JD_FETCH_CONNECT_TIMEOUT: float = 10.0          # 연결 수립 타임아웃(초)
+    JD_FETCH_READ_TIMEOUT: float = 30.0             # 응답 대기 타임아웃(초)
+    JD_FETCH_MAX_BYTES: int = 5 * 1024 * 1024       # JD 페이지 최대 크기(바이트)
+    JD_FETCH_MAX_REDIRECTS: int = 5                 # 최대 리다이렉트 횟수
+    JD_FETCH_MAX_CONNECTIONS: int = 50              # 최대 동시 커넥션 수
+    JD_EXTRACT_WORKERS: int = 4                     # 본문 추출 워커 스레드 수
+    JD_CACHE_ENABLED: bool = True                   # JD 페이지/분해 결과 캐시 사용 여부
+    JD_CACHE_FRESH_SECONDS: float = 3600            # 재검증 없이 캐시된 페이지를 사용할 기간(초)
+    JD_CACHE_MEMORY_BYTES: int = 32 * 1024 * 1024       # 메모리 LRU 최대 크기(바이트)
+    JD_CACHE_TTL_SECONDS: float = 30 * 24 * 3600        # 디스크 캐시 유효 기간(초)
+
+    # 비동기 작업(Job) 설정
+    JOB_DB_PATH: str = "jobs.sqlite"                # 작업 테이블 SQLite 파일 경로
+    JOB_SPOOL_DIR: str = "job_spool"                # 작업 업로드 파일 보관 디렉터리
+    JOB_WORKERS: int = 8                            # 전체 최대 동시 실행 작업 수
+    JOB_MAX_QUEUE: int = 100                        # 최대 대기 작업 수 (초과 시 503)
+    JOB_CONCURRENCY: dict[str, int] = {             # 작업 종류 별 최대 동시 실행 수
+        "oneclick_fit": 4,
+        "oneclick_resume": 4,
+    }
+    JOB_RESULT_TTL_SECONDS: float = 24 * 3600       # 완료된 작업 기록 보관 기간(초)
+
+    # 요청 수락(Admission) 제어 설정
+    ADMISSION_CONTROL_ENABLED: bool = True          # 라우터 별 AIMD 동시 실행 한도 사용 여부
+    ADMISSION_PREFIXES: list[str] = ["/oneclick", "/process", "/analyze"]  # 한도를 적용할 라우터 prefix
+    ADMISSION_INITIAL_LIMIT: int = 32               # 라우터 별 초기 동시 실행 한도
+    ADMISSION_MIN_LIMIT: int = 2                    # 한도 하한
+    ADMISSION_MAX_LIMIT: int = 256                  # 한도 상한
+    ADMISSION_LATENCY_TOLERANCE: float = 2.0        # 혼잡으로 판단할 노드 지연 시간 증가 배율 (평소 대비)
+    ADMISSION_BACKOFF_RATIO: float = 0.7            # 혼잡 시 한도에 곱하는 비율
+
+    # 배치 핏 분석 설정
+    BATCH_FIT_CONCURRENCY: int = 8                  # 동시에 평가할 지원자 수
+    BATCH_FIT_MAX_CANDIDATES: int = 500             # 한 번에 요청할 수 있는 최대 지원자 수
+    BATCH_FIT_TOP_K: int | None = None              # 키워드 사전 순위 상위 K명만 LLM 평가 (None이면 전체 평가)
+
+    # 이력서 추출 모드: "multi"(3회 병렬 호출) 또는 "single"(1회 구조화 출력 호출)
+    RESUME_EXTRACTION_MODE: str = "multi"
+    RESUME_EXTRACTION_MODE_OVERRIDES: dict[str, str] = {}   # Workflow 이름 별 추출 모드 (JSON)
+
+    # 응답 캐시 설정
+    CACHE_DB_PATH: str = "cache.sqlite"             # 디스크 캐시 SQLite 파일 경로
+    PARSE_CACHE_ENABLED: bool = True                # PDF Parse 결과 캐시 사용 여부
+    PARSE_CACHE_MEMORY_BYTES: int = 64 * 1024 * 1024    # 메모리 LRU 최대 크기(바이트)
+    PARSE_CACHE_TTL_SECONDS: float = 7 * 24 * 3600      # 디스크 캐시 유효 기간(초)
+    LLM_CACHE_ENABLED: bool = True                  # LLM 응답 캐시 사용 여부
+    LLM_CACHE_MEMORY_BYTES: int = 32 * 1024 * 1024      # 메모리 LRU 최대 크기(바이트)
+    LLM_CACHE_DISK_BYTES: int = 512 * 1024 * 1024       # 디스크 캐시 최대 크기(바이트)
+    LLM_CACHE_TTL_SECONDS: float = 7 * 24 * 3600        # 디스크 캐시 유효 기간(초)
+    LLM_CACHE_DISABLED_NODES: list[str] = ["EvaluateResumeNode", "EvaluateFitNode"]  # 항상 새로 생성할 노드
+
+    # LLM 호출 스케줄러 설정 (프로세스 전체 Gemini 쿼터)
+    LLM_RATE_LIMIT_ENABLED: bool = True             # RPM/TPM 예산 적용 여부
+    LLM_REQUESTS_PER_MINUTE: int = 1000             # 분당 최대 호출 수
+    LLM_TOKENS_PER_MINUTE: int = 1_000_000          # 분당 최대 토큰 수 (입력 + 출력)
+    LLM_OUTPUT_TOKEN_ESTIMATE: int = 1024           # 호출 전 예산 차감에 사용할 예상 출력 토큰 수
+    LLM_LANE_WEIGHTS: dict[str, float] = {          # 레인 별 가중치 (대기 중일 때 실행 비율, interactive/batch 필수, 양수)
+        "interactive": 4,
+        "batch": 1,
+    }
+
     model_config = SettingsConfigDict(env_file=".env")
 
 settings = Settings()
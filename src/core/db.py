@@ -1,49 +1,154 @@
-# import os
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
-# from psycopg_pool import AsyncConnectionPool
-from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
 
+from src.agent.registry import WorkflowRegistry
+from src.agent.modules.blob_store import blob_store, checkpoint_meter
+from src.agent.modules.llm_cache import llm_cache
+from src.agent.modules.llm_scheduler import llm_scheduler
+from src.agent.modules.jd_fetcher import jd_fetcher
+from src.agent.modules.jd_cache import jd_cache
+from src.core.cache import TwoTierCache
+from src.core.checkpointer import open_checkpointer
+from src.core.serde import checkpoint_serde
+from src.core.retention import CheckpointRetention
+from src.core.config import settings
+from src.core.jobs import JobManager
+from src.services.parse_client import ParseClient
+from src.services.job_services import build_job_handlers
+from src.services.snapshots import snapshot_cache
 
-from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
 
 @asynccontextmanager
 async def lifespan_manager(app: FastAPI):
     """
     FastAPI lifespan Checkpointer.
     AgentState가 매 요청마다 초기화되지 않도록 해주는 역할
-    - 서버 시작 시: DB와 연결된 Checkpointer를 생성하여 app.state에 저장
+    - 서버 시작 시: DB와 연결된 Checkpointer를 생성하여 app.state에 저장 (CHECKPOINT_BACKEND: sqlite / postgres)
     - 1회의 DB 연결만으로 모든 요청 처리 가능
+    - 모든 Workflow를 한 번만 컴파일하여 app.state.workflows에 저장
+    - PDF Parse API용 공용 HTTP 커넥션 풀을 app.state.parse_client에 저장
+    - Workflow 실행 작업을 처리하는 worker pool을 app.state.jobs에 저장
+    - LLM 응답 캐시, JD 캐시 저장소와 JD 페이지 수집기를 설정
+    - 모든 LLM 호출이 공유하는 RPM/TPM 예산과 레인 가중치를 설정
+    - 오래된 checkpoint를 주기적으로 정리하는 백그라운드 작업을 app.state.checkpoint_retention에 저장
+    - 큰 상태 필드를 checkpoint 밖에 저장하는 blob 저장소를 설정하고, checkpoint 쓰기 바이트 수를 집계
+    - checkpoint payload는 msgpack으로 인코딩하고 임계값 이상이면 압축 (CHECKPOINT_COMPRESSION)
+    - 결과 조회 API가 사용하는 thread 스냅샷 캐시의 크기를 설정
     """
-    async with AsyncSqliteSaver.from_conn_string("checkpoint.sqlite") as checkpointer:
+    checkpoint_serde.configure(
+        codec=settings.CHECKPOINT_COMPRESSION,
+        min_bytes=settings.CHECKPOINT_COMPRESSION_MIN_BYTES,
+        level=settings.CHECKPOINT_COMPRESSION_LEVEL,
+    )
+    async with open_checkpointer(settings, serde=checkpoint_meter) as checkpointer:
         app.state.checkpointer = checkpointer
-        print("Checkpointer Ready.")
-        yield
-    print("Checkpointer Closed.")
+        print(f"Checkpointer Ready. ({type(checkpointer).__name__})")
+
+        app.state.checkpoint_retention = None
+        if settings.CHECKPOINT_RETENTION_ENABLED:
+            app.state.checkpoint_retention = CheckpointRetention(
+                checkpointer,
+                keep_latest=settings.CHECKPOINT_KEEP_LATEST,
+                ttl_seconds=settings.CHECKPOINT_TTL_SECONDS,
+                interval_seconds=settings.CHECKPOINT_COMPACTION_INTERVAL_SECONDS,
+                blob_store=blob_store,   # 정리 후 참조되지 않는 blob도 삭제 (blob 저장소가 설정된 경우)
+            )
+            # VACUUM 전환은 모든 checkpoint 접근을 막으므로 요청을 받기 전에 실행
+            if settings.CHECKPOINT_CONVERT_AUTO_VACUUM:
+                await app.state.checkpoint_retention.prepare()
+            await app.state.checkpoint_retention.start()
+            print("Checkpoint Retention Ready.")
+
+        if settings.BLOB_STORE_ENABLED:
+            blob_store.configure(
+                TwoTierCache(
+                    "blob",
+                    settings.BLOB_DB_PATH,
+                    max_memory_bytes=settings.BLOB_MEMORY_BYTES,
+                    ttl_seconds=float("inf"),   # checkpoint가 참조하는 동안 사라지면 안 되므로 만료 없음 (정리는 retention sweep)
+                ),
+                min_bytes=settings.BLOB_MIN_BYTES,
+                gc_grace_seconds=settings.BLOB_GC_GRACE_SECONDS,
+            )
+            print("Blob Store Ready.")
+
+        snapshot_cache.configure(max_entries=settings.SNAPSHOT_CACHE_MAX_THREADS)
+
+        if settings.LLM_CACHE_ENABLED:
+            llm_cache.configure(
+                TwoTierCache(
+                    "llm",
+                    settings.CACHE_DB_PATH,
+                    max_memory_bytes=settings.LLM_CACHE_MEMORY_BYTES,
+                    ttl_seconds=settings.LLM_CACHE_TTL_SECONDS,
+                    max_disk_bytes=settings.LLM_CACHE_DISK_BYTES,
+                ),
+                disabled_labels=settings.LLM_CACHE_DISABLED_NODES,
+            )
+            print("LLM Response Cache Ready.")
+
+        if settings.LLM_RATE_LIMIT_ENABLED:
+            llm_scheduler.configure(
+                requests_per_minute=settings.LLM_REQUESTS_PER_MINUTE,
+                tokens_per_minute=settings.LLM_TOKENS_PER_MINUTE,
+                weights=settings.LLM_LANE_WEIGHTS,
+                output_token_estimate=settings.LLM_OUTPUT_TOKEN_ESTIMATE,
+            )
+            print("LLM Scheduler Ready.")
 
+        if settings.JD_CACHE_ENABLED:
+            jd_cache.configure(
+                TwoTierCache(
+                    "jd",
+                    settings.CACHE_DB_PATH,
+                    max_memory_bytes=settings.JD_CACHE_MEMORY_BYTES,
+                    ttl_seconds=settings.JD_CACHE_TTL_SECONDS,
+                ),
+                fresh_seconds=settings.JD_CACHE_FRESH_SECONDS,
+            )
+            print("JD Cache Ready.")
+
+        jd_fetcher.configure(
+            connect_timeout=settings.JD_FETCH_CONNECT_TIMEOUT,
+            read_timeout=settings.JD_FETCH_READ_TIMEOUT,
+            max_bytes=settings.JD_FETCH_MAX_BYTES,
+            max_redirects=settings.JD_FETCH_MAX_REDIRECTS,
+            max_connections=settings.JD_FETCH_MAX_CONNECTIONS,
+            extract_workers=settings.JD_EXTRACT_WORKERS,
+        )
+
+        app.state.workflows = WorkflowRegistry.build(
+            checkpointer,
+            extraction_mode=settings.RESUME_EXTRACTION_MODE,
+            extraction_mode_overrides=settings.RESUME_EXTRACTION_MODE_OVERRIDES,
+        )
+        print(f"Workflow Registry Ready. ({app.state.workflows.stats()['total_build_ms']}ms)")
+
+        async with ParseClient.from_settings(settings) as parse_client:
+            app.state.parse_client = parse_client
+            print("Parse Client Ready.")
+
+            app.state.jobs = JobManager(
+                settings.JOB_DB_PATH,
+                build_job_handlers(app.state.workflows, parse_client),
+                workers=settings.JOB_WORKERS,
+                max_queue=settings.JOB_MAX_QUEUE,
+                concurrency=settings.JOB_CONCURRENCY,
+                spool_dir=settings.JOB_SPOOL_DIR,
+                result_ttl_seconds=settings.JOB_RESULT_TTL_SECONDS,
+            )
+            await app.state.jobs.start()
+            print("Job Workers Ready.")
+            yield
+            await app.state.jobs.stop()
+            print("Job Workers Stopped.")
+        print("Parse Client Closed.")
+
+        if app.state.checkpoint_retention is not None:
+            await app.state.checkpoint_retention.stop()
+        llm_cache.close()
+        jd_cache.close()
+        blob_store.close()
+        await jd_fetcher.aclose()
+    print("Checkpointer Closed.")
 
-# @asynccontextmanager
-# async def lifespan_manager(app: FastAPI):
-#     # 1. 환경 변수에서 DB URL 로드
-#     DB_URL = os.environ.get("LANGGRAPH_DB_URL")
-#     if not DB_URL:
-#         raise RuntimeError("LANGGRAPH_DB_URL 환경 변수가 설정되지 않았습니다.")
-    
-#     # 2. 커넥션 풀 생성 및 앱 상태에 저장
-#     pool = AsyncConnectionPool(conninfo=DB_URL, open=False, kwargs={"prepare_threshold": None})
-#     await pool.open()
-#     app.state.db_pool = pool
-    
-#     # 3. Checkpointer 생성 및 앱 상태에 저장
-#     checkpointer = AsyncSqliteSaver(pool)
-#     await checkpointer.setup()
-#     app.state.checkpointer = checkpointer
-    
-#     print("Database pool and checkpointer are set up.")
-    
-#     try:
-#         yield # 애플리케이션 실행
-#     finally:
-#         # 4. 앱 종료 시 자원 정리
-#         await pool.close()
-#         print("PostgreSQL Pool Closed.")
@@ -0,0 +1,21 @@
+"""해시 유틸리티 모듈
+캐시 키, 콘텐츠 주소 등에 사용하는 해시 함수를 정의합니다.
+"""
+import hashlib
+import json
+
+
+def sha256_hex(data: bytes | str) -> str:
+    """bytes 또는 str의 SHA-256 hex digest를 반환합니다."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+def fingerprint(*parts) -> str:
+    """여러 값을 정규화된 JSON으로 직렬화한 뒤 SHA-256 hex digest를 반환합니다.
+
+    dict의 키 순서와 무관하게 같은 값이면 같은 fingerprint가 생성됩니다.
+    """
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return sha256_hex(payload)
@@ -0,0 +1,320 @@
+"""비동기 작업(Job) 모듈
+
+Workflow 실행을 작업으로 등록하고, 작업 종류(kind) 별 대기열과 worker가 작업을 처리합니다.
+작업 상태와 결과는 SQLite 테이블에 저장되어, 서버가 재시작되어도 대기 중이던 작업이 다시 실행됩니다.
+"""
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Awaitable, Callable
+
+from fastapi import HTTPException, UploadFile
+
+
+JobHandler = Callable[[dict], Awaitable[dict]]
+
+SPOOL_CHUNK_SIZE = 64 * 1024
+
+
+class JobManager:
+    """작업 대기열과 worker pool
+
+    - 대기열이 가득 차면 submit은 503을 반환하고, 함께 전달된 업로드 spool 파일을 삭제합니다.
+    - 작업 종류 별로 대기열과 worker(종류 별 최대 동시 실행 수만큼)를 따로 두어,
+      한 종류가 동시 실행 한도에 도달해도 다른 종류의 작업은 기다리지 않습니다.
+    - 전체 동시 실행 수는 workers로 제한합니다.
+    - 처리 중(running)이던 작업은 재시작 시 다시 대기열에 등록됩니다.
+
+    예시:
+    ```python
+    jobs = JobManager("jobs.sqlite", handlers, workers=8, max_queue=100)
+    await jobs.start()
+    job_id = await jobs.submit("analyze_fit", {"thread_id": thread_id})
+    result = await jobs.run("analyze_fit", {"thread_id": thread_id})  # 제출 후 완료까지 대기
+    ```
+    """
+
+    def __init__(
+        self,
+        path: str,
+        handlers: dict[str, JobHandler],
+        workers: int = 8,
+        max_queue: int = 100,
+        concurrency: dict[str, int] | None = None,
+        spool_dir: str = "job_spool",
+        result_ttl_seconds: float = 24 * 3600,
+    ):
+        """
+        Args:
+            path (str): 작업 테이블 SQLite 파일 경로
+            handlers (dict[str, JobHandler]): 작업 종류 별 처리 함수 (payload를 받아 JSON 결과를 반환)
+            workers (int): 전체 최대 동시 실행 수
+            max_queue (int): 최대 대기 작업 수 (모든 종류의 합)
+            concurrency (dict[str, int] | None): 작업 종류 별 최대 동시 실행 수 (없으면 workers)
+            spool_dir (str): 업로드 파일을 보관할 디렉터리
+            result_ttl_seconds (float): 완료된 작업 기록의 보관 기간(초)
+        """
+        self.handlers = handlers
+        self.workers = workers
+        self.max_queue = max_queue
+        self.spool_dir = spool_dir
+        self.result_ttl_seconds = result_ttl_seconds
+        self.concurrency = {kind: min(workers, (concurrency or {}).get(kind, workers)) for kind in handlers}
+        self._slots = asyncio.Semaphore(workers)
+
+        self._queues: dict[str, asyncio.Queue[str]] = {kind: asyncio.Queue() for kind in handlers}
+        self._waiters: dict[str, asyncio.Future] = {}
+        self._tasks: list[asyncio.Task] = []
+        self._running: dict[str, int] = {kind: 0 for kind in handlers}
+        self._db_lock = threading.Lock()
+        self.counters = {"submitted": 0, "rejected": 0, "succeeded": 0, "failed": 0, "recovered": 0}
+        self._wait_ms = 0.0
+        self._run_ms = 0.0
+
+        os.makedirs(spool_dir, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "id TEXT PRIMARY KEY, kind TEXT NOT NULL, status TEXT NOT NULL, payload TEXT NOT NULL, "
+            "result TEXT, error TEXT, status_code INTEGER, "
+            "created_at REAL NOT NULL, started_at REAL, finished_at REAL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at)")
+        self._conn.commit()
+
+    async def start(self):
+        """오래된 완료 기록을 정리하고, 미완료 작업을 대기열에 다시 등록한 뒤 worker를 시작합니다."""
+        pending = await asyncio.to_thread(self._recover)
+        for job_id, kind in pending:
+            if kind not in self._queues:
+                print(f"Skipping recovered job with unknown kind ({kind}, {job_id}).")
+                continue
+            self._queues[kind].put_nowait(job_id)
+            self.counters["recovered"] += 1
+        if pending:
+            print(f"Recovered {self.counters['recovered']} pending jobs.")
+        self._tasks = [
+            asyncio.create_task(self._worker(kind))
+            for kind, limit in self.concurrency.items()
+            for _ in range(limit)
+        ]
+
+    async def stop(self):
+        """worker를 중지합니다. 실행 중이던 작업은 다음 시작 시 다시 실행됩니다."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        with self._db_lock:
+            self._conn.close()
+
+    async def submit(self, kind: str, payload: dict) -> str:
+        """작업을 등록하고 job_id를 즉시 반환합니다.
+
+        등록에 실패하면 payload의 업로드 spool 파일은 작업이 삭제할 수 없으므로 여기서 삭제합니다.
+
+        Raises:
+            HTTPException: 알 수 없는 작업 종류(400) 또는 대기열 초과(503)
+        """
+        try:
+            if kind not in self.handlers:
+                raise HTTPException(status_code=400, detail=f"Unknown job kind: {kind!r}")
+            if self.queued() >= self.max_queue:
+                self.counters["rejected"] += 1
+                raise HTTPException(status_code=503, detail="Job queue is full. Please retry later.", headers={"Retry-After": "5"})
+
+            job_id = uuid.uuid4().hex
+            await asyncio.to_thread(self._insert, job_id, kind, payload)
+        except Exception:
+            self._remove_upload(payload)
+            raise
+        self._queues[kind].put_nowait(job_id)
+        self.counters["submitted"] += 1
+        return job_id
+
+    def queued(self) -> int:
+        """모든 작업 종류의 대기 작업 수를 반환합니다."""
+        return sum(queue.qsize() for queue in self._queues.values())
+
+    async def wait(self, job_id: str) -> dict:
+        """작업이 끝날 때까지 기다린 뒤 작업 기록을 반환합니다. (결과를 DB에 기록하지 못했으면 실패 기록)"""
+        # 상태 조회 중에 작업이 끝나도 알림을 놓치지 않도록 대기자를 먼저 등록
+        future = self._waiters.get(job_id)
+        if future is None:
+            future = self._waiters[job_id] = asyncio.get_running_loop().create_future()
+
+        job = await self.get(job_id)
+        if job is None or job["status"] in ("succeeded", "failed"):
+            self._notify(job_id)
+            return job
+        # 대기자가 취소되어도(클라이언트 연결 종료) 작업과 다른 대기자에는 영향을 주지 않음
+        failure = await asyncio.shield(future)
+        if failure is not None:
+            return failure
+        return await self.get(job_id)
+
+    async def run(self, kind: str, payload: dict) -> dict:
+        """작업을 등록하고 완료될 때까지 기다린 뒤 결과를 반환합니다. (동기 엔드포인트용)
+
+        Raises:
+            HTTPException: 작업이 실패한 경우 작업에서 발생한 상태 코드와 메시지
+        """
+        job = await self.wait(await self.submit(kind, payload))
+        if job["status"] == "failed":
+            raise HTTPException(status_code=job["status_code"], detail=job["error"])
+        return job["result"]
+
+    async def get(self, job_id: str) -> dict | None:
+        """작업 기록(상태, 결과, 오류, 시각)을 반환합니다."""
+        row = await asyncio.to_thread(self._select, job_id)
+        if row is None:
+            return None
+        job_id, kind, status, payload, result, error, status_code, created_at, started_at, finished_at = row
+        return {
+            "job_id": job_id,
+            "kind": kind,
+            "status": status,
+            "thread_id": json.loads(payload).get("thread_id"),
+            "result": json.loads(result) if result is not None else None,
+            "error": error,
+            "status_code": status_code,
+            "created_at": created_at,
+            "started_at": started_at,
+            "finished_at": finished_at,
+        }
+
+    async def spool_upload(self, upload: UploadFile) -> dict:
+        """업로드 파일을 spool 디렉터리에 청크 단위로 복사하고, payload에 넣을 파일 정보를 반환합니다."""
+        path = os.path.join(self.spool_dir, uuid.uuid4().hex)
+        await upload.seek(0)
+        with open(path, "wb") as spool:
+            while chunk := await upload.read(SPOOL_CHUNK_SIZE):
+                await asyncio.to_thread(spool.write, chunk)
+        return {"path": path, "filename": upload.filename, "content_type": upload.content_type}
+
+    @staticmethod
+    def _remove_upload(payload: dict):
+        upload = payload.get("upload")
+        if upload is not None and os.path.exists(upload["path"]):
+            os.remove(upload["path"])
+
+    async def _worker(self, kind: str):
+        # 종류 별 worker 수가 곧 종류 별 동시 실행 한도이므로, 다른 종류의 대기열을 막지 않음
+        queue = self._queues[kind]
+        while True:
+            job_id = await queue.get()
+            try:
+                async with self._slots:
+                    await self._execute(job_id)
+            except Exception as exc:
+                print(f"Job worker error ({job_id}): {exc!r}")
+            finally:
+                queue.task_done()
+
+    async def _execute(self, job_id: str):
+        payload, failure = {}, None
+        try:
+            row = await asyncio.to_thread(self._select, job_id)
+            if row is None or row[2] not in ("queued", "running"):
+                return
+            kind, payload, created_at = row[1], json.loads(row[3]), row[7]
+
+            started_at = time.time()
+            await asyncio.to_thread(self._update, job_id, status="running", started_at=started_at)
+            self._running[kind] += 1
+            try:
+                result = await self.handlers[kind](payload)
+                update = {"status": "succeeded", "result": json.dumps(result, ensure_ascii=False, default=str)}
+                self.counters["succeeded"] += 1
+            except HTTPException as exc:
+                update = {"status": "failed", "error": str(exc.detail), "status_code": exc.status_code}
+                self.counters["failed"] += 1
+            except Exception as exc:
+                print(f"Job failed ({kind}, {job_id}): {exc!r}")
+                update = {"status": "failed", "error": repr(exc), "status_code": 500}
+                self.counters["failed"] += 1
+            finally:
+                self._running[kind] -= 1
+
+            finished_at = time.time()
+            self._wait_ms += (started_at - created_at) * 1000
+            self._run_ms += (finished_at - started_at) * 1000
+            await asyncio.to_thread(self._update, job_id, finished_at=finished_at, **update)
+        except Exception as exc:
+            # 상태 기록에 실패해도(database is locked 등) 대기자가 끝없이 기다리지 않도록 실패 기록을 직접 전달
+            print(f"Job state update failed ({job_id}): {exc!r}")
+            failure = self._failed_record(job_id, payload, f"Job state could not be recorded: {exc!r}")
+        finally:
+            self._remove_upload(payload)
+            self._notify(job_id, failure)
+
+    @staticmethod
+    def _failed_record(job_id: str, payload: dict, error: str) -> dict:
+        """DB에 기록하지 못한 작업의 실패 기록 (get과 같은 형식)"""
+        return {
+            "job_id": job_id,
+            "kind": None,
+            "status": "failed",
+            "thread_id": payload.get("thread_id"),
+            "result": None,
+            "error": error,
+            "status_code": 500,
+            "created_at": None,
+            "started_at": None,
+            "finished_at": time.time(),
+        }
+
+    def _notify(self, job_id: str, failure: dict | None = None):
+        """대기자를 깨웁니다. failure가 있으면 DB 대신 이 실패 기록을 wait의 결과로 전달합니다."""
+        future = self._waiters.pop(job_id, None)
+        if future is not None and not future.done():
+            future.set_result(failure)
+
+    def _recover(self) -> list[tuple[str, str]]:
+        with self._db_lock:
+            self._conn.execute(
+                "DELETE FROM jobs WHERE status IN ('succeeded', 'failed') AND finished_at <= ?",
+                (time.time() - self.result_ttl_seconds,),
+            )
+            self._conn.execute("UPDATE jobs SET status = 'queued', started_at = NULL WHERE status = 'running'")
+            self._conn.commit()
+            rows = self._conn.execute("SELECT id, kind FROM jobs WHERE status = 'queued' ORDER BY created_at").fetchall()
+        return [(job_id, kind) for job_id, kind in rows]
+
+    def _insert(self, job_id: str, kind: str, payload: dict):
+        with self._db_lock:
+            self._conn.execute(
+                "INSERT INTO jobs (id, kind, status, payload, created_at) VALUES (?, ?, 'queued', ?, ?)",
+                (job_id, kind, json.dumps(payload, ensure_ascii=False), time.time()),
+            )
+            self._conn.commit()
+
+    def _update(self, job_id: str, **fields):
+        columns = ", ".join(f"{name} = ?" for name in fields)
+        with self._db_lock:
+            self._conn.execute(f"UPDATE jobs SET {columns} WHERE id = ?", (*fields.values(), job_id))
+            self._conn.commit()
+
+    def _select(self, job_id: str):
+        with self._db_lock:
+            return self._conn.execute(
+                "SELECT id, kind, status, payload, result, error, status_code, created_at, started_at, finished_at "
+                "FROM jobs WHERE id = ?",
+                (job_id,),
+            ).fetchone()
+
+    def stats(self) -> dict:
+        """대기/실행 중인 작업 수, 처리 카운터, 평균 대기/실행 시간을 반환합니다."""
+        finished = self.counters["succeeded"] + self.counters["failed"]
+        return {
+            **self.counters,
+            "queued": {kind: queue.qsize() for kind, queue in self._queues.items()},
+            "running": dict(self._running),
+            "avg_wait_ms": round(self._wait_ms / finished, 1) if finished else 0.0,
+            "avg_run_ms": round(self._run_ms / finished, 1) if finished else 0.0,
+        }
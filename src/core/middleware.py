@@ -0,0 +1,92 @@
+"""ASGI 미들웨어 모듈
+FastAPI 앱에 등록하는 요청 단위 미들웨어를 정의합니다.
+"""
+import json
+import time
+
+from src.core.admission import AdmissionController
+
+
+async def _send_json(send, status: int, detail: str, headers: list[tuple[bytes, bytes]] = ()):
+    body = json.dumps({"detail": detail}).encode()
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            *headers,
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+class UploadSizeLimitMiddleware:
+    """Content-Length가 허용 크기를 넘는 multipart 업로드를 본문 수신 전에 거절하는 미들웨어
+
+    Starlette는 핸들러 호출 전에 multipart 본문 전체를 spool 파일에 기록하므로,
+    큰 요청은 헤더 단계에서 413으로 조기 거절합니다.
+    """
+
+    # multipart boundary, thread_id 등 파일 외 필드를 위한 여유분
+    MULTIPART_OVERHEAD = 64 * 1024
+
+    def __init__(self, app, max_upload_bytes: int):
+        self.app = app
+        self.max_body_bytes = max_upload_bytes + self.MULTIPART_OVERHEAD
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            headers = dict(scope["headers"])
+            content_type = headers.get(b"content-type", b"")
+            content_length = headers.get(b"content-length")
+            if (
+                content_type.startswith(b"multipart/form-data")
+                and content_length is not None
+                and content_length.isdigit()
+                and int(content_length) > self.max_body_bytes
+            ):
+                await _send_json(send, 413, "Request body exceeds the maximum upload size.", [(b"connection", b"close")])
+                return
+
+        await self.app(scope, receive, send)
+
+
+class AdmissionControlMiddleware:
+    """라우터 별 동시 실행 한도를 넘는 Workflow 요청(POST)을 즉시 503과 Retry-After로 거절하는 미들웨어
+
+    처리 중인 요청 수와 응답 상태, 소요 시간을 AdmissionController에 전달하여 AIMD 한도 조정에 사용합니다.
+    스트리밍 응답은 본문 전송이 끝날 때까지 처리 중인 요청으로 집계됩니다.
+    """
+
+    def __init__(self, app, controller: AdmissionController):
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "POST" or not self.controller.enabled:
+            await self.app(scope, receive, send)
+            return
+        route = self.controller.route(scope["path"])
+        if route is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not self.controller.try_acquire(route):
+            retry_after = str(self.controller.retry_after(route)).encode()
+            await _send_json(send, 503, "Server is overloaded. Please retry later.", [(b"retry-after", retry_after)])
+            return
+
+        status = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self.controller.release(route, (time.perf_counter() - started) * 1000, status)
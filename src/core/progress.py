@@ -0,0 +1,139 @@
+"""진행 상황 이벤트 모듈
+
+thread_id 단위로 노드/단계의 시작과 종료 이벤트를 발행하고 구독하는 in-process pub/sub을 정의합니다.
+늦게 연결한 구독자도 진행 상황을 알 수 있도록 thread_id 별 최근 이벤트를 보관하여 먼저 재생합니다.
+"""
+import asyncio
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable
+
+
+class ProgressBroker:
+    """thread_id 별 진행 상황 이벤트 브로커
+
+    예시:
+    ```python
+    async with progress_broker.track(thread_id, "JDDecompositionNode") as step:
+        result = await node.execute(state)
+        step["keys"] = list(result)
+
+    async for event in progress_broker.subscribe(thread_id):
+        ...
+    ```
+    """
+
+    def __init__(self, history_size: int = 200, max_threads: int = 1000, queue_size: int = 1000):
+        """
+        Args:
+            history_size (int): thread_id 별로 보관할 최근 이벤트 수
+            max_threads (int): 이벤트를 보관할 최대 thread_id 수 (초과 시 가장 오래된 thread부터 제거)
+            queue_size (int): 구독자 별 대기열 최대 크기 (가득 차면 이벤트를 버림)
+        """
+        self.history_size = history_size
+        self.max_threads = max_threads
+        self.queue_size = queue_size
+        self._history: OrderedDict[str, deque] = OrderedDict()
+        self._subscribers: dict[str, set[asyncio.Queue]] = {}
+        self._listeners: list[Callable[[dict], None]] = []
+        self._seq = 0
+        self.counters = {"published": 0, "delivered": 0, "dropped": 0}
+
+    def add_listener(self, listener: Callable[[dict], None]):
+        """모든 thread의 이벤트를 발행 즉시 동기적으로 전달받을 함수를 등록합니다. (예: thread 상태 캐시 무효화)"""
+        self._listeners.append(listener)
+
+    def publish(self, thread_id: str | None, event: dict):
+        """이벤트에 순번과 시각을 붙여 보관하고 구독자에게 전달합니다."""
+        if thread_id is None:
+            return
+        self._seq += 1
+        event = {"seq": self._seq, "thread_id": thread_id, "ts": round(time.time(), 3), **event}
+
+        history = self._history.get(thread_id)
+        if history is None:
+            history = self._history[thread_id] = deque(maxlen=self.history_size)
+            while len(self._history) > self.max_threads:
+                self._history.popitem(last=False)
+        else:
+            self._history.move_to_end(thread_id)
+        history.append(event)
+        self.counters["published"] += 1
+
+        for listener in self._listeners:
+            listener(event)
+
+        for queue in self._subscribers.get(thread_id, ()):
+            try:
+                queue.put_nowait(event)
+                self.counters["delivered"] += 1
+            except asyncio.QueueFull:
+                self.counters["dropped"] += 1
+
+    @asynccontextmanager
+    async def track(self, thread_id: str | None, name: str, kind: str = "node"):
+        """블록 실행 전후로 start/end(실패 시 error) 이벤트를 발행합니다.
+
+        블록 안에서 반환된 dict에 "keys"를 설정하면 end 이벤트에 기록된 상태 키 목록으로 포함됩니다.
+
+        Args:
+            thread_id (str | None): 이벤트를 발행할 thread_id (None이면 발행하지 않음)
+            name (str): 노드 또는 단계 이름
+            kind (str): "node", "stage", "workflow" 중 하나
+        """
+        step: dict = {}
+        started = time.perf_counter()
+        self.publish(thread_id, {"type": "start", "kind": kind, "name": name})
+        try:
+            yield step
+        except BaseException as exc:
+            self.publish(thread_id, {
+                "type": "error",
+                "kind": kind,
+                "name": name,
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+                "error": repr(exc),
+            })
+            raise
+        self.publish(thread_id, {
+            "type": "end",
+            "kind": kind,
+            "name": name,
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+            "keys": step.get("keys", []),
+        })
+
+    async def subscribe(self, thread_id: str, heartbeat: float = 15.0) -> AsyncIterator[dict]:
+        """보관된 최근 이벤트를 먼저 전달한 뒤, 새 이벤트를 계속 전달합니다.
+
+        heartbeat초 동안 이벤트가 없으면 연결 유지를 위해 {"type": "ping"}을 전달합니다.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        self._subscribers.setdefault(thread_id, set()).add(queue)
+        try:
+            for event in list(self._history.get(thread_id, ())):
+                yield event
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=heartbeat)
+                except asyncio.TimeoutError:
+                    event = {"type": "ping"}
+                yield event
+        finally:
+            subscribers = self._subscribers.get(thread_id)
+            if subscribers is not None:
+                subscribers.discard(queue)
+                if not subscribers:
+                    del self._subscribers[thread_id]
+
+    def stats(self) -> dict:
+        """발행/전달/버림 카운터와 현재 구독자 수를 반환합니다."""
+        return {
+            **self.counters,
+            "threads": len(self._history),
+            "subscribers": sum(len(s) for s in self._subscribers.values()),
+        }
+
+
+progress_broker = ProgressBroker()
@@ -0,0 +1,413 @@
+"""Checkpoint 보관 정책(Retention) 모듈
+
+Workflow를 실행할 때마다 thread_id에 super-step 별 checkpoint가 누적되므로,
+주기적으로 thread(와 checkpoint_ns) 별 최신 N개 또는 TTL보다 새로운 checkpoint만 남기고 나머지를 삭제합니다.
+- 삭제한 checkpoint의 writes와, 어느 checkpoint에도 연결되지 않은 writes/blobs(Postgres)를 함께 삭제합니다.
+- SQLite는 incremental vacuum으로 빈 페이지를 파일에서 반환하고 WAL 파일을 비웁니다.
+  (auto_vacuum이 꺼진 기존 DB의 전환은 DB 전체를 다시 쓰므로 서버 시작 시 prepare로만 실행합니다)
+- BlobStore가 설정되어 있으면 정리 후 남은 checkpoint/writes가 참조하는 digest를 수집하여,
+  참조되지 않고 grace 기간보다 오래된 blob을 blob 저장소에서 삭제합니다. (BlobStore.sweep)
+- 정리 전후의 파일 크기와 최근 thread 상태 조회 지연 시간을 측정하여 보고합니다.
+checkpoint 생성 시각은 uuid6 형식의 checkpoint_id에서 계산하므로 checkpoint 본문을 역직렬화하지 않습니다.
+"""
+import asyncio
+import os
+import time
+import uuid
+from typing import Callable
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+from src.core.stats import percentile
+
+
+# uuid6 타임스탬프 기준 시각(1582-10-15)과 Unix epoch의 차이 (100ns 단위)
+UUID_EPOCH_OFFSET = 0x01B21DD213814000
+
+
+# 참조 수집 함수: (serializer type, 직렬화된 바이트) → digest 집합 (blob_store.scan_refs)
+RefScanner = Callable[[str, bytes], set[str]]
+
+
+def _scan_rows(scan: RefScanner, rows: list) -> set[str]:
+    referenced: set[str] = set()
+    for type_, data in rows:
+        referenced |= scan(type_, data)
+    return referenced
+
+
+def checkpoint_timestamp(checkpoint_id: str) -> float:
+    """uuid6 checkpoint_id에 기록된 생성 시각(Unix time, 초)을 반환합니다."""
+    value = uuid.UUID(checkpoint_id).int
+    ticks = ((value >> 96) & 0xFFFFFFFF) << 28 | ((value >> 80) & 0xFFFF) << 12 | ((value >> 64) & 0x0FFF)
+    return (ticks - UUID_EPOCH_OFFSET) / 1e7
+
+
+class _SqliteStore:
+    """AsyncSqliteSaver의 커넥션과 잠금을 공유하여 정리 쿼리를 실행합니다."""
+
+    def __init__(self, saver: AsyncSqliteSaver, vacuum_pages: int = 1000):
+        self.saver = saver
+        self.conn = saver.conn
+        self.vacuum_pages = vacuum_pages
+
+    async def candidates(self, keep_latest: int) -> list[tuple[str, str, str]]:
+        async with self.saver.lock, self.conn.execute(
+            "SELECT thread_id, checkpoint_ns, checkpoint_id FROM ("
+            "SELECT thread_id, checkpoint_ns, checkpoint_id, ROW_NUMBER() OVER ("
+            "PARTITION BY thread_id, checkpoint_ns ORDER BY checkpoint_id DESC) AS rank FROM checkpoints"
+            ") WHERE rank > ?",
+            (keep_latest,),
+        ) as cursor:
+            return [tuple(row) for row in await cursor.fetchall()]
+
+    async def delete(self, keys: list[tuple[str, str, str]]) -> tuple[int, int]:
+        async with self.saver.lock:
+            checkpoints = await self.conn.executemany(
+                "DELETE FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?", keys
+            )
+            writes = await self.conn.executemany(
+                "DELETE FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?", keys
+            )
+            await self.conn.commit()
+        return checkpoints.rowcount, writes.rowcount
+
+    async def delete_orphans(self) -> tuple[int, int]:
+        async with self.saver.lock:
+            cursor = await self.conn.execute(
+                "DELETE FROM writes WHERE NOT EXISTS (SELECT 1 FROM checkpoints c WHERE c.thread_id = writes.thread_id "
+                "AND c.checkpoint_ns = writes.checkpoint_ns AND c.checkpoint_id = writes.checkpoint_id)"
+            )
+            await self.conn.commit()
+        # SQLite saver는 채널 값을 checkpoint에 함께 저장하므로 별도 blob 테이블이 없음
+        return cursor.rowcount, 0
+
+    async def _pragma(self, statement: str) -> list:
+        async with self.conn.execute(statement) as cursor:
+            return await cursor.fetchall()
+
+    async def _incremental(self) -> bool:
+        return (await self._pragma("PRAGMA auto_vacuum"))[0][0] == 2
+
+    async def prepare(self):
+        """auto_vacuum이 꺼진 기존 DB를 VACUUM으로 INCREMENTAL 모드로 전환합니다.
+
+        VACUUM은 DB 파일 전체를 다시 쓰는 동안 모든 checkpoint 읽기/쓰기를 막으므로,
+        요청을 받기 전(lifespan 시작 시)에만 호출합니다.
+        """
+        async with self.saver.lock:
+            if await self._incremental():
+                return
+            started = time.perf_counter()
+            await self.conn.commit()
+            await self._pragma("PRAGMA auto_vacuum=INCREMENTAL")
+            await self._pragma("VACUUM")
+            print(f"Checkpoint DB converted to incremental auto_vacuum. ({round((time.perf_counter() - started) * 1000, 1)}ms)")
+
+    async def vacuum(self) -> int:
+        """빈 페이지를 파일에서 반환합니다. (INCREMENTAL 모드가 아닌 DB는 빈 페이지를 재사용만 하고 파일은 줄이지 않음)"""
+        async with self.saver.lock:
+            incremental = await self._incremental()
+
+        freed = 0
+        while incremental:
+            async with self.saver.lock:
+                free_pages = (await self._pragma("PRAGMA freelist_count"))[0][0]
+                if not free_pages:
+                    break
+                # 한 번에 vacuum_pages씩만 반환하고 잠금을 풀어 Workflow의 checkpoint 쓰기가 밀리지 않도록 함
+                await self._pragma(f"PRAGMA incremental_vacuum({self.vacuum_pages})")
+                await self.conn.commit()
+                freed += min(free_pages, self.vacuum_pages)
+        async with self.saver.lock:
+            await self._pragma("PRAGMA wal_checkpoint(TRUNCATE)")
+        return freed
+
+    async def size_bytes(self) -> int:
+        async with self.saver.lock:
+            rows = await self._pragma("PRAGMA database_list")
+        path = next((row[2] for row in rows if row[1] == "main"), "")
+        if not path:
+            return 0
+        return sum(os.path.getsize(file) for file in (path, path + "-wal") if os.path.exists(file))
+
+    async def recent_threads(self, limit: int) -> list[str]:
+        async with self.saver.lock, self.conn.execute(
+            "SELECT thread_id FROM checkpoints WHERE checkpoint_ns = '' "
+            "GROUP BY thread_id ORDER BY MAX(checkpoint_id) DESC LIMIT ?",
+            (limit,),
+        ) as cursor:
+            return [row[0] for row in await cursor.fetchall()]
+
+    async def referenced_blobs(self, scan: RefScanner, batch_size: int = 500) -> set[str]:
+        """checkpoint 본문/metadata와 writes 값에 포함된 blob 참조를 수집합니다.
+
+        rowid 순서로 batch_size행씩 읽고 잠금을 풀어 Workflow의 checkpoint 쓰기가 밀리지 않도록 하며,
+        압축 해제와 참조 검색은 워커 스레드에서 실행합니다.
+        """
+        referenced: set[str] = set()
+        queries = (
+            "SELECT rowid, type, checkpoint, metadata FROM checkpoints WHERE rowid > ? ORDER BY rowid LIMIT ?",
+            "SELECT rowid, type, value, NULL FROM writes WHERE rowid > ? ORDER BY rowid LIMIT ?",
+        )
+        for query in queries:
+            last_rowid = 0
+            while True:
+                async with self.saver.lock, self.conn.execute(query, (last_rowid, batch_size)) as cursor:
+                    rows = await cursor.fetchall()
+                if not rows:
+                    break
+                last_rowid = rows[-1][0]
+                payloads = [(type_, data) for _, type_, data, _ in rows]
+                payloads += [("json", metadata) for *_, metadata in rows if metadata]
+                referenced |= await asyncio.to_thread(_scan_rows, scan, payloads)
+        return referenced
+
+
+class _PostgresStore:
+    """AsyncPostgresSaver의 커넥션 풀로 정리 쿼리를 실행합니다."""
+
+    TABLES = ("checkpoints", "checkpoint_writes", "checkpoint_blobs")
+
+    def __init__(self, saver: BaseCheckpointSaver):
+        self.pool = saver.conn
+
+    async def candidates(self, keep_latest: int) -> list[tuple[str, str, str]]:
+        async with self.pool.connection() as conn:
+            cursor = await conn.execute(
+                "SELECT thread_id, checkpoint_ns, checkpoint_id FROM ("
+                "SELECT thread_id, checkpoint_ns, checkpoint_id, ROW_NUMBER() OVER ("
+                "PARTITION BY thread_id, checkpoint_ns ORDER BY checkpoint_id DESC) AS rank FROM checkpoints"
+                ") ranked WHERE rank > %s",
+                (keep_latest,),
+            )
+            return [(row["thread_id"], row["checkpoint_ns"], row["checkpoint_id"]) for row in await cursor.fetchall()]
+
+    async def delete(self, keys: list[tuple[str, str, str]]) -> tuple[int, int]:
+        async with self.pool.connection() as conn, conn.transaction(), conn.cursor() as cursor:
+            await cursor.executemany(
+                "DELETE FROM checkpoints WHERE thread_id = %s AND checkpoint_ns = %s AND checkpoint_id = %s", keys
+            )
+            checkpoints = cursor.rowcount
+            await cursor.executemany(
+                "DELETE FROM checkpoint_writes WHERE thread_id = %s AND checkpoint_ns = %s AND checkpoint_id = %s", keys
+            )
+            return checkpoints, cursor.rowcount
+
+    async def delete_orphans(self) -> tuple[int, int]:
+        async with self.pool.connection() as conn:
+            writes = await conn.execute(
+                "DELETE FROM checkpoint_writes w WHERE NOT EXISTS (SELECT 1 FROM checkpoints c "
+                "WHERE c.thread_id = w.thread_id AND c.checkpoint_ns = w.checkpoint_ns AND c.checkpoint_id = w.checkpoint_id)"
+            )
+            # 남은 checkpoint 어디에서도 참조하지 않는 채널 값 중, 저장된 최신 버전보다 오래된 것만 삭제
+            # (실행 중인 Workflow가 checkpoint보다 먼저 기록한 새 버전의 값은 남김)
+            blobs = await conn.execute(
+                "DELETE FROM checkpoint_blobs b WHERE NOT EXISTS (SELECT 1 FROM checkpoints c "
+                "WHERE c.thread_id = b.thread_id AND c.checkpoint_ns = b.checkpoint_ns "
+                "AND c.checkpoint -> 'channel_versions' ->> b.channel = b.version) "
+                "AND b.version < (SELECT MAX(c.checkpoint -> 'channel_versions' ->> b.channel) FROM checkpoints c "
+                "WHERE c.thread_id = b.thread_id AND c.checkpoint_ns = b.checkpoint_ns)"
+            )
+            return writes.rowcount, blobs.rowcount
+
+    async def prepare(self):
+        pass
+
+    async def vacuum(self) -> int:
+        # Postgres VACUUM은 파일을 줄이지 않고 빈 공간을 재사용 가능하게 표시 (autocommit 커넥션에서 실행)
+        async with self.pool.connection() as conn:
+            await conn.execute(f"VACUUM (ANALYZE) {', '.join(self.TABLES)}")
+        return 0
+
+    async def size_bytes(self) -> int:
+        async with self.pool.connection() as conn:
+            cursor = await conn.execute(
+                "SELECT " + " + ".join(f"pg_total_relation_size('{table}')" for table in self.TABLES) + " AS size"
+            )
+            return int((await cursor.fetchone())["size"])
+
+    async def recent_threads(self, limit: int) -> list[str]:
+        async with self.pool.connection() as conn:
+            cursor = await conn.execute(
+                "SELECT thread_id FROM checkpoints WHERE checkpoint_ns = '' "
+                "GROUP BY thread_id ORDER BY MAX(checkpoint_id) DESC LIMIT %s",
+                (limit,),
+            )
+            return [row["thread_id"] for row in await cursor.fetchall()]
+
+    async def referenced_blobs(self, scan: RefScanner, batch_size: int = 500) -> set[str]:
+        """checkpoint 본문/metadata(JSONB)와 checkpoint_blobs, checkpoint_writes 값에 포함된 blob 참조를 수집합니다."""
+        referenced: set[str] = set()
+        queries = (
+            "SELECT 'json' AS type, convert_to(checkpoint::text || metadata::text, 'UTF8') AS blob FROM checkpoints",
+            "SELECT type, blob FROM checkpoint_blobs WHERE blob IS NOT NULL",
+            "SELECT type, blob FROM checkpoint_writes WHERE blob IS NOT NULL",
+        )
+        async with self.pool.connection() as conn, conn.transaction():
+            for index, query in enumerate(queries):
+                # 서버 측 커서로 batch_size행씩 읽어 테이블 전체를 메모리에 올리지 않음
+                async with conn.cursor(name=f"retention_refs_{index}") as cursor:
+                    await cursor.execute(query)
+                    while rows := await cursor.fetchmany(batch_size):
+                        payloads = [(row["type"], bytes(row["blob"])) for row in rows]
+                        referenced |= await asyncio.to_thread(_scan_rows, scan, payloads)
+        return referenced
+
+
+class CheckpointRetention:
+    """Checkpoint 보관 정책을 주기적으로 적용하는 백그라운드 정리 작업
+
+    thread(checkpoint_ns) 별로 최신 keep_latest개와, ttl_seconds보다 새로운 checkpoint는 항상 남깁니다.
+
+    예시:
+    ```python
+    retention = CheckpointRetention(checkpointer, keep_latest=20, ttl_seconds=24 * 3600)
+    await retention.prepare()   # 요청을 받기 전에 1회 (SQLite auto_vacuum 전환)
+    await retention.start()   # interval_seconds마다 compact 실행
+    report = await retention.compact()   # 즉시 1회 실행
+    await retention.stop()
+    ```
+    """
+
+    def __init__(
+        self,
+        checkpointer: BaseCheckpointSaver,
+        keep_latest: int = 20,
+        ttl_seconds: float | None = 24 * 3600,
+        interval_seconds: float = 3600,
+        batch_size: int = 500,
+        sample_threads: int = 20,
+        blob_store=None,
+    ):
+        """
+        Args:
+            checkpointer (BaseCheckpointSaver): AsyncSqliteSaver 또는 AsyncPostgresSaver
+            keep_latest (int): thread 별로 항상 남길 최신 checkpoint 수 (최소 1)
+            ttl_seconds (float | None): 이보다 새로운 checkpoint는 개수와 관계없이 남김 (None이면 개수만 적용)
+            interval_seconds (float): 정리 주기(초)
+            batch_size (int): 한 번에 삭제할 checkpoint 수 (잠금을 짧게 유지하기 위한 단위)
+            sample_threads (int): 상태 조회 지연 시간 측정에 사용할 최근 thread 수
+            blob_store (BlobStore | None): 설정되어 있으면 정리 후 참조되지 않는 blob을 함께 삭제
+        """
+        self.checkpointer = checkpointer
+        self.keep_latest = max(1, keep_latest)
+        self.ttl_seconds = ttl_seconds
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self.sample_threads = sample_threads
+        self.blob_store = blob_store
+        if isinstance(checkpointer, AsyncSqliteSaver):
+            self.store = _SqliteStore(checkpointer)
+        elif hasattr(getattr(checkpointer, "conn", None), "connection"):
+            self.store = _PostgresStore(checkpointer)
+        else:
+            raise ValueError(f"Unsupported checkpointer for retention: {type(checkpointer).__name__}")
+
+        self._task: asyncio.Task | None = None
+        self.last_report: dict | None = None
+        self.counters = {"runs": 0, "failed_runs": 0, "deleted_checkpoints": 0, "deleted_writes": 0, "deleted_blobs": 0, "swept_blobs": 0, "reclaimed_bytes": 0}
+
+    async def prepare(self):
+        """정리에 필요한 DB 설정을 적용합니다. (auto_vacuum이 꺼진 기존 SQLite DB는 VACUUM으로 전환하므로 요청을 받기 전에 호출)"""
+        await self.store.prepare()
+
+    async def start(self):
+        """interval_seconds마다 정리를 실행하는 백그라운드 task를 시작합니다. (첫 실행은 서버 시작 직후를 피해 지연)"""
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self):
+        await asyncio.sleep(min(60.0, self.interval_seconds))
+        while True:
+            try:
+                report = await self.compact()
+                print(
+                    f"Checkpoint compaction: deleted {report['deleted_checkpoints']} checkpoints, "
+                    f"reclaimed {report['reclaimed_bytes']} bytes in {report['duration_ms']}ms."
+                )
+            except Exception as exc:
+                self.counters["failed_runs"] += 1
+                print(f"Checkpoint compaction failed: {exc!r}")
+            await asyncio.sleep(self.interval_seconds)
+
+    async def _read_latency(self, thread_ids: list[str]) -> dict:
+        latencies = []
+        for thread_id in thread_ids:
+            started = time.perf_counter()
+            await self.checkpointer.aget_tuple({"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}})
+            latencies.append((time.perf_counter() - started) * 1000)
+        return {
+            "threads": len(latencies),
+            "avg_ms": round(sum(latencies) / len(latencies), 3) if latencies else None,
+            "p95_ms": percentile(latencies, 0.95),
+        }
+
+    async def compact(self) -> dict:
+        """보관 정책을 1회 적용하고, 삭제 건수와 반환된 바이트, 전후 상태 조회 지연 시간을 반환합니다."""
+        started = time.perf_counter()
+        size_before = await self.store.size_bytes()
+        threads = await self.store.recent_threads(self.sample_threads)
+        read_before = await self._read_latency(threads)
+
+        candidates = await self.store.candidates(self.keep_latest)
+        if self.ttl_seconds is not None:
+            cutoff = time.time() - self.ttl_seconds
+            candidates = [key for key in candidates if checkpoint_timestamp(key[2]) < cutoff]
+
+        deleted_checkpoints = deleted_writes = 0
+        for i in range(0, len(candidates), self.batch_size):
+            checkpoints, writes = await self.store.delete(candidates[i:i + self.batch_size])
+            deleted_checkpoints += checkpoints
+            deleted_writes += writes
+        orphan_writes, orphan_blobs = await self.store.delete_orphans()
+        freed_pages = await self.store.vacuum()
+        sweep = await self._sweep_blobs()
+
+        size_after = await self.store.size_bytes()
+        read_after = await self._read_latency(threads)
+        report = {
+            "deleted_checkpoints": deleted_checkpoints,
+            "deleted_writes": deleted_writes + orphan_writes,
+            "deleted_blobs": orphan_blobs,
+            "blob_sweep": sweep,
+            "freed_pages": freed_pages,
+            "size_before_bytes": size_before,
+            "size_after_bytes": size_after,
+            "reclaimed_bytes": max(0, size_before - size_after),
+            "read_latency_before": read_before,
+            "read_latency_after": read_after,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+            "finished_at": time.time(),
+        }
+
+        self.last_report = report
+        self.counters["runs"] += 1
+        self.counters["deleted_checkpoints"] += report["deleted_checkpoints"]
+        self.counters["deleted_writes"] += report["deleted_writes"]
+        self.counters["deleted_blobs"] += report["deleted_blobs"]
+        self.counters["swept_blobs"] += sweep["deleted"] if sweep else 0
+        self.counters["reclaimed_bytes"] += report["reclaimed_bytes"]
+        return report
+
+    async def _sweep_blobs(self) -> dict | None:
+        """남은 checkpoint가 참조하지 않는 blob을 blob 저장소에서 삭제합니다. (BlobStore가 비활성이면 None)"""
+        if self.blob_store is None or not self.blob_store.enabled:
+            return None
+        return await self.blob_store.sweep(lambda scan: self.store.referenced_blobs(scan, self.batch_size))
+
+    def stats(self) -> dict:
+        """누적 정리 결과와 마지막 실행 보고서를 반환합니다."""
+        return {
+            **self.counters,
+            "keep_latest": self.keep_latest,
+            "ttl_seconds": self.ttl_seconds,
+            "interval_seconds": self.interval_seconds,
+            "last_report": self.last_report,
+        }
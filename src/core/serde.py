@@ -0,0 +1,148 @@
+"""Checkpoint 직렬화 모듈
+
+LangGraph 기본 serializer(JsonPlusSerializer, msgpack 바이너리)로 인코딩한 뒤,
+min_bytes 이상인 payload만 zstd(또는 zlib)로 압축합니다.
+- 압축한 payload는 타입 이름에 "+zstd" / "+zlib" 접미사를 붙여 저장하므로, 접미사가 없는 기존 checkpoint는 그대로 읽습니다.
+- 설정한 codec과 관계없이 두 접미사를 모두 읽을 수 있어 codec을 바꾸거나 압축을 꺼도 이전 checkpoint를 읽을 수 있습니다.
+"""
+import threading
+import time
+import zlib
+from typing import Any
+
+import zstandard
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+
+CODECS = ("zstd", "zlib", "none")
+
+
+class CompressedSerializer(SerializerProtocol):
+    """임계값 이상의 payload를 압축하는 checkpoint serializer
+
+    configure 호출 전에는 압축하지 않고 내부 serializer의 결과를 그대로 반환합니다.
+
+    예시:
+    ```python
+    checkpoint_serde.configure(codec="zstd", min_bytes=1024, level=3)
+    saver = AsyncSqliteSaver(conn, serde=checkpoint_serde)
+    ```
+    """
+
+    def __init__(self, serde: SerializerProtocol | None = None):
+        self.serde = serde or JsonPlusSerializer()
+        self.codec = "none"
+        self.min_bytes = 1024
+        self.level = 3
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.counters = {
+            "dumps": 0,
+            "compressed": 0,            # 압축하여 저장한 payload 수
+            "raw_bytes": 0,             # 압축 전 바이트 수
+            "stored_bytes": 0,          # 실제로 저장한 바이트 수
+            "loads": 0,
+            "decompressed": 0,          # 압축을 풀어 읽은 payload 수
+            "dumps_ms": 0.0,
+            "loads_ms": 0.0,
+        }
+
+    def configure(self, codec: str = "zstd", min_bytes: int = 1024, level: int = 3):
+        """
+        Args:
+            codec (str): "zstd", "zlib", "none" 중 하나
+            min_bytes (int): 압축할 최소 payload 크기(바이트). 작은 payload는 압축 이득보다 비용이 커서 그대로 저장합니다.
+            level (int): 압축 레벨 (zstd 1~22, zlib 1~9)
+        """
+        codec = codec.lower()
+        if codec not in CODECS:
+            raise ValueError(f"Unknown checkpoint compression codec: {codec!r}")
+        self.codec = codec
+        self.min_bytes = min_bytes
+        self.level = level
+        self._local = threading.local()
+
+    def _zstd_compressor(self) -> zstandard.ZstdCompressor:
+        # ZstdCompressor/Decompressor는 스레드 간에 공유할 수 없으므로 스레드마다 생성
+        compressor = getattr(self._local, "compressor", None)
+        if compressor is None:
+            compressor = self._local.compressor = zstandard.ZstdCompressor(level=self.level)
+        return compressor
+
+    def _zstd_decompressor(self) -> zstandard.ZstdDecompressor:
+        decompressor = getattr(self._local, "decompressor", None)
+        if decompressor is None:
+            decompressor = self._local.decompressor = zstandard.ZstdDecompressor()
+        return decompressor
+
+    def dumps(self, obj: Any) -> bytes:
+        return self.serde.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return self.serde.loads(data)
+
+    def dumps_typed(self, obj: Any) -> tuple[str, bytes]:
+        started = time.perf_counter()
+        type_, data = self.serde.dumps_typed(obj)
+        raw_bytes = len(data)
+        compressed = False
+        if self.codec != "none" and raw_bytes >= self.min_bytes:
+            if self.codec == "zstd":
+                packed = self._zstd_compressor().compress(data)
+            else:
+                packed = zlib.compress(data, self.level)
+            # 압축해도 줄지 않는 payload(이미 압축된 바이트 등)는 그대로 저장
+            if len(packed) < raw_bytes:
+                type_, data, compressed = f"{type_}+{self.codec}", packed, True
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._lock:
+            self.counters["dumps"] += 1
+            self.counters["compressed"] += int(compressed)
+            self.counters["raw_bytes"] += raw_bytes
+            self.counters["stored_bytes"] += len(data)
+            self.counters["dumps_ms"] += elapsed_ms
+        return type_, data
+
+    def decompress(self, data: tuple[str, bytes]) -> tuple[str, bytes]:
+        """압축된 payload이면 압축을 풀어 (내부 serializer 타입, 바이트)를, 아니면 그대로 반환합니다. (역직렬화하지 않음)"""
+        type_, data_ = data
+        if type_.endswith("+zstd"):
+            return type_[:-5], self._zstd_decompressor().decompress(data_)
+        if type_.endswith("+zlib"):
+            return type_[:-5], zlib.decompress(data_)
+        return type_, data_
+
+    def loads_typed(self, data: tuple[str, bytes]) -> Any:
+        started = time.perf_counter()
+        type_, data_ = self.decompress(data)
+        decompressed = type_ != data[0]
+        result = self.serde.loads_typed((type_, data_))
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with self._lock:
+            self.counters["loads"] += 1
+            self.counters["decompressed"] += int(decompressed)
+            self.counters["loads_ms"] += elapsed_ms
+        return result
+
+    def stats(self) -> dict:
+        """압축 설정, 압축률과 직렬화/역직렬화 평균 시간(µs)을 반환합니다."""
+        with self._lock:
+            counters = dict(self.counters)
+        return {
+            "codec": self.codec,
+            "min_bytes": self.min_bytes,
+            "level": self.level,
+            "dumps": counters["dumps"],
+            "compressed": counters["compressed"],
+            "raw_bytes": counters["raw_bytes"],
+            "stored_bytes": counters["stored_bytes"],
+            "ratio": round(counters["stored_bytes"] / counters["raw_bytes"], 4) if counters["raw_bytes"] else 1.0,
+            "dumps_us_avg": round(counters["dumps_ms"] * 1000 / counters["dumps"], 1) if counters["dumps"] else None,
+            "loads": counters["loads"],
+            "decompressed": counters["decompressed"],
+            "loads_us_avg": round(counters["loads_ms"] * 1000 / counters["loads"], 1) if counters["loads"] else None,
+        }
+
+
+checkpoint_serde = CompressedSerializer()
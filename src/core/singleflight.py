@@ -0,0 +1,64 @@
+"""Single-flight 모듈
+같은 키로 동시에 들어온 비동기 작업을 하나로 합쳐, 실제 작업은 한 번만 실행하고
+모든 대기자가 그 결과(또는 예외)를 공유하도록 합니다.
+"""
+import asyncio
+from typing import Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """키 단위 중복 호출 병합기
+
+    공유 작업은 asyncio.shield로 보호되므로, 대기자 한 명의 연결이 끊겨 취소되더라도
+    다른 대기자를 위한 작업은 취소되지 않고 끝까지 실행됩니다.
+
+    예시:
+    ```python
+    inflight = SingleFlight()
+    result = await inflight.do(digest, lambda: request_parse_api(file_content))
+    ```
+    """
+
+    def __init__(self):
+        self._calls: dict[str, asyncio.Task] = {}
+        self.counters = {
+            "executed": 0,      # 실제로 실행된 작업 수
+            "coalesced": 0,     # 진행 중인 작업에 합류한 요청 수
+        }
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """키에 해당하는 작업이 진행 중이면 합류하고, 없으면 fn을 실행합니다.
+
+        Args:
+            key (str): 작업을 식별하는 키 (예: 파일 content hash)
+            fn (Callable[[], Awaitable[T]]): 실제 작업을 생성하는 함수
+
+        Returns:
+            T: 공유 작업의 결과 (예외 발생 시 모든 대기자에게 같은 예외가 전파됨)
+        """
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.create_task(fn())
+            self._calls[key] = task
+            task.add_done_callback(lambda t: self._finish(key, t))
+            self.counters["executed"] += 1
+        else:
+            self.counters["coalesced"] += 1
+
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: asyncio.Task):
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # 모든 대기자가 취소된 경우에도 "exception was never retrieved" 경고가 나지 않도록 예외를 회수
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict:
+        """실행/병합 카운터와 현재 진행 중인 작업 수를 반환합니다."""
+        return {
+            **self.counters,
+            "in_flight": len(self._calls),
+        }
@@ -0,0 +1,11 @@
+"""통계 유틸리티 모듈
+지연 시간 집계 등에 사용하는 통계 함수를 정의합니다.
+"""
+
+
+def percentile(values: list[float], q: float) -> float | None:
+    """값 목록의 q 분위수(0~1, nearest-rank)를 반환합니다. 값이 없으면 None을 반환합니다."""
+    if not values:
+        return None
+    values = sorted(values)
+    return round(values[min(len(values) - 1, int(len(values) * q))], 1)
@@ -1,7 +1,10 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from src.core.config import settings
 from src.core.db import lifespan_manager
-from src.api import process_router, analyze_router, oneclick_router
+from src.core.admission import admission_controller
+from src.core.middleware import AdmissionControlMiddleware, UploadSizeLimitMiddleware
+from src.api import process_router, analyze_router, oneclick_router, metrics_router, progress_router, jobs_router, threads_router
 
 # FastAPI 애플리케이션 생성 및 lifespan 등록
 app = FastAPI(
@@ -14,17 +17,39 @@ origins = [
     "http://localhost:3000",  # 로컬 FE 개발 서버 
 ]
 
+# 노드 지연 시간에 따라 조정되는 라우터 별 동시 실행 한도를 넘는 요청은 503으로 조기 거절
+# (CORS 미들웨어보다 먼저 등록하여 503 응답에도 CORS 헤더가 붙도록 함)
+if settings.ADMISSION_CONTROL_ENABLED:
+    admission_controller.configure(
+        settings.ADMISSION_PREFIXES,
+        initial_limit=settings.ADMISSION_INITIAL_LIMIT,
+        min_limit=settings.ADMISSION_MIN_LIMIT,
+        max_limit=settings.ADMISSION_MAX_LIMIT,
+        latency_tolerance=settings.ADMISSION_LATENCY_TOLERANCE,
+        backoff_ratio=settings.ADMISSION_BACKOFF_RATIO,
+    )
+app.add_middleware(AdmissionControlMiddleware, controller=admission_controller)
+
+# 최대 크기를 넘는 업로드는 본문을 받기 전에 거절 (요청 수락 제어보다 먼저 검사하여 슬롯을 차지하지 않음)
+# (CORS 미들웨어보다 먼저 등록하여 413 응답에도 CORS 헤더가 붙도록 함)
+app.add_middleware(UploadSizeLimitMiddleware, max_upload_bytes=settings.MAX_UPLOAD_BYTES)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,        # 허용할 출처 목록
     allow_credentials=True,       # 쿠키를 포함한 요청 허용 여부
-    allow_methods=["POST"],          # 허용할 HTTP 메서드 (GET, POST 등)
+    allow_methods=["GET", "POST"],   # 허용할 HTTP 메서드 (GET, POST 등)
     allow_headers=["*"],          # 허용할 HTTP 헤더
+    expose_headers=["Retry-After", "ETag"],   # 브라우저에서 읽을 수 있는 응답 헤더
 )
 
 app.include_router(oneclick_router.router, prefix="/oneclick", tags=["One Click Analysis"])
 app.include_router(process_router.router, prefix="/process", tags=["Data Processing"])
 app.include_router(analyze_router.router, prefix="/analyze", tags=["AI Analysis"])
+app.include_router(jobs_router.router, prefix="/jobs", tags=["Jobs"])
+app.include_router(progress_router.router, prefix="/progress", tags=["Progress"])
+app.include_router(threads_router.router, prefix="/threads", tags=["Threads"])
+app.include_router(metrics_router.router, prefix="/metrics", tags=["Metrics"])
 
 
 @app.get("/", tags=["Root"])
@@ -1,34 +1,56 @@
-import src.agent.workflow as wk
-from src.agent.modules.states import AgentState
+from src.agent.registry import WorkflowRegistry
+from src.agent.modules.blob_store import checkpoint_meter
+from src.core.progress import progress_broker
+from src.services.streaming import stream_workflow
 
 
-async def analyze_resume(checkpointer: any, thread_id: str):
-    """해당 thread_id의 이력서를 분석하고, 상태를 업데이트"""
+async def analyze_resume(workflows: WorkflowRegistry, thread_id: str, force: bool = False):
+    """해당 thread_id의 이력서를 분석하고, 상태를 업데이트 (입력이 그대로면 저장된 결과를 재사용, force=True면 항상 재분석)"""
 
-    graph = wk.AnalyzeResumeWorkflow(AgentState).build()
-    work = graph.compile(checkpointer=checkpointer)
+    work = workflows.get("AnalyzeResumeWorkflow")
 
-    config = {"configurable": {"thread_id": thread_id}}
+    config = {"configurable": {"thread_id": thread_id, "force": force}}
     current_state_snapshot = await work.aget_state(config)
     initial_state = current_state_snapshot.values
 
-    await work.ainvoke(initial_state, config=config)
+    async with progress_broker.track(thread_id, "AnalyzeResumeWorkflow", kind="workflow"), checkpoint_meter.run("AnalyzeResumeWorkflow"):
+        await work.ainvoke(initial_state, config=config)
     
     final_state = await work.aget_state(config)
     return final_state
 
 
-async def analyze_fit(checkpointer: any, thread_id: str):
-    """해당 thread_id의 이력서와 JD를 분석하고, 상태를 업데이트"""
+async def analyze_fit(workflows: WorkflowRegistry, thread_id: str, force: bool = False):
+    """해당 thread_id의 이력서와 JD를 분석하고, 상태를 업데이트 (입력이 그대로면 저장된 결과를 재사용, force=True면 항상 재분석)"""
 
-    graph = wk.AnalyzeFitWorkflow(AgentState).build()
-    work = graph.compile(checkpointer=checkpointer)
+    work = workflows.get("AnalyzeFitWorkflow")
 
-    config = {"configurable": {"thread_id": thread_id}}
+    config = {"configurable": {"thread_id": thread_id, "force": force}}
     current_state_snapshot = await work.aget_state(config)
     initial_state = current_state_snapshot.values
 
-    await work.ainvoke(initial_state, config=config)
+    async with progress_broker.track(thread_id, "AnalyzeFitWorkflow", kind="workflow"), checkpoint_meter.run("AnalyzeFitWorkflow"):
+        await work.ainvoke(initial_state, config=config)
     
     final_state = await work.aget_state(config)
-    return final_state
\ No newline at end of file
+    return final_state
+
+
+async def analyze_resume_stream(workflows: WorkflowRegistry, thread_id: str, force: bool = False):
+    """해당 thread_id의 이력서를 분석하며 평가 결과 토큰을 스트리밍 (저장된 결과를 재사용하면 토큰 없이 done만 전달)"""
+
+    config = {"configurable": {"thread_id": thread_id, "force": force}}
+
+    # 현재 상태는 스트리밍 task 안에서 checkpoint로부터 읽음
+    async for event in stream_workflow(workflows, "AnalyzeResumeWorkflow", None, config, "evaluate_resume", "applicant_skills"):
+        yield event
+
+
+async def analyze_fit_stream(workflows: WorkflowRegistry, thread_id: str, force: bool = False):
+    """해당 thread_id의 이력서와 JD를 분석하며 평가 결과 토큰을 스트리밍 (저장된 결과를 재사용하면 토큰 없이 done만 전달)"""
+
+    config = {"configurable": {"thread_id": thread_id, "force": force}}
+
+    # 현재 상태는 스트리밍 task 안에서 checkpoint로부터 읽음
+    async for event in stream_workflow(workflows, "AnalyzeFitWorkflow", None, config, "evaluate_fit", "applicant_recruitment"):
+        yield event
@@ -0,0 +1,173 @@
+import asyncio
+import time
+
+from fastapi import HTTPException
+
+import src.agent.modules.nodes as nd
+from src.agent.modules.blob_store import blob_store, checkpoint_meter
+from src.agent.modules.llm_scheduler import BATCH, current_lane
+from src.agent.registry import WorkflowRegistry
+from src.core.progress import progress_broker
+from src.core.stats import percentile
+from src.services.ranking import candidate_ranker
+
+
+# 배치 요청이 공유하는 JD 전처리 노드 (최초 사용 시 생성)
+_jd_nodes: tuple[nd.JDUrlToMarkdown, nd.JDDecompositionNode] | None = None
+
+
+def _get_jd_nodes() -> tuple[nd.JDUrlToMarkdown, nd.JDDecompositionNode]:
+    global _jd_nodes
+    if _jd_nodes is None:
+        _jd_nodes = (nd.JDUrlToMarkdown(), nd.JDDecompositionNode())
+    return _jd_nodes
+
+
+async def prepare_jd(jd_url: str) -> tuple[dict, float]:
+    """JD를 한 번만 수집/분해하여 모든 지원자가 공유할 JD 상태와 소요 시간(ms)을 반환합니다.
+
+    스트리밍 응답이 시작되기 전에 호출하여, JD 수집 실패를 HTTP 상태 코드로 반환할 수 있도록 합니다.
+    """
+    started = time.perf_counter()
+    to_markdown, decompose = _get_jd_nodes()
+    state = {"jd_url": jd_url}
+    state.update(await to_markdown.execute(state))
+    if not state.get("job_description"):
+        raise HTTPException(status_code=422, detail=f"Could not extract a job description from {jd_url!r}.")
+    state.update(await decompose.execute(state))
+    return state, (time.perf_counter() - started) * 1000
+
+
+async def rank_candidates(workflows: WorkflowRegistry, jd_state: dict, thread_ids: list[str], top_k: int | None = None) -> dict:
+    """저장된 resume_details와 JD의 BM25 점수로 지원자 순위를 계산합니다. (LLM 호출 없음)
+
+    Returns:
+        dict: ranked(점수 내림차순 [{thread_id, score}]), missing(이력서가 없는 thread_id), latency_ms
+    """
+    started = time.perf_counter()
+    work = workflows.get("AnalyzeFitWorkflow")
+    thread_ids = list(dict.fromkeys(thread_ids))
+    snapshots = await asyncio.gather(
+        *(work.aget_state({"configurable": {"thread_id": thread_id}}) for thread_id in thread_ids)
+    )
+
+    ranked_ids, missing = [], []
+    for thread_id, snapshot in zip(thread_ids, snapshots):
+        resume_details = snapshot.values.get("resume_details")
+        if not resume_details:
+            missing.append(thread_id)
+            continue
+        candidate_ranker.upsert_resume(thread_id, resume_details)
+        ranked_ids.append(thread_id)
+
+    candidate_ranker.upsert_jd(jd_state["jd_url"], jd_state.get("jd_details") or {})
+    ranked = candidate_ranker.rank(jd_state["jd_url"], ranked_ids, top_k=top_k) if ranked_ids else []
+    return {
+        "ranked": [{"thread_id": thread_id, "score": score} for thread_id, score in ranked],
+        "missing": missing,
+        "latency_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+
+
+async def _evaluate_candidate(workflows: WorkflowRegistry, thread_id: str, jd_state: dict) -> str:
+    """지원자 thread에 공유 JD 상태를 기록하고 AnalyzeFitWorkflow를 실행"""
+    work = workflows.get("AnalyzeFitWorkflow")
+
+    config = {"configurable": {"thread_id": thread_id}}
+    current_state_snapshot = await work.aget_state(config)
+    if not current_state_snapshot.values.get("resume_details"):
+        raise HTTPException(status_code=404, detail=f"No processed resume found for thread {thread_id!r}.")
+
+    initial_state = {**current_state_snapshot.values, **jd_state}
+
+    async with progress_broker.track(thread_id, "AnalyzeFitWorkflow", kind="workflow"), checkpoint_meter.run("AnalyzeFitWorkflow"):
+        await work.ainvoke(initial_state, config=config)
+
+    final_state = await work.aget_state(config)
+    return await blob_store.resolve(final_state.values.get("applicant_recruitment", "분석 결과 없음"))
+
+
+async def batch_fit(
+    workflows: WorkflowRegistry,
+    jd_state: dict,
+    jd_ms: float,
+    thread_ids: list[str],
+    concurrency: int,
+    top_k: int | None = None,
+):
+    """prepare_jd로 분해한 하나의 JD로 여러 지원자의 핏 분석을 실행하며, 완료되는 순서대로 결과를 생성
+
+    - ("jd", {...}): 공유 JD 정보 (prepare_jd 소요 시간 포함)
+    - ("ranking", {...}): top_k가 있으면 BM25 사전 순위와 LLM 평가 대상으로 선택된 지원자 수
+    - ("result", {"thread_id", "applicant_recruitment", "latency_ms"}): 지원자 별 분석 결과
+    - ("error", {"thread_id", "status_code", "detail"}): 지원자 별 분석 실패
+    - ("summary", {...}): 처리량, p50/p95 지연 시간 등 배치 집계
+
+    클라이언트 연결이 끊기면 아직 끝나지 않은 지원자 분석은 취소됩니다.
+    """
+    started = time.perf_counter()
+    candidates = len(dict.fromkeys(thread_ids))
+    yield "jd", {
+        "jd_url": jd_state["jd_url"],
+        "title": (jd_state.get("jd_details") or {}).get("title"),
+        "company": (jd_state.get("jd_details") or {}).get("company"),
+        "latency_ms": round(jd_ms, 1),
+    }
+
+    failed = 0
+    if top_k is not None:
+        # 키워드 점수 상위 K명만 LLM으로 평가
+        ranking = await rank_candidates(workflows, jd_state, thread_ids, top_k=None)
+        selected = [item["thread_id"] for item in ranking["ranked"][:top_k]]
+        yield "ranking", {**ranking, "selected": len(selected), "skipped": len(ranking["ranked"]) - len(selected)}
+        for thread_id in ranking["missing"]:
+            failed += 1
+            yield "error", {"thread_id": thread_id, "status_code": 404, "detail": f"No processed resume found for thread {thread_id!r}."}
+        thread_ids = selected
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def evaluate(thread_id: str) -> tuple[str, float, str | None, HTTPException | None]:
+        # 지원자 평가는 batch 레인에서 LLM을 호출 (task마다 context가 복사되므로 다른 요청에는 영향 없음)
+        current_lane.set(BATCH)
+        async with semaphore:
+            candidate_started = time.perf_counter()
+            try:
+                result = await _evaluate_candidate(workflows, thread_id, jd_state)
+                error = None
+            except HTTPException as exc:
+                result, error = None, exc
+            except Exception as exc:
+                print(f"Batch fit failed for {thread_id}: {exc!r}")
+                result, error = None, HTTPException(status_code=500, detail=repr(exc))
+            return thread_id, (time.perf_counter() - candidate_started) * 1000, result, error
+
+    # 같은 thread_id가 중복되면 한 번만 실행
+    tasks = [asyncio.create_task(evaluate(thread_id)) for thread_id in dict.fromkeys(thread_ids)]
+    latencies = []
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            thread_id, latency_ms, result, error = await next_done
+            if error is not None:
+                failed += 1
+                yield "error", {"thread_id": thread_id, "status_code": error.status_code, "detail": error.detail}
+                continue
+            latencies.append(latency_ms)
+            yield "result", {"thread_id": thread_id, "applicant_recruitment": result, "latency_ms": round(latency_ms, 1)}
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    total_s = time.perf_counter() - started + jd_ms / 1000
+    yield "summary", {
+        "candidates": candidates,
+        "evaluated": len(tasks),
+        "succeeded": len(latencies),
+        "failed": failed,
+        "concurrency": concurrency,
+        "jd_ms": round(jd_ms, 1),
+        "total_ms": round(total_s * 1000, 1),
+        "throughput_per_min": round(len(latencies) / total_s * 60, 2) if total_s else 0.0,
+        "latency_ms_p50": percentile(latencies, 0.5),
+        "latency_ms_p95": percentile(latencies, 0.95),
+    }
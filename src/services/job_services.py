@@ -0,0 +1,114 @@
+from fastapi import UploadFile
+from starlette.datastructures import Headers
+
+from src.agent.registry import WorkflowRegistry
+from src.agent.modules.blob_store import blob_store
+from src.agent.modules.llm_scheduler import INTERACTIVE, use_lane
+from src.core.jobs import JobHandler
+from src.services import analyze_services, oneclick_services, process_services
+from src.services.parse_client import ParseClient
+
+
+def _open_upload(upload: dict) -> UploadFile:
+    """spool 디렉터리에 저장된 업로드 파일을 UploadFile로 다시 엽니다."""
+    handle = open(upload["path"], "rb")
+    return UploadFile(
+        file=handle,
+        filename=upload["filename"],
+        headers=Headers({"content-type": upload["content_type"] or "application/octet-stream"}),
+    )
+
+
+def _with_lane(handler: JobHandler) -> JobHandler:
+    """payload의 lane(없으면 interactive)을 LLM 호출 스케줄러 레인으로 지정하여 작업을 실행합니다."""
+
+    async def run(payload: dict) -> dict:
+        with use_lane(payload.get("lane", INTERACTIVE)):
+            return await handler(payload)
+
+    return run
+
+
+def build_job_handlers(workflows: WorkflowRegistry, parse_client: ParseClient) -> dict[str, JobHandler]:
+    """작업 종류 별 처리 함수를 생성합니다. 각 함수는 동기 엔드포인트와 같은 형태의 응답을 반환합니다.
+    비동기 작업 API로 등록된 작업은 batch 레인, 동기 엔드포인트의 작업은 interactive 레인에서 LLM을 호출합니다.
+    상태에 blob 참조로 기록된 평가 결과는 응답 전에 원문으로 바꿉니다.
+    """
+
+    async def process_resume(payload: dict) -> dict:
+        resume_file = _open_upload(payload["upload"])
+        try:
+            current_state = await process_services.process_resume(
+                workflows=workflows,
+                parse_client=parse_client,
+                use_cache=payload.get("use_cache", True),
+                thread_id=payload["thread_id"],
+                resume_file=resume_file,
+                force=payload.get("force", False),
+            )
+        finally:
+            await resume_file.close()
+        return {"resume_details": current_state.values.get("resume_details", {})}
+
+    async def process_jd(payload: dict) -> dict:
+        current_state = await process_services.process_jd(
+            workflows=workflows,
+            thread_id=payload["thread_id"],
+            jd_url=payload["jd_url"],
+        )
+        return {"jd_details": current_state.values.get("jd_details", {})}
+
+    async def analyze_resume(payload: dict) -> dict:
+        current_state = await analyze_services.analyze_resume(
+            workflows=workflows,
+            thread_id=payload["thread_id"],
+            force=payload.get("force", False),
+        )
+        return {"applicant_skills": await blob_store.resolve(current_state.values.get("applicant_skills", "분석 결과 없음"))}
+
+    async def analyze_fit(payload: dict) -> dict:
+        current_state = await analyze_services.analyze_fit(
+            workflows=workflows,
+            thread_id=payload["thread_id"],
+            force=payload.get("force", False),
+        )
+        return {"applicant_recruitment": await blob_store.resolve(current_state.values.get("applicant_recruitment", "분석 결과 없음"))}
+
+    async def oneclick_resume(payload: dict) -> dict:
+        resume_file = _open_upload(payload["upload"])
+        try:
+            current_state = await oneclick_services.oneclick_resume(
+                workflows=workflows,
+                parse_client=parse_client,
+                use_cache=payload.get("use_cache", True),
+                thread_id=payload["thread_id"],
+                resume_file=resume_file,
+            )
+        finally:
+            await resume_file.close()
+        return {"applicant_skills": await blob_store.resolve(current_state.values.get("applicant_skills", "분석 결과 없음"))}
+
+    async def oneclick_fit(payload: dict) -> dict:
+        resume_file = _open_upload(payload["upload"])
+        try:
+            current_state = await oneclick_services.oneclick_fit(
+                workflows=workflows,
+                parse_client=parse_client,
+                use_cache=payload.get("use_cache", True),
+                thread_id=payload["thread_id"],
+                resume_file=resume_file,
+                jd_url=payload["jd_url"],
+            )
+        finally:
+            await resume_file.close()
+        return {"applicant_recruitment": await blob_store.resolve(current_state.values.get("applicant_recruitment", "분석 결과 없음"))}
+
+    handlers = {
+        "process_resume": process_resume,
+        "process_jd": process_jd,
+        "analyze_resume": analyze_resume,
+        "analyze_fit": analyze_fit,
+        "oneclick_resume": oneclick_resume,
+        "oneclick_fit": oneclick_fit,
+    }
+    return {kind: _with_lane(handler) for kind, handler in handlers.items()}
@@ -1,97 +1,70 @@
-from fastapi import UploadFile, HTTPException
-import httpx
+from fastapi import UploadFile
 
-import src.agent.workflow as wk
-from src.agent.modules.states import AgentState
-from src.core.config import settings
+from src.agent.registry import WorkflowRegistry
+from src.agent.modules.blob_store import blob_store, checkpoint_meter
+from src.core.progress import progress_broker
+from src.services.parse_client import ParseClient
+from src.services.streaming import stream_workflow
 
 
-async def oneclick_resume(checkpointer: any, thread_id: str, resume_file: UploadFile):
+async def parse_resume(parse_client: ParseClient, thread_id: str, resume_file: UploadFile, use_cache: bool = True) -> dict:
+    """이력서 파일을 Parse API로 변환하고, 해당 thread_id로 진행 상황 이벤트를 발행
+
+    이력서 원문은 blob 저장소에 저장하고, 반환하는 상태에는 참조만 담습니다.
+    """
+    async with progress_broker.track(thread_id, "ParseAPI", kind="stage"):
+        result = await parse_client.parse(resume_file, use_cache=use_cache)
+    return await blob_store.externalize(result)
+
+
+async def oneclick_resume(workflows: WorkflowRegistry, parse_client: ParseClient, thread_id: str, resume_file: UploadFile, use_cache: bool = True):
     """해당 thread_id의 이력서를 분석하고, 상태를 업데이트"""
-    file_content = await resume_file.read()
+    async with progress_broker.track(thread_id, "OneclickResumeWorkflow", kind="workflow"), checkpoint_meter.run("OneclickResumeWorkflow"):
+        result = await parse_resume(parse_client, thread_id, resume_file, use_cache=use_cache)
 
-    files = {
-        'resume_file': (resume_file.filename, file_content, resume_file.content_type)
-    }
+        work = workflows.get("OneclickResumeWorkflow")
 
-    headers = {
-        "X-API-KEY": settings.PARSE_API_KEY
-    }
-    
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(
-                settings.PDF_PARSE_API_ENDPOINT,
-                files=files,
-                headers=headers,
-                timeout=180.0
-            )
-            response.raise_for_status()
-            result = response.json()
-            
-        except httpx.TimeoutException as exc:
-            error_message = f"Request timed out: {exc}"
-            print(error_message)
-            raise HTTPException(status_code=504, detail=f"Request to the processing service timed out at {exc.request.url!r}.")
-            
-        except httpx.RequestError as exc:
-            error_message = f"An unexpected request error occurred: {exc}"
-            print(error_message)
-            raise HTTPException(status_code=500, detail=f"An error occurred while requesting {exc.request.url!r}.")
-        
-    graph = wk.OneclickResumeWorkflow(AgentState).build()
-    work = graph.compile(checkpointer=checkpointer)
-
-    initial_state = result
-    config = {"configurable": {"thread_id": thread_id}}
+        initial_state = result
+        config = {"configurable": {"thread_id": thread_id}}
 
-    await work.ainvoke(initial_state, config=config)
+        await work.ainvoke(initial_state, config=config)
     
     final_state = await work.aget_state(config)
     return final_state
 
 
-async def oneclick_fit(checkpointer: any, thread_id: str, resume_file: UploadFile, jd_url: str):
+async def oneclick_fit(workflows: WorkflowRegistry, parse_client: ParseClient, thread_id: str, resume_file: UploadFile, jd_url: str, use_cache: bool = True):
     """해당 thread_id의 이력서와 JD를 분석하고, 상태를 업데이트"""
+    async with progress_broker.track(thread_id, "OneclickFitWorkflow", kind="workflow"), checkpoint_meter.run("OneclickFitWorkflow"):
+        result = await parse_resume(parse_client, thread_id, resume_file, use_cache=use_cache)
 
-    file_content = await resume_file.read()
+        work = workflows.get("OneclickFitWorkflow")
 
-    files = {
-        'resume_file': (resume_file.filename, file_content, resume_file.content_type)
-    }
+        initial_state = {**result, "jd_url": jd_url}
+        config = {"configurable": {"thread_id": thread_id}}
 
-    headers = {
-        "X-API-KEY": settings.PARSE_API_KEY
-    }
+        await work.ainvoke(initial_state, config=config)
     
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(
-                settings.PDF_PARSE_API_ENDPOINT,
-                files=files,
-                headers=headers,
-                timeout=180.0
-            )
-            response.raise_for_status()
-            result = response.json()
-            
-        except httpx.TimeoutException as exc:
-            error_message = f"Request timed out: {exc}"
-            print(error_message)
-            raise HTTPException(status_code=504, detail=f"Request to the processing service timed out at {exc.request.url!r}.")
-            
-        except httpx.RequestError as exc:
-            error_message = f"An unexpected request error occurred: {exc}"
-            print(error_message)
-            raise HTTPException(status_code=500, detail=f"An error occurred while requesting {exc.request.url!r}.")
-        
-    graph = wk.OneclickFitWorkflow(AgentState).build()
-    work = graph.compile(checkpointer=checkpointer)
-
-    initial_state = {**result, "jd_url": jd_url}
+    final_state = await work.aget_state(config)
+    return final_state
+
+
+async def oneclick_resume_stream(workflows: WorkflowRegistry, parsed_resume: dict, thread_id: str):
+    """Parse된 이력서를 분석하며 평가 결과 토큰을 스트리밍
+
+    업로드 파일은 응답이 시작되기 전에 닫히므로, Parse API 호출은 엔드포인트에서 먼저 수행합니다.
+    """
+    initial_state = parsed_resume
     config = {"configurable": {"thread_id": thread_id}}
 
-    await work.ainvoke(initial_state, config=config)
-    
-    final_state = await work.aget_state(config)
-    return final_state
\ No newline at end of file
+    async for event in stream_workflow(workflows, "OneclickResumeWorkflow", initial_state, config, "evaluate_resume", "applicant_skills"):
+        yield event
+
+
+async def oneclick_fit_stream(workflows: WorkflowRegistry, parsed_resume: dict, thread_id: str, jd_url: str):
+    """Parse된 이력서와 JD를 분석하며 평가 결과 토큰을 스트리밍"""
+    initial_state = {**parsed_resume, "jd_url": jd_url}
+    config = {"configurable": {"thread_id": thread_id}}
+
+    async for event in stream_workflow(workflows, "OneclickFitWorkflow", initial_state, config, "evaluate_fit", "applicant_recruitment"):
+        yield event
@@ -0,0 +1,204 @@
+"""PDF Parse API 클라이언트 모듈
+
+이력서 PDF를 외부 Parse API로 전송하고 결과 JSON을 반환합니다.
+lifespan에서 생성한 하나의 httpx.AsyncClient를 모든 요청이 공유하여
+DNS 조회, TCP/TLS 연결 수립 비용을 커넥션 풀로 재사용합니다.
+Parse 결과는 업로드 파일의 SHA-256 digest를 키로 캐시되어, 같은 파일의 재업로드는 Parse API를 호출하지 않습니다.
+같은 파일이 동시에 여러 번 업로드되면 Parse API 호출은 한 번만 실행되고 결과를 공유합니다.
+업로드 파일은 메모리에 통째로 올리지 않고, UploadFile의 spool 파일을 청크 단위로 해싱/전송합니다.
+"""
+import hashlib
+import importlib.util
+import io
+import os
+
+import httpx
+from fastapi import HTTPException, UploadFile
+
+from src.core.cache import TwoTierCache
+from src.core.singleflight import SingleFlight
+
+
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+class ParseClient:
+    """PDF Parse API 공용 클라이언트
+
+    예시:
+    ```python
+    async with ParseClient.from_settings(settings) as parse_client:
+        result = await parse_client.parse(resume_file)
+    ```
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        endpoint: str,
+        api_key: str,
+        cache: TwoTierCache | None = None,
+        max_upload_bytes: int | None = None,
+    ):
+        """
+        Args:
+            client (httpx.AsyncClient): 커넥션 풀을 보유한 공용 HTTP 클라이언트
+            endpoint (str): PDF Parse API 엔드포인트
+            api_key (str): PDF Parse API 키
+            cache (TwoTierCache | None): 파일 digest 기반 Parse 결과 캐시 (None이면 캐시 미사용)
+            max_upload_bytes (int | None): 허용할 최대 업로드 크기 (None이면 제한 없음)
+        """
+        self.client = client
+        self.endpoint = endpoint
+        self.headers = {"X-API-KEY": api_key}
+        self.cache = cache
+        self.max_upload_bytes = max_upload_bytes
+        self.inflight = SingleFlight()
+
+    @classmethod
+    def from_settings(cls, settings) -> "ParseClient":
+        """Settings 값으로 커넥션 풀, keep-alive, 타임아웃이 설정된 클라이언트를 생성합니다."""
+        http2 = settings.PARSE_API_HTTP2
+        if http2 and importlib.util.find_spec("h2") is None:
+            print("PARSE_API_HTTP2 is enabled but the 'h2' package is not installed. Falling back to HTTP/1.1.")
+            http2 = False
+
+        client = httpx.AsyncClient(
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=settings.PARSE_API_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.PARSE_API_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.PARSE_API_KEEPALIVE_EXPIRY,
+            ),
+            timeout=httpx.Timeout(
+                connect=settings.PARSE_API_CONNECT_TIMEOUT,
+                read=settings.PARSE_API_READ_TIMEOUT,
+                write=settings.PARSE_API_WRITE_TIMEOUT,
+                pool=settings.PARSE_API_POOL_TIMEOUT,
+            ),
+        )
+        cache = None
+        if settings.PARSE_CACHE_ENABLED:
+            cache = TwoTierCache(
+                "parse",
+                settings.CACHE_DB_PATH,
+                max_memory_bytes=settings.PARSE_CACHE_MEMORY_BYTES,
+                ttl_seconds=settings.PARSE_CACHE_TTL_SECONDS,
+            )
+        return cls(
+            client,
+            settings.PDF_PARSE_API_ENDPOINT,
+            settings.PARSE_API_KEY,
+            cache=cache,
+            max_upload_bytes=settings.MAX_UPLOAD_BYTES,
+        )
+
+    async def parse(self, resume_file: UploadFile, use_cache: bool = True) -> dict:
+        """이력서 파일을 Parse API로 전송하고 결과 JSON을 반환합니다.
+
+        Args:
+            resume_file (UploadFile): 업로드된 이력서 PDF 파일
+            use_cache (bool): False이면 캐시 조회를 건너뛰고 Parse API를 호출한 뒤 캐시를 갱신
+
+        Raises:
+            HTTPException: 업로드 크기 초과(413), Parse API 오류 응답(502), 타임아웃(504) 또는 요청 오류(500)
+
+        Returns:
+            dict: Parse API 응답 JSON (AgentState 초기값)
+        """
+        digest = await self._hash_upload(resume_file)
+
+        if self.cache is not None and use_cache:
+            cached = await self.cache.get(digest)
+            if cached is not None:
+                return cached
+
+        return await self.inflight.do(
+            digest,
+            lambda: self._request(resume_file.filename, resume_file.content_type, self._detach(resume_file), digest)
+        )
+
+    async def _hash_upload(self, resume_file: UploadFile) -> str:
+        """spool 파일을 청크 단위로 읽으며 SHA-256을 계산하고 최대 크기를 검사합니다."""
+        if self.max_upload_bytes is not None and (resume_file.size or 0) > self.max_upload_bytes:
+            raise self._too_large()
+
+        hasher = hashlib.sha256()
+        total = 0
+        await resume_file.seek(0)
+        while chunk := await resume_file.read(UPLOAD_CHUNK_SIZE):
+            total += len(chunk)
+            if self.max_upload_bytes is not None and total > self.max_upload_bytes:
+                raise self._too_large()
+            hasher.update(chunk)
+        await resume_file.seek(0)
+        return hasher.hexdigest()
+
+    def _too_large(self) -> HTTPException:
+        return HTTPException(status_code=413, detail=f"Resume file exceeds the maximum upload size of {self.max_upload_bytes} bytes.")
+
+    @staticmethod
+    def _detach(resume_file: UploadFile):
+        """요청 종료 후 UploadFile이 닫혀도 공유 업로드가 계속 읽을 수 있는 파일 핸들을 반환합니다.
+
+        Single-flight로 공유되는 업로드는 먼저 요청한 클라이언트의 연결이 끊겨도 계속되어야 하므로,
+        spool 파일의 file descriptor를 복제하여 독립적인 핸들을 만듭니다.
+        """
+        try:
+            fd = os.dup(resume_file.file.fileno())
+        except (AttributeError, io.UnsupportedOperation):
+            # 실제 파일이 없는 객체(BytesIO 등)는 내용을 복사
+            resume_file.file.seek(0)
+            return io.BytesIO(resume_file.file.read())
+        handle = os.fdopen(fd, "rb")
+        handle.seek(0)
+        return handle
+
+    async def _request(self, filename: str, content_type: str, handle, digest: str) -> dict:
+        """spool 파일을 스트리밍 업로드하여 Parse API를 호출하고 결과를 캐시에 저장합니다."""
+        files = {
+            'resume_file': (filename, handle, content_type)
+        }
+
+        try:
+            response = await self.client.post(
+                self.endpoint,
+                files=files,
+                headers=self.headers,
+            )
+            response.raise_for_status()
+            result = response.json()
+
+        except httpx.HTTPStatusError as exc:
+            error_message = f"Parse API returned {exc.response.status_code}: {exc.response.text[:500]}"
+            print(error_message)
+            raise HTTPException(status_code=502, detail=f"The processing service responded with status {exc.response.status_code}.")
+
+        except httpx.TimeoutException as exc:
+            error_message = f"Request timed out: {exc}"
+            print(error_message)
+            raise HTTPException(status_code=504, detail=f"Request to the processing service timed out at {exc.request.url!r}.")
+
+        except httpx.RequestError as exc:
+            error_message = f"An unexpected request error occurred: {exc}"
+            print(error_message)
+            raise HTTPException(status_code=500, detail=f"An error occurred while requesting {exc.request.url!r}.")
+
+        finally:
+            handle.close()
+
+        if self.cache is not None:
+            await self.cache.set(digest, result)
+        return result
+
+    async def aclose(self):
+        """커넥션 풀과 캐시를 닫습니다."""
+        await self.client.aclose()
+        if self.cache is not None:
+            self.cache.close()
+
+    async def __aenter__(self) -> "ParseClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
@@ -1,66 +1,37 @@
-import httpx
-from fastapi import  HTTPException, UploadFile
-import src.agent.workflow as wk
-from src.agent.modules.states import AgentState
-from src.core.config import settings
+from fastapi import UploadFile
+from src.agent.registry import WorkflowRegistry
+from src.agent.modules.blob_store import checkpoint_meter
+from src.core.progress import progress_broker
+from src.services.parse_client import ParseClient
+from src.services.oneclick_services import parse_resume
 
 
-async def process_resume(checkpointer: any, thread_id: str, resume_file: UploadFile):
-    """이력서 PDF 파일을 받아 전처리하고, 해당 thread_id의 상태를 업데이트합니다."""
+async def process_resume(workflows: WorkflowRegistry, parse_client: ParseClient, thread_id: str, resume_file: UploadFile, use_cache: bool = True, force: bool = False):
+    """이력서 PDF 파일을 받아 전처리하고, 해당 thread_id의 상태를 업데이트합니다. (섹션이 바뀐 항목만 다시 추출, force=True면 전체 재추출)"""
+    async with progress_broker.track(thread_id, "PreprocessResumeWorkflow", kind="workflow"), checkpoint_meter.run("PreprocessResumeWorkflow"):
+        result = await parse_resume(parse_client, thread_id, resume_file, use_cache=use_cache)
 
-    file_content = await resume_file.read()
+        work = workflows.get("PreprocessResumeWorkflow")
 
-    files = {
-        'resume_file': (resume_file.filename, file_content, resume_file.content_type)
-    }
+        initial_state = result
+        config = {"configurable": {"thread_id": thread_id, "force": force}}
 
-    headers = {
-        "X-API-KEY": settings.PARSE_API_KEY
-    }
-    
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(
-                settings.PDF_PARSE_API_ENDPOINT,
-                files=files,
-                headers=headers,
-                timeout=180.0
-            )
-            response.raise_for_status()
-            result = response.json()
-            
-        except httpx.TimeoutException as exc:
-            error_message = f"Request timed out: {exc}"
-            print(error_message)
-            raise HTTPException(status_code=504, detail=f"Request to the processing service timed out at {exc.request.url!r}.")
-            
-        except httpx.RequestError as exc:
-            error_message = f"An unexpected request error occurred: {exc}"
-            print(error_message)
-            raise HTTPException(status_code=500, detail=f"An error occurred while requesting {exc.request.url!r}.")
-        
-    graph = wk.PreprocessResumeWorkflow(AgentState).build()
-    work = graph.compile(checkpointer=checkpointer)
-
-    initial_state = result
-    config = {"configurable": {"thread_id": thread_id}}
-
-    await work.ainvoke(initial_state, config=config)
+        await work.ainvoke(initial_state, config=config)
     
     final_state = await work.aget_state(config)
     return final_state
 
 
-async def process_jd(checkpointer: any, thread_id: str, jd_url: str):
+async def process_jd(workflows: WorkflowRegistry, thread_id: str, jd_url: str):
     """JD URL을 받아 전처리하고, 해당 thread_id의 상태를 업데이트합니다."""
 
-    graph = wk.PreprocessJDWorkflow(AgentState).build()
-    work = graph.compile(checkpointer=checkpointer)
+    work = workflows.get("PreprocessJDWorkflow")
 
     initial_state = {"jd_url": jd_url}
     config = {"configurable": {"thread_id": thread_id}}
 
-    await work.ainvoke(initial_state, config=config)
+    async with progress_broker.track(thread_id, "PreprocessJDWorkflow", kind="workflow"), checkpoint_meter.run("PreprocessJDWorkflow"):
+        await work.ainvoke(initial_state, config=config)
     
     final_state = await work.aget_state(config)
     return final_state
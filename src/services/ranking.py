@@ -0,0 +1,247 @@
+"""지원자-JD 사전 순위 모듈
+
+LLM 핏 평가 전에 resume_details와 jd_details의 키워드로 BM25 점수를 계산하여,
+적합도가 높은 지원자만 EvaluateFitNode로 보낼 수 있도록 합니다.
+어휘 사전과 문서 단어 빈도 행렬은 용량을 두 배씩 늘리는 방식으로 확장되어,
+이력서나 JD 하나를 추가해도 전체 행렬을 다시 만들지 않습니다.
+"""
+import re
+
+import numpy as np
+
+from src.core.hashing import fingerprint
+
+
+TOKEN_PATTERN = re.compile(r"[0-9a-z가-힣][0-9a-z가-힣+#.]*")
+
+# 필드 별 가중치 (토큰 빈도에 곱해짐)
+RESUME_FIELDS = {"tech_stacks": 2.0, "position": 1.0}
+RESUME_ACHIEVEMENT_WEIGHT = 1.0
+JD_FIELDS = {"tech_stacks": 2.0, "skills": 1.5, "qualification": 1.0}
+
+
+def tokenize(value) -> list[str]:
+    """문자열/리스트/딕셔너리 값에서 소문자 토큰을 추출합니다."""
+    if value is None:
+        return []
+    if isinstance(value, dict):
+        return [token for item in value.values() for token in tokenize(item)]
+    if isinstance(value, (list, tuple)):
+        return [token for item in value for token in tokenize(item)]
+    return [token.rstrip(".") for token in TOKEN_PATTERN.findall(str(value).lower())]
+
+
+def _weighted_terms(fields: list[tuple[object, float]]) -> dict[str, float]:
+    terms: dict[str, float] = {}
+    for value, weight in fields:
+        for token in tokenize(value):
+            if token:
+                terms[token] = terms.get(token, 0.0) + weight
+    return terms
+
+
+def resume_terms(resume_details: dict) -> dict[str, float]:
+    """resume_details의 기술 스택, 직무, 프로젝트 성과에서 가중 단어 빈도를 계산합니다."""
+    projects = list(resume_details.get("projects") or [])
+    for experience in resume_details.get("experiences") or []:
+        if isinstance(experience, dict):
+            projects.extend(experience.get("projects") or [])
+    achievements = [project.get("achievements") for project in projects if isinstance(project, dict)]
+
+    return _weighted_terms(
+        [(resume_details.get(field), weight) for field, weight in RESUME_FIELDS.items()]
+        + [(achievements, RESUME_ACHIEVEMENT_WEIGHT)]
+    )
+
+
+def jd_terms(jd_details: dict) -> dict[str, float]:
+    """jd_details의 필요 역량, 기술 스택, 자격 요건에서 가중 단어 빈도를 계산합니다."""
+    return _weighted_terms([(jd_details.get(field), weight) for field, weight in JD_FIELDS.items()])
+
+
+def _grow(array: np.ndarray, size: int) -> np.ndarray:
+    """size개 이상을 담을 수 있도록 용량을 두 배씩 늘린 배열을 반환합니다."""
+    if size <= array.shape[0]:
+        return array
+    grown = np.zeros(max(size, array.shape[0] * 2), dtype=array.dtype)
+    grown[:array.shape[0]] = array
+    return grown
+
+
+class CandidateRanker:
+    """이력서/JD 증분 BM25 순위기
+
+    이력서 단어 빈도는 (행, 열, 값) 좌표 형식의 희소 행렬로 저장합니다.
+    - 이력서 추가/갱신은 해당 이력서의 항목만 추가하고 이전 항목은 삭제 표시하므로 전체 행렬을 다시 만들지 않습니다.
+    - 점수 계산은 JD에 등장하는 단어의 항목만 골라 벡터 연산으로 수행합니다.
+    - IDF와 문서 길이 정규화는 이력서 집합 기준으로 점수 계산 시점에 적용됩니다.
+    같은 내용으로 다시 추가하면 아무 작업도 하지 않습니다.
+
+    예시:
+    ```python
+    candidate_ranker.upsert_resume(thread_id, resume_details)
+    candidate_ranker.upsert_jd(jd_url, jd_details)
+    ranked = candidate_ranker.rank(jd_url, thread_ids, top_k=20)
+    ```
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75, capacity: int = 4096):
+        self.k1 = k1
+        self.b = b
+        self.vocabulary: dict[str, int] = {}
+        self.rows: dict[str, int] = {}
+        self.jds: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+
+        # 이력서 단어 빈도 (희소 좌표 형식)
+        self._entry_rows = np.zeros(capacity, dtype=np.int32)
+        self._entry_cols = np.zeros(capacity, dtype=np.int32)
+        self._entry_values = np.zeros(capacity, dtype=np.float32)
+        self._alive = np.zeros(capacity, dtype=bool)
+        self._nnz = 0
+        self._dead = 0
+        self._spans: dict[int, tuple[int, int]] = {}
+
+        self._df = np.zeros(256, dtype=np.float32)
+        self._lengths = np.zeros(64, dtype=np.float32)
+        self._fingerprints: dict[str, str] = {}
+        self.counters = {"resume_upserts": 0, "jd_upserts": 0, "unchanged": 0, "rank_calls": 0, "compactions": 0}
+
+    def _columns(self, terms: dict[str, float]) -> tuple[np.ndarray, np.ndarray]:
+        for term in terms:
+            if term not in self.vocabulary:
+                self.vocabulary[term] = len(self.vocabulary)
+        self._df = _grow(self._df, len(self.vocabulary))
+        columns = np.fromiter((self.vocabulary[term] for term in terms), dtype=np.int32, count=len(terms))
+        values = np.fromiter(terms.values(), dtype=np.float32, count=len(terms))
+        return columns, values
+
+    def _unchanged(self, key: str, terms: dict[str, float]) -> bool:
+        digest = fingerprint(terms)
+        if self._fingerprints.get(key) == digest:
+            self.counters["unchanged"] += 1
+            return True
+        self._fingerprints[key] = digest
+        return False
+
+    def upsert_resume(self, thread_id: str, resume_details: dict):
+        """이력서 한 건을 추가하거나 갱신합니다. (해당 이력서의 항목과 문서 빈도만 갱신)"""
+        terms = resume_terms(resume_details or {})
+        if self._unchanged(f"resume:{thread_id}", terms):
+            return
+        columns, values = self._columns(terms)
+
+        row = self.rows.get(thread_id)
+        if row is None:
+            row = self.rows[thread_id] = len(self.rows)
+            self._lengths = _grow(self._lengths, row + 1)
+        elif row in self._spans:
+            start, end = self._spans[row]
+            self._df[self._entry_cols[start:end]] -= 1
+            self._alive[start:end] = False
+            self._dead += end - start
+
+        start, end = self._nnz, self._nnz + len(columns)
+        self._entry_rows = _grow(self._entry_rows, end)
+        self._entry_cols = _grow(self._entry_cols, end)
+        self._entry_values = _grow(self._entry_values, end)
+        self._alive = _grow(self._alive, end)
+        self._entry_rows[start:end] = row
+        self._entry_cols[start:end] = columns
+        self._entry_values[start:end] = values
+        self._alive[start:end] = True
+        self._nnz = end
+        self._spans[row] = (start, end)
+
+        self._df[columns] += 1
+        self._lengths[row] = values.sum()
+        self.counters["resume_upserts"] += 1
+
+        if self._dead > self._nnz // 2:
+            self._compact()
+
+    def _compact(self):
+        """삭제 표시된 항목을 제거합니다. (갱신이 누적되어 삭제 항목이 절반을 넘을 때만 실행)"""
+        alive = self._alive[:self._nnz]
+        rows = self._entry_rows[:self._nnz][alive]
+        order = np.argsort(rows, kind="stable")
+        self._entry_rows[:len(order)] = rows[order]
+        self._entry_cols[:len(order)] = self._entry_cols[:self._nnz][alive][order]
+        self._entry_values[:len(order)] = self._entry_values[:self._nnz][alive][order]
+        self._alive[:self._nnz] = False
+        self._alive[:len(order)] = True
+        self._nnz = len(order)
+        self._dead = 0
+
+        starts = np.searchsorted(self._entry_rows[:self._nnz], list(self._spans), side="left")
+        ends = np.searchsorted(self._entry_rows[:self._nnz], list(self._spans), side="right")
+        self._spans = {row: (int(s), int(e)) for row, s, e in zip(self._spans, starts, ends)}
+        self.counters["compactions"] += 1
+
+    def upsert_jd(self, jd_key: str, jd_details: dict):
+        """JD 한 건을 추가하거나 갱신합니다."""
+        terms = jd_terms(jd_details or {})
+        if self._unchanged(f"jd:{jd_key}", terms):
+            return
+        self.jds[jd_key] = self._columns(terms)
+        self.counters["jd_upserts"] += 1
+
+    def score_matrix(self, jd_keys: list[str] | None = None) -> np.ndarray:
+        """모든 이력서 x JD 쌍의 BM25 점수 행렬(이력서 행 수 x JD 수)을 계산합니다.
+
+        JD에 등장하는 단어 열의 항목만 사용하므로 계산량은 (JD 단어를 포함한 항목 수 x JD 수)에 비례합니다.
+        """
+        jd_keys = list(self.jds) if jd_keys is None else jd_keys
+        n = len(self.rows)
+        if not n or not jd_keys:
+            return np.zeros((n, len(jd_keys)), dtype=np.float32)
+
+        # JD 단어 열만 모아 (단어 x JD) 질의 행렬을 구성
+        query_cols = np.unique(np.concatenate([self.jds[key][0] for key in jd_keys]))
+        queries = np.zeros((len(query_cols), len(jd_keys)), dtype=np.float32)
+        for j, key in enumerate(jd_keys):
+            queries[np.searchsorted(query_cols, self.jds[key][0]), j] = 1.0
+
+        df = self._df[query_cols]
+        idf = np.log1p((n - df + 0.5) / (df + 0.5))
+        queries *= idf[:, None]
+
+        cols = self._entry_cols[:self._nnz]
+        selected = self._alive[:self._nnz] & np.isin(cols, query_cols)
+        rows = self._entry_rows[:self._nnz][selected]
+        tf = self._entry_values[:self._nnz][selected]
+
+        lengths = self._lengths[:n]
+        avg_length = max(float(lengths.mean()), 1e-6)
+        norm = self.k1 * (1 - self.b + self.b * lengths[rows] / avg_length)
+        saturated = tf * (self.k1 + 1) / (tf + norm)
+
+        weights = np.zeros((n, len(query_cols)), dtype=np.float32)
+        weights[rows, np.searchsorted(query_cols, cols[selected])] = saturated
+        return weights @ queries
+
+    def rank(self, jd_key: str, thread_ids: list[str], top_k: int | None = None) -> list[tuple[str, float]]:
+        """JD 하나에 대해 지정한 지원자들을 점수 내림차순으로 반환합니다. (top_k가 있으면 상위 K명만)"""
+        self.counters["rank_calls"] += 1
+        scores = self.score_matrix([jd_key])[:, 0]
+        rows = np.fromiter((self.rows[thread_id] for thread_id in thread_ids), dtype=np.int64, count=len(thread_ids))
+        candidate_scores = scores[rows]
+        order = np.argsort(-candidate_scores, kind="stable")
+        if top_k is not None:
+            order = order[:top_k]
+        return [(thread_ids[i], round(float(candidate_scores[i]), 4)) for i in order]
+
+    def stats(self) -> dict:
+        """어휘 크기, 저장된 이력서/JD 수, 희소 행렬 항목 수와 메모리 사용량, 갱신 카운터를 반환합니다."""
+        return {
+            **self.counters,
+            "vocabulary": len(self.vocabulary),
+            "resumes": len(self.rows),
+            "jds": len(self.jds),
+            "entries": self._nnz - self._dead,
+            "matrix_bytes": int(
+                self._entry_rows.nbytes + self._entry_cols.nbytes + self._entry_values.nbytes + self._alive.nbytes
+            ),
+        }
+
+
+candidate_ranker = CandidateRanker()
@@ -0,0 +1,126 @@
+"""thread 상태 스냅샷 캐시 모듈
+
+thread_id 별 최신 checkpoint의 결과 필드(resume_details, jd_details, applicant_skills, applicant_recruitment)를
+프로세스 메모리 LRU에 보관하여, 결과 조회(GET) 요청이 매번 Checkpointer를 읽지 않도록 합니다.
+- 해당 thread에서 진행 상황 이벤트(노드/Workflow 시작, 종료, 오류)가 발행되면 즉시 무효화합니다.
+  (이벤트는 프로세스 안에서만 전달되므로, 여러 worker 프로세스로 실행하면 다른 worker의 쓰기는 감지하지 못합니다)
+- checkpoint_id를 ETag로 사용하여, 상태가 바뀌지 않았으면 조건부 요청에 304로 응답할 수 있습니다.
+"""
+import itertools
+import threading
+from collections import OrderedDict
+
+from src.agent.modules.blob_store import blob_store
+from src.agent.registry import WorkflowRegistry
+from src.core.progress import ProgressBroker, progress_broker
+
+
+RESULT_FIELDS = ("resume_details", "jd_details", "applicant_skills", "applicant_recruitment")
+
+
+class ThreadSnapshotCache:
+    """thread_id 별 결과 스냅샷 LRU 캐시
+
+    예시:
+    ```python
+    snapshot = await snapshot_cache.get(workflows, thread_id)
+    if snapshot is not None and snapshot_cache.is_not_modified(snapshot, request.headers.get("if-none-match")):
+        ...  # 304 Not Modified
+    ```
+    """
+
+    def __init__(self, broker: ProgressBroker, max_entries: int = 1000):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        # thread 별 마지막 무효화 순번 (조회 중에 무효화된 스냅샷을 저장하지 않기 위함)
+        self._versions: OrderedDict[str, int] = OrderedDict()
+        self._seq = itertools.count(1)
+        self._lock = threading.Lock()
+        self.counters = {"hits": 0, "misses": 0, "not_modified": 0, "invalidations": 0, "evictions": 0}
+        broker.add_listener(self._on_event)
+
+    def configure(self, max_entries: int):
+        """
+        Args:
+            max_entries (int): 보관할 최대 thread 수 (초과 시 가장 오래 조회되지 않은 thread부터 제거)
+        """
+        with self._lock:
+            self.max_entries = max_entries
+            self._trim()
+
+    def _on_event(self, event: dict):
+        if event.get("type") in ("start", "end", "error"):
+            self.invalidate(event["thread_id"])
+
+    def invalidate(self, thread_id: str):
+        """thread의 스냅샷을 제거하고, 진행 중인 조회 결과가 저장되지 않도록 순번을 올립니다."""
+        with self._lock:
+            if self._entries.pop(thread_id, None) is not None:
+                self.counters["invalidations"] += 1
+            self._versions[thread_id] = next(self._seq)
+            self._versions.move_to_end(thread_id)
+            while len(self._versions) > self.max_entries * 4:
+                self._versions.popitem(last=False)
+
+    def _trim(self):
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.counters["evictions"] += 1
+
+    async def get(self, workflows: WorkflowRegistry, thread_id: str) -> dict | None:
+        """thread의 최신 결과 스냅샷을 반환합니다. (checkpoint가 없으면 None)
+
+        Returns:
+            dict | None: {"thread_id", "checkpoint_id", "etag", "values": {결과 필드: 값}}
+        """
+        with self._lock:
+            snapshot = self._entries.get(thread_id)
+            if snapshot is not None:
+                self._entries.move_to_end(thread_id)
+                self.counters["hits"] += 1
+                return snapshot
+            self.counters["misses"] += 1
+            version = self._versions.get(thread_id, 0)
+
+        # 모든 Workflow가 같은 AgentState와 Checkpointer를 사용하므로 어느 Workflow로 읽어도 같은 상태
+        state = await workflows.get("AnalyzeFitWorkflow").aget_state({"configurable": {"thread_id": thread_id}})
+        checkpoint_id = (state.config or {}).get("configurable", {}).get("checkpoint_id")
+        if checkpoint_id is None:
+            return None
+
+        values = {field: state.values.get(field) for field in RESULT_FIELDS}
+        snapshot = {
+            "thread_id": thread_id,
+            "checkpoint_id": checkpoint_id,
+            "etag": f'"{checkpoint_id}"',
+            "values": await blob_store.materialize(values),
+        }
+        with self._lock:
+            if self._versions.get(thread_id, 0) == version:
+                self._entries[thread_id] = snapshot
+                self._trim()
+        return snapshot
+
+    def is_not_modified(self, snapshot: dict, if_none_match: str | None) -> bool:
+        """If-None-Match 헤더가 스냅샷의 ETag와 일치하는지 확인합니다. (약한 비교, "*" 지원)"""
+        if not if_none_match:
+            return False
+        candidates = [tag.strip() for tag in if_none_match.split(",")]
+        matched = "*" in candidates or snapshot["etag"] in (tag.removeprefix("W/") for tag in candidates)
+        if matched:
+            with self._lock:
+                self.counters["not_modified"] += 1
+        return matched
+
+    def stats(self) -> dict:
+        """적중/실패/304/무효화 카운터와 보관 중인 thread 수를 반환합니다."""
+        with self._lock:
+            lookups = self.counters["hits"] + self.counters["misses"]
+            return {
+                **self.counters,
+                "hit_ratio": round(self.counters["hits"] / lookups, 4) if lookups else 0.0,
+                "entries": len(self._entries),
+            }
+
+
+snapshot_cache = ThreadSnapshotCache(progress_broker)
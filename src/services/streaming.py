@@ -0,0 +1,131 @@
+"""Workflow 스트리밍 실행 모듈
+
+Workflow를 stream_mode="messages"로 실행하여 지정한 노드의 LLM 토큰을 생성되는 즉시 전달합니다.
+실행은 별도 task에서 진행되므로 클라이언트 연결이 끊겨도 끝까지 실행되어 최종 결과가 checkpoint에 저장됩니다.
+"""
+import asyncio
+import threading
+import time
+from typing import AsyncIterator
+
+from src.agent.registry import WorkflowRegistry
+from src.agent.modules.blob_store import blob_store, checkpoint_meter
+from src.core.progress import progress_broker
+from src.core.stats import percentile
+
+
+# 클라이언트 연결이 끊긴 뒤에도 실행 중인 task가 GC되지 않도록 참조를 보관
+_running_tasks: set[asyncio.Task] = set()
+
+
+class StreamLatencyTracker:
+    """스트리밍 엔드포인트 별 첫 토큰 지연 시간과 전체 지연 시간 집계기"""
+
+    def __init__(self, window: int = 1000):
+        self.window = window
+        self._lock = threading.Lock()
+        self._samples: dict[str, list[tuple[float | None, float]]] = {}
+
+    def record(self, label: str, first_token_ms: float | None, total_ms: float):
+        """한 번의 스트리밍 결과를 기록합니다. (label 별 최근 window개만 보관)"""
+        with self._lock:
+            samples = self._samples.setdefault(label, [])
+            samples.append((first_token_ms, total_ms))
+            del samples[:-self.window]
+
+    def stats(self) -> dict:
+        """label 별 첫 토큰/전체 지연 시간의 p50, p95를 반환합니다."""
+        with self._lock:
+            snapshot = {label: list(samples) for label, samples in self._samples.items()}
+        result = {}
+        for label, samples in snapshot.items():
+            first = [f for f, _ in samples if f is not None]
+            total = [t for _, t in samples]
+            result[label] = {
+                "runs": len(samples),
+                "first_token_ms_p50": percentile(first, 0.5),
+                "first_token_ms_p95": percentile(first, 0.95),
+                "total_ms_p50": percentile(total, 0.5),
+                "total_ms_p95": percentile(total, 0.95),
+            }
+        return result
+
+
+stream_latency = StreamLatencyTracker()
+
+
+async def stream_workflow(
+    workflows: WorkflowRegistry,
+    name: str,
+    initial_state: dict | None,
+    config: dict,
+    node: str,
+    output_key: str,
+) -> AsyncIterator[tuple[str, dict]]:
+    """Workflow를 실행하며 (event, data) 튜플을 생성합니다.
+
+    - ("token", {"text": ...}): node에서 생성된 LLM 토큰
+    - ("done", {output_key: ..., "first_token_ms": ..., "total_ms": ...}): checkpoint에 저장된 최종 결과
+    - ("error", {"detail": ...}): 실행 중 오류
+
+    Args:
+        workflows (WorkflowRegistry): 컴파일된 Workflow 레지스트리
+        name (str): 실행할 Workflow 이름 (지연 시간 집계 단위로도 사용)
+        initial_state (dict | None): Workflow 입력 (None이면 checkpoint에 저장된 현재 상태로 실행)
+        config (dict): thread_id가 포함된 실행 설정
+        node (str): 토큰을 전달할 노드 이름 (예: "evaluate_resume")
+        output_key (str): 최종 결과로 반환할 상태 키 (예: "applicant_skills")
+    """
+    work = workflows.get(name)
+    thread_id = config["configurable"]["thread_id"]
+    queue: asyncio.Queue = asyncio.Queue()
+    # 클라이언트 연결이 끊기면 실행은 계속되지만, 아무도 읽지 않는 queue에 토큰을 쌓지 않음
+    consumer = {"attached": True}
+    started = time.perf_counter()
+
+    def emit(event: str, data: dict):
+        if consumer["attached"]:
+            queue.put_nowait((event, data))
+
+    async def run():
+        nonlocal initial_state
+        first_token_ms = None
+        try:
+            if initial_state is None:
+                initial_state = (await work.aget_state(config)).values
+            async with progress_broker.track(thread_id, name, kind="workflow"), checkpoint_meter.run(name):
+                async for chunk, metadata in work.astream(initial_state, config=config, stream_mode="messages"):
+                    if metadata.get("langgraph_node") != node or not chunk.content:
+                        continue
+                    if first_token_ms is None:
+                        first_token_ms = (time.perf_counter() - started) * 1000
+                    emit("token", {"text": chunk.content})
+
+            final_state = await work.aget_state(config)
+            total_ms = (time.perf_counter() - started) * 1000
+            stream_latency.record(name, first_token_ms, total_ms)
+            if consumer["attached"]:
+                emit("done", {
+                    output_key: await blob_store.resolve(final_state.values.get(output_key, "분석 결과 없음")),
+                    "first_token_ms": round(first_token_ms, 1) if first_token_ms is not None else None,
+                    "total_ms": round(total_ms, 1),
+                })
+        except Exception as exc:
+            print(f"Streaming workflow failed: {exc!r}")
+            emit("error", {"detail": str(exc)})
+
+    task = asyncio.create_task(run())
+    _running_tasks.add(task)
+    task.add_done_callback(_running_tasks.discard)
+
+    try:
+        while True:
+            event, data = await queue.get()
+            yield event, data
+            if event != "token":
+                break
+    finally:
+        consumer["attached"] = False
+        # 이미 쌓여 있던 토큰도 버려 메모리를 즉시 반환
+        while not queue.empty():
+            queue.get_nowait()